@@ -0,0 +1,42 @@
+import timeit
+
+import graphinate
+from graphinate.builders import NetworkxBuilder
+
+
+def large_model(count: int) -> graphinate.GraphModel:
+    """A model of `count` nodes, each with a child node, and `count` edges between the nodes."""
+    graph_model = graphinate.model(name='Large')
+
+    @graph_model.node(key='id', value='name')
+    def parent():
+        for i in range(count // 2):
+            yield {'id': i, 'name': f"parent {i}"}
+
+    @graph_model.node(parent_type='parent', unique=False)
+    def child(parent_id):
+        yield parent_id
+
+    @graph_model.edge()
+    def edge():
+        for i in range(count):
+            yield {'source': i % (count // 2), 'target': (i * 7 + 1) % (count // 2)}
+
+    return graph_model
+
+
+def run_benchmark():
+    count = 200_000
+    number = 3
+    graph_model = large_model(count)
+
+    for timestamp in (graphinate.Timestamp.ELEMENT, graphinate.Timestamp.NONE):
+        builder = NetworkxBuilder(graph_model)
+        t_build = timeit.timeit(lambda: builder.build(timestamp=timestamp), number=number)  # noqa: B023
+        graph = builder.build(timestamp=timestamp)
+        print(f"Build {graph.number_of_nodes()} nodes and {graph.number_of_edges()} edges "
+              f"(timestamp={timestamp.name}): {t_build / number:.4f} seconds (average of {number} runs)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
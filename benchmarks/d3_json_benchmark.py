@@ -0,0 +1,34 @@
+import timeit
+
+import mappingtools
+import networkx as nx
+
+from graphinate.builders.d3 import D3Builder, _convert, _to_strict
+
+
+def grid_graph(size: int) -> nx.Graph:
+    """A grid graph with typical Graphinate node and edge attributes."""
+    graph = nx.grid_2d_graph(size, size)
+    for node, data in graph.nodes(data=True):
+        data.update(type='node', label=str(node), value=[node], lineage=node)
+    for u, v, data in graph.edges(data=True):
+        data.update(type='edge', label=f"{u} ⟹ {v}", value=[(u, v)], weight=1.0)
+    return graph
+
+
+def run_benchmark():
+    number = 3
+
+    for size in (10, 100, 200):
+        d3_graph = D3Builder.from_networkx(grid_graph(size))
+        print(f"Benchmarking JSON values of a {size}x{size} grid graph...")
+
+        strictify = mappingtools.transformers.strictify
+        t_strictify = timeit.timeit(lambda: strictify(d3_graph, value_handler=_convert), number=number)  # noqa: B023
+        t_dispatch = timeit.timeit(lambda: _to_strict(d3_graph), number=number)  # noqa: B023
+
+        print(f"  strictify: {t_strictify:.4f} seconds, type dispatch: {t_dispatch:.4f} seconds ({number} runs)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,31 @@
+import timeit
+
+from graphinate import IdCodec, converters
+
+
+def lineage_ids(depth: int, count: int) -> list[tuple]:
+    """Typical node IDs, i.e., lineage tuples of string and integer keys."""
+    return [tuple(f"type_{level}_{i}" if level % 2 else i * level for level in range(depth)) for i in range(count)]
+
+
+def run_benchmark():
+    count = 10_000
+    number = 10
+
+    for depth in (1, 3, 10):
+        ids = lineage_ids(depth, count)
+        print(f"Benchmarking {count} IDs with lineage depth {depth}...")
+
+        for codec in IdCodec:
+            encoded_ids = [converters.encode(i, codec=codec) for i in ids]
+            average_length = sum(len(e) for e in encoded_ids) / count
+
+            t_encode = timeit.timeit(lambda: [converters.encode(i, codec=codec) for i in ids], number=number)  # noqa: B023
+            t_decode = timeit.timeit(lambda: [converters.decode(e) for e in encoded_ids], number=number)  # noqa: B023
+
+            print(f"  {codec.name:<6} encode: {t_encode:.4f} seconds, decode: {t_decode:.4f} seconds "
+                  f"({number} runs), average length: {average_length:.1f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
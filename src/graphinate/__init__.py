@@ -1,15 +1,19 @@
-from . import builders, renderers
+from . import builders, cache, renderers
 from .builders import build
-from .enums import GraphType, Multiplicity
+from .enums import Eviction, GraphType, IdCodec, Multiplicity, Timestamp
 from .modeling import GraphModel, model
 from .renderers import graphql, matplotlib, mermaid
 
 __all__ = (
+    'Eviction',
     'GraphModel',
     'GraphType',
+    'IdCodec',
     'Multiplicity',
+    'Timestamp',
     'build',
     'builders',
+    'cache',
     'graphql',
     'matplotlib',
     'mermaid',
@@ -0,0 +1,147 @@
+"""A compact binary serialization of node and edge IDs.
+
+IDs are tuples (possibly nested) of str, int, float, bool, bytes and None components. Each component is written as
+a one byte tag, followed by a length prefix and the data for variable sized components. Lengths are unsigned LEB128
+varints (i.e., a single byte for lengths below 128):
+
+| **Tag** | **Component** | **Data**                                        |
+|---------|---------------|-------------------------------------------------|
+| `(`     | tuple         | number of items, followed by the items          |
+| `s`     | str           | length, followed by the encoded characters      |
+| `y`     | bytes         | length, followed by the bytes                   |
+| `i`     | int           | length, followed by the signed big-endian bytes |
+| `f`     | float         | IEEE 754 double (8 bytes)                       |
+| `T`/`F` | bool          | -                                               |
+| `N`     | None          | -                                               |
+
+Packed IDs start with a zero byte, which never starts a `repr()` string, so both formats can be told apart.
+"""
+import struct
+from typing import Any
+
+MAGIC = b'\x00'
+
+_FLOAT = struct.Struct('>d')
+
+# Precomputed single byte lengths
+_LENGTHS = tuple(bytes((n,)) for n in range(128))
+
+
+def _length(n: int) -> bytes:
+    if n < 128:
+        return _LENGTHS[n]
+
+    varint = bytearray()
+    while n >= 128:
+        varint.append((n & 0x7F) | 0x80)
+        n >>= 7
+    varint.append(n)
+    return bytes(varint)
+
+
+def _unpack_length(data: bytes, offset: int) -> tuple[int, int]:
+    n = data[offset]
+    if n < 128:
+        return n, offset + 1
+
+    n &= 0x7F
+    shift = 7
+    while True:
+        offset += 1
+        byte = data[offset]
+        n |= (byte & 0x7F) << shift
+        if byte < 128:
+            return n, offset + 1
+        shift += 7
+
+
+def _pack(value: Any, parts: list[bytes], encoding: str):
+    # bool is checked before int, as it is a subclass of int
+    if value is True:
+        parts.append(b'T')
+    elif value is False:
+        parts.append(b'F')
+    elif value is None:
+        parts.append(b'N')
+    elif isinstance(value, str):
+        data = value.encode(encoding)
+        parts.append(b's' + _length(len(data)))
+        parts.append(data)
+    elif isinstance(value, int):
+        data = value.to_bytes((value.bit_length() + 8) // 8, 'big', signed=True)
+        parts.append(b'i' + _length(len(data)))
+        parts.append(data)
+    elif isinstance(value, float):
+        parts.append(b'f' + _FLOAT.pack(value))
+    elif isinstance(value, tuple):
+        parts.append(b'(' + _length(len(value)))
+        for item in value:
+            _pack(item, parts, encoding)
+    elif isinstance(value, bytes):
+        parts.append(b'y' + _length(len(value)))
+        parts.append(value)
+    else:
+        raise TypeError(f"Unsupported ID component type: {type(value).__name__}")
+
+
+def pack(value: Any, encoding: str = 'utf-8') -> bytes:
+    """Serialize an ID.
+
+    Raises:
+        TypeError: if the ID has a component of an unsupported type.
+    """
+    parts = [MAGIC]
+    _pack(value, parts, encoding)
+    return b''.join(parts)
+
+
+def _unpack(data: bytes, offset: int, encoding: str) -> tuple[Any, int]:
+    tag = data[offset:offset + 1]
+    offset += 1
+    match tag:
+        case b's':
+            length, offset = _unpack_length(data, offset)
+            return data[offset:offset + length].decode(encoding), offset + length
+        case b'i':
+            length, offset = _unpack_length(data, offset)
+            return int.from_bytes(data[offset:offset + length], 'big', signed=True), offset + length
+        case b'(':
+            length, offset = _unpack_length(data, offset)
+            items = []
+            for _ in range(length):
+                item, offset = _unpack(data, offset, encoding)
+                items.append(item)
+            return tuple(items), offset
+        case b'f':
+            return _FLOAT.unpack_from(data, offset)[0], offset + 8
+        case b'T':
+            return True, offset
+        case b'F':
+            return False, offset
+        case b'N':
+            return None, offset
+        case b'y':
+            length, offset = _unpack_length(data, offset)
+            return data[offset:offset + length], offset + length
+        case _:
+            raise ValueError(f"Invalid ID component tag: {tag!r}")
+
+
+def unpack(data: bytes, encoding: str = 'utf-8') -> Any:
+    """Deserialize an ID serialized by `pack`.
+
+    Raises:
+        ValueError: if the data is not a valid serialized ID.
+    """
+    if not data.startswith(MAGIC):
+        raise ValueError("Invalid ID: missing binary ID prefix")
+
+    try:
+        value, offset = _unpack(data, 1, encoding)
+    except (struct.error, IndexError, UnicodeDecodeError, RecursionError) as e:
+        raise ValueError("Invalid ID: malformed binary ID") from e
+
+    if offset != len(data):
+        raise ValueError("Invalid ID: malformed binary ID")
+
+    return value
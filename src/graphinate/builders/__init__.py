@@ -15,20 +15,27 @@ Main Classes:
     - `D3Builder`    : Builder class transforming graphs into D3-compatible structures.
     - `MermaidBuilder`: Supports MermaidJS diagram generation.
     - `GraphQLBuilder`: Constructs GraphQL schema representations of graphs.
+    - `StreamBuilder`: Yields graph deltas without materializing a graph.
+    - `CompactBuilder`: Builds a memory efficient, array-backed graph, convertible to NetworkX on demand.
+    - `ArrowBuilder` : Builds columnar (Arrow) tables of nodes and edges, writable as Parquet or Arrow IPC files.
 """
 
-__all__ = ['Builder', 'D3Builder', 'GraphQLBuilder', 'MermaidBuilder', 'NetworkxBuilder', 'build']
+__all__ = ['ArrowBuilder', 'Builder', 'CompactBuilder', 'D3Builder', 'GraphQLBuilder', 'MermaidBuilder',
+           'NetworkxBuilder', 'StreamBuilder', 'build']
 
 from collections.abc import Mapping
 from typing import Any
 
 from ..enums import GraphType
 from ..modeling import GraphModel
+from .arrow import ArrowBuilder
 from .builder import Builder
+from .compact import CompactBuilder
 from .d3 import D3Builder
 from .graphql import GraphQLBuilder
 from .mermaid import MermaidBuilder
 from .networkx import NetworkxBuilder
+from .stream import StreamBuilder
 
 
 def build(builder_cls: type[Builder],
@@ -0,0 +1,104 @@
+"""Sampled approximations of expensive graph measures.
+
+Each approximation runs breadth-first searches (or clustering computations) from a sample of `sample_size` nodes,
+instead of all the nodes of the graph. Samples are drawn with a fixed seed, so approximations are reproducible.
+Sampling all the nodes gives the exact (unweighted) measure, except for `diameter`, which is always a lower bound.
+
+The functions are defined at module level, so they can be pickled to the worker processes computing measures.
+"""
+import math
+import random
+from collections.abc import Hashable
+from operator import itemgetter
+
+import networkx as nx
+
+SEED = 0
+
+
+def _sample(graph: nx.Graph, sample_size: int, seed: int) -> list[Hashable]:
+    if sample_size < 1:
+        raise ValueError(f"Invalid sample size: {sample_size}. It must be positive.")
+
+    nodes = list(graph)
+    if sample_size >= len(nodes):
+        return nodes
+
+    return random.Random(seed).sample(nodes, sample_size)
+
+
+def _connection_error(graph: nx.Graph) -> nx.NetworkXError:
+    return nx.NetworkXError('Graph is not strongly connected.' if graph.is_directed() else 'Graph is not connected.')
+
+
+def diameter(graph: nx.Graph, sample_size: int, seed: int = SEED) -> float:
+    """A lower bound of the diameter, by double sweeps.
+
+    The bound is the maximal eccentricity of the sampled nodes and of the farthest node from each of them.
+
+    Returns:
+        math.inf if the graph is not (strongly) connected.
+    """
+    if graph.number_of_nodes() == 0:
+        raise nx.NetworkXPointlessConcept('Cannot compute eccentricity of a null graph.')
+
+    bound = 0
+    for node in _sample(graph, sample_size, seed):
+        source = node
+        for _ in range(2):
+            lengths = nx.single_source_shortest_path_length(graph, source)
+            if len(lengths) < len(graph):
+                return math.inf
+
+            source, eccentricity = max(lengths.items(), key=itemgetter(1))
+            bound = max(bound, eccentricity)
+
+    return bound
+
+
+def average_shortest_path_length(graph: nx.Graph, sample_size: int, seed: int = SEED) -> float:
+    """The average length of the shortest paths from the sampled nodes to all the other nodes.
+
+    Raises:
+        NetworkXError: if the graph is not (strongly) connected.
+    """
+    n = graph.number_of_nodes()
+    if n == 0:
+        raise nx.NetworkXPointlessConcept(
+            'the null graph has no paths, thus there is no average shortest path length')
+    if n == 1:
+        return 0
+
+    sources = _sample(graph, sample_size, seed)
+    total = 0
+    for source in sources:
+        lengths = nx.single_source_shortest_path_length(graph, source)
+        if len(lengths) < n:
+            raise _connection_error(graph)
+        total += sum(lengths.values())
+
+    return total / (len(sources) * (n - 1))
+
+
+def average_clustering(graph: nx.Graph, sample_size: int, seed: int = SEED) -> float:
+    """The average clustering coefficient of the sampled nodes."""
+    nodes = _sample(graph, sample_size, seed)
+    return sum(nx.clustering(graph, nodes).values()) / len(nodes)
+
+
+def global_efficiency(graph: nx.Graph, sample_size: int, seed: int = SEED) -> float:
+    """The average inverse distance from the sampled nodes to all the other nodes."""
+    if graph.is_directed():
+        raise nx.NetworkXNotImplemented('not implemented for directed type')
+
+    n = graph.number_of_nodes()
+    if n < 2:
+        return 0
+
+    sources = _sample(graph, sample_size, seed)
+    total = sum(1 / d
+                for source in sources
+                for d in nx.single_source_shortest_path_length(graph, source).values()
+                if d > 0)
+
+    return total / (len(sources) * (n - 1))
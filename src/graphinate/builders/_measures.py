@@ -0,0 +1,290 @@
+import asyncio
+import functools
+import inspect
+import multiprocessing
+import multiprocessing.pool
+import threading
+from collections import Counter
+from collections.abc import Callable, Hashable
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor
+from typing import Any
+
+import networkx as nx
+
+
+def in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def then(value: Any, function: Callable[[Any], Any]) -> Any:
+    """Apply a function to a value, or to the result of an awaitable value once it is awaited."""
+    if not inspect.isawaitable(value):
+        return function(value)
+
+    async def awaited():
+        return function(await value)
+
+    return awaited()
+
+
+# seconds between checks for termination requests of running tasks
+_POLL_INTERVAL = 0.1
+
+
+def _default_context() -> multiprocessing.context.BaseContext:
+    # a fork server starts workers quickly, without reimporting modules (unlike 'spawn') or forking threads ('fork')
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+
+class TerminableFuture(Future):
+    """A Future of a task running in its own process, which can be terminated."""
+
+    def __init__(self):
+        super().__init__()
+        self.terminated = False
+
+    def terminate(self) -> bool:
+        """Cancel the task, terminating its process if it is already running.
+
+        Returns:
+            False if the task is already done, True otherwise.
+        """
+        if self.cancel():
+            return True
+
+        if self.done():
+            return False
+
+        self.terminated = True
+        return True
+
+
+class MeasureProcessExecutor(Executor):
+    """Runs each task in a worker process of its own, so that a running task can be terminated
+    (see `TerminableFuture`).
+
+    Worker processes are reused by later tasks once their task completes (or fails), and a worker is replaced only
+    when its task is terminated, so only concurrent tasks start new processes. It suits CPU-bound computations
+    (e.g., graph measures) that should neither hold the GIL of the calling process nor keep running after nobody
+    waits for them.
+
+    Args:
+        mp_context: the multiprocessing context starting the processes. Defaults to None
+                    (i.e., 'forkserver' where available, 'spawn' otherwise).
+    """
+
+    def __init__(self, mp_context: multiprocessing.context.BaseContext | None = None):
+        self._context = mp_context or _default_context()
+        self._futures: set[TerminableFuture] = set()
+        self._idle: list[multiprocessing.pool.Pool] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> TerminableFuture:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+
+            future = TerminableFuture()
+            self._futures.add(future)
+
+        future.add_done_callback(self._futures.discard)
+        threading.Thread(target=self._run, args=(future, fn, args, kwargs), name='graphinate-measures',
+                         daemon=True).start()
+        return future
+
+    def _acquire(self) -> multiprocessing.pool.Pool:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+
+        # a single worker pool, as its worker does not import the modules of this package, and it can be terminated
+        return self._context.Pool(1)
+
+    def _release(self, pool: multiprocessing.pool.Pool | None, is_idle: bool):
+        """Keep the pool of a completed task for later tasks, or terminate it (i.e., its task was terminated)."""
+        if pool is None:
+            return
+
+        with self._lock:
+            if is_idle and not self._shutdown:
+                self._idle.append(pool)
+                return
+
+        pool.terminate()
+
+    def _run(self, future: TerminableFuture, fn: Callable, args: tuple, kwargs: dict):
+        if not future.set_running_or_notify_cancel():
+            return
+
+        pool = None
+        is_idle = False
+        try:
+            pool = self._acquire()
+            result = pool.apply_async(fn, args, kwargs)
+            while not (future.terminated or result.ready()):
+                result.wait(_POLL_INTERVAL)
+
+            # once the task completed, the worker can run another one, even if the task raised
+            is_idle = not future.terminated
+            value = result.get() if is_idle else None
+        except BaseException as e:
+            # released before the future is done, so that its callbacks observe the pool in its final state
+            self._release(pool, is_idle)
+            future.set_exception(e)
+        else:
+            self._release(pool, is_idle)
+            if future.terminated:
+                future.set_exception(CancelledError())
+            else:
+                future.set_result(value)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+            futures = list(self._futures)
+            idle, self._idle = self._idle, []
+
+        for pool in idle:
+            pool.terminate()
+
+        for future in futures:
+            if cancel_futures:
+                future.terminate()
+            elif wait:
+                future.exception()  # wait for completion
+
+
+@functools.cache
+def default_measure_executor() -> Executor:
+    return MeasureProcessExecutor()
+
+
+class MeasureCache:
+    """A thread-safe cache of the measures of a graph.
+
+    Each measure is computed at most once. Concurrent requests for a measure being computed wait for its result.
+    Failed computations are not cached.
+
+    Within an event loop (e.g., an ASGI GraphQL server), measures are computed by an executor, so they do not block
+    the loop, and waiting for them is limited by a timeout. A computation that no request waits for anymore is
+    cancelled. With the default executor, each computation runs in a worker process of its own, which is terminated
+    (and replaced by a new worker for later computations) when the computation is cancelled.
+    With process based executors, the measure functions must be picklable, and a copy of the graph structure and
+    edge weights is sent to the worker processes.
+
+    Args:
+        graph: the graph to measure.
+        executor: the executor computing measures within an event loop. Defaults to None
+                  (i.e., a MeasureProcessExecutor).
+        timeout: maximal number of seconds to wait for a measure within an event loop.
+                 Defaults to None (i.e., no limit).
+    """
+
+    def __init__(self, graph: nx.Graph | None, executor: Executor | None = None, timeout: float | None = None):
+        self.graph = graph
+        self.executor = executor
+        self.timeout = timeout
+        self._futures: dict[Hashable, Future] = {}
+        self._waiters: Counter[Future] = Counter()
+        self._structure: nx.Graph | None = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        future = self._futures.get(key)
+        return future is not None and future.done() and not future.cancelled() and future.exception() is None
+
+    def _structural_graph(self) -> nx.Graph:
+        """A copy of the graph without attributes (except for edge weights), for worker processes."""
+        if self._structure is None:
+            graph = self.graph
+            structure = graph.__class__()
+            structure.add_nodes_from(graph)
+            structure.add_edges_from((u, v, {} if w is None else {'weight': w})
+                                     for u, v, w in graph.edges(data='weight'))
+            self._structure = structure
+        return self._structure
+
+    def _submit(self, function: Callable[[nx.Graph], Any]) -> Future:
+        executor = self.executor or default_measure_executor()
+        is_process_based = isinstance(executor, (ProcessPoolExecutor, MeasureProcessExecutor))
+        return executor.submit(function, self._structural_graph() if is_process_based else self.graph)
+
+    def _discard_failed(self, key: Hashable, future: Future):
+        if future.cancelled() or future.exception() is not None:
+            with self._lock:
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+
+    def _future(self, key: Hashable, function: Callable[[nx.Graph], Any], submit: bool) -> tuple[Future, bool]:
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                return future, False
+
+            if submit:
+                future = self._submit(function)
+            else:
+                future = Future()
+                future.set_running_or_notify_cancel()
+            self._futures[key] = future
+
+        future.add_done_callback(functools.partial(self._discard_failed, key))
+        return future, True
+
+    def get(self, key: Hashable, function: Callable[[nx.Graph], Any]) -> Any:
+        """Return a measure of the graph, computing it in the calling thread if it is not cached."""
+        future, is_owner = self._future(key, function, submit=False)
+        if is_owner:
+            try:
+                future.set_result(function(self.graph))
+            except Exception as e:
+                future.set_exception(e)
+
+        return future.result()
+
+    async def aget(self, key: Hashable, function: Callable[[nx.Graph], Any]) -> Any:
+        """Return a measure of the graph, computing it in the executor if it is not cached.
+
+        Raises:
+            TimeoutError: if the measure is not available within the timeout.
+        """
+        future, _ = self._future(key, function, submit=True)
+        with self._lock:
+            self._waiters[future] += 1
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), self.timeout)
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(f"Measure {key} was not computed within {self.timeout} seconds") from e
+        finally:
+            with self._lock:
+                self._waiters[future] -= 1
+                is_abandoned = not self._waiters[future]
+                if is_abandoned:
+                    del self._waiters[future]
+
+            # outside the lock, as cancelling runs the done callbacks, which acquire it
+            if is_abandoned and not future.done():
+                getattr(future, 'terminate', future.cancel)()
+
+    def resolve(self, key: Hashable, function: Callable[[nx.Graph], Any], inline: bool = False) -> Any:
+        """Return a measure of the graph, or an awaitable of it if called within an event loop.
+
+        Args:
+            key: the key of the measure in the cache.
+            function: computes the measure of a graph.
+            inline: compute the measure in the calling thread even within an event loop (i.e., for cheap measures).
+                    Defaults to False.
+        """
+        return self.aget(key, function) if in_event_loop() and not inline else self.get(key, function)
+
+    def clear(self):
+        with self._lock:
+            self._futures = {}
+            self._structure = None
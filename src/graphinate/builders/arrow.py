@@ -0,0 +1,146 @@
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+import networkx as nx
+
+from .. import color
+from ..enums import GraphType
+from ..modeling import GraphModel
+from .networkx import NetworkxBuilder
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+else:
+    _TIMESTAMP = pa.timestamp('us', tz='UTC')
+
+
+def _to_json(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+def _column(elements: Iterable[dict], attribute: str, converter: Callable[[Any], Any] | None = None) -> list:
+    if converter is None:
+        return [data.get(attribute) for data in elements]
+    return [None if (v := data.get(attribute)) is None else converter(v) for data in elements]
+
+
+@dataclass(frozen=True)
+class GraphTables:
+    """Columnar tables of the nodes and the edges of a graph.
+
+    Attributes:
+        nodes: a table with id, type, label, magnitude, lineage, value, color, created and updated columns.
+        edges: a table with source, target, (key, for multigraphs), type, label, weight, value, color, created and
+               updated columns.
+    """
+
+    nodes: 'pa.Table'
+    edges: 'pa.Table'
+
+    def write(self, directory: str | Path, file_format: Literal['parquet', 'arrow'] = 'parquet') -> tuple[Path, Path]:
+        """Write the tables to `nodes.<file_format>` and `edges.<file_format>` files in a directory.
+
+        Args:
+            directory: the directory of the files. Created if it does not exist.
+            file_format: 'parquet' or 'arrow' (i.e., Arrow IPC files). Defaults to 'parquet'.
+
+        Returns:
+            The paths of the nodes and the edges files.
+        """
+        if file_format not in ('parquet', 'arrow'):
+            raise ValueError(f"Invalid file format: {file_format}")
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = directory / f"nodes.{file_format}", directory / f"edges.{file_format}"
+        for table, path in zip((self.nodes, self.edges), paths, strict=True):
+            if file_format == 'parquet':
+                pq.write_table(table, path)
+            else:
+                with pa.OSFile(str(path), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+        return paths
+
+
+class ArrowBuilder(NetworkxBuilder):
+    """Build Arrow tables of the nodes and the edges of a graph (requires pyarrow)."""
+
+    def __init__(self, model: GraphModel, graph_type: GraphType = GraphType.Graph):
+        if not HAS_PYARROW:
+            raise ImportError("ArrowBuilder requires pyarrow. Install it with: pip install graphinate[arrow]")
+
+        super().__init__(model, graph_type)
+
+    def build(self, **kwargs: Any) -> GraphTables:
+        """
+        Args:
+            **kwargs: additional inputs to the node and edge generator functions
+
+        Returns:
+            GraphTables
+        """
+        super().build(**kwargs)
+        color.convert_colors_to_hex(self._graph)
+        return self.from_networkx(self._graph)
+
+    @staticmethod
+    def from_networkx(nx_graph: nx.Graph) -> GraphTables:
+        """Convert a graph built by `NetworkxBuilder` to tables.
+
+        Node IDs (and edge endpoints) are the string representations of the node lineage tuples. Values are
+        JSON encoded, and types are dictionary encoded.
+        """
+        node_ids, nodes = zip(*nx_graph.nodes(data=True), strict=True) if nx_graph else ((), ())
+        nodes_table = pa.table({
+            'id': pa.array([str(n) for n in node_ids], pa.string()),
+            **ArrowBuilder._element_columns(nodes),
+            'magnitude': pa.array(_column(nodes, 'magnitude'), pa.int64()).fill_null(1),
+            'lineage': pa.array(_column(nodes, 'lineage', str), pa.string()),
+            **ArrowBuilder._timestamp_columns(nodes),
+        })
+
+        if nx_graph.is_multigraph():
+            sources, targets, keys, edges = zip(*nx_graph.edges(keys=True, data=True), strict=True) \
+                if nx_graph.number_of_edges() else ((), (), (), ())
+            key_column = {'key': pa.array([str(k) for k in keys], pa.string())}
+        else:
+            sources, targets, edges = zip(*nx_graph.edges(data=True), strict=True) \
+                if nx_graph.number_of_edges() else ((), (), ())
+            key_column = {}
+
+        edges_table = pa.table({
+            'source': pa.array([str(n) for n in sources], pa.string()),
+            'target': pa.array([str(n) for n in targets], pa.string()),
+            **key_column,
+            **ArrowBuilder._element_columns(edges),
+            'weight': pa.array(_column(edges, 'weight'), pa.float64()),
+            **ArrowBuilder._timestamp_columns(edges),
+        })
+
+        return GraphTables(nodes=nodes_table, edges=edges_table)
+
+    @staticmethod
+    def _element_columns(elements: tuple[dict, ...]) -> dict[str, 'pa.Array']:
+        return {
+            'type': pa.array(_column(elements, 'type'), pa.string()).dictionary_encode(),
+            'label': pa.array(_column(elements, 'label', str), pa.string()),
+            'value': pa.array(_column(elements, 'value', _to_json), pa.string()),
+            'color': pa.array(_column(elements, 'color', str), pa.string()),
+        }
+
+    @staticmethod
+    def _timestamp_columns(elements: tuple[dict, ...]) -> dict[str, 'pa.Array']:
+        columns = {}
+        for name in ('created', 'updated'):
+            # datetimes, or integers with Timestamp.COUNTER
+            column = pa.array(_column(elements, name))
+            columns[name] = column.cast(_TIMESTAMP) if pa.types.is_null(column.type) else column
+        return columns
@@ -56,3 +56,16 @@ class Builder(ABC):
             **kwargs: Any additional parameters for the build process.
         """
         self._cached_build_kwargs = MappingProxyType(kwargs)
+
+    def _default_node_attributes(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Return the default node attributes, updated by (and popped from) the `default_node_attributes` kwarg."""
+        default_node_attributes = dict(**self.default_node_attributes)
+        if 'default_node_attributes' in kwargs:
+            default_node_attributes.update(kwargs.pop('default_node_attributes') or {})
+
+        return default_node_attributes
+
+    def _rectify_model(self, node_attributes: Mapping):
+        default_type = node_attributes.get('type')
+        default_label = node_attributes.get('label')
+        self.model.rectify(_type=default_type, parent_type=default_type, label=default_label)
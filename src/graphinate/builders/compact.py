@@ -0,0 +1,454 @@
+from array import array
+from collections import Counter
+from collections.abc import Hashable, Iterator
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+import networkx as nx
+from mappingtools.transformers import simplify
+
+from .. import color
+from ..converters import edge_label_converter, node_label_converter
+from ..enums import GraphType, Multiplicity, Timestamp
+from ..modeling import GraphModel
+from ..tools import UTC, utcnow
+from .stream import GraphDelta, GraphDeltaType, StreamBuilder
+
+# a missing attribute (e.g., the label of a parent-child edge), unlike an attribute whose value is None
+_MISSING = object()
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class _Timestamps:
+    """A column of `created` timestamps: datetimes (stored as microseconds since the epoch) or integers
+    (i.e., Timestamp.COUNTER values), and None for missing timestamps."""
+
+    _NULL = -2 ** 63
+
+    def __init__(self):
+        self._values = array('q')
+        self._is_datetime: bool | None = None
+
+    def append(self, value: datetime | int | None):
+        if value is None:
+            self._values.append(self._NULL)
+            return
+
+        if self._is_datetime is None:
+            self._is_datetime = isinstance(value, datetime)
+        self._values.append((value - _EPOCH) // _MICROSECOND if self._is_datetime else value)
+
+    def __getitem__(self, index: int) -> datetime | int | None:
+        value = self._values[index]
+        if value == self._NULL:
+            return None
+        return _EPOCH + timedelta(microseconds=value) if self._is_datetime else value
+
+
+class CompactAdjacency(NamedTuple):
+    """The adjacency of a CompactGraph in Compressed Sparse Row (CSR) format.
+
+    The neighbors of the node at index `i` are `indices[indptr[i]:indptr[i + 1]]`, and `edges` holds the positions of
+    the corresponding edges. Neighbors are the successors in directed graphs, and are ordered as in NetworkX graphs.
+    """
+
+    indptr: array
+    indices: array
+    edges: array
+
+
+class CompactGraph:
+    """A memory efficient graph, built by `CompactBuilder`.
+
+    Node IDs are interned, i.e., mapped to consecutive integer indices, in insertion order. Edges are pairs of
+    node indices, and attributes are stored in columns (e.g., types as codes of interned type names, magnitudes and
+    timestamps as integer arrays), rather than in a dict per node and per edge. The adjacency of the nodes in CSR
+    format is computed on demand, and `to_networkx` converts it to the NetworkX graph `NetworkxBuilder` would build.
+
+    Args:
+        name: the name of the graph.
+        graph_type: the type of the graph.
+    """
+
+    def __init__(self, name: str, graph_type: GraphType = GraphType.Graph):
+        self.name = name
+        self.graph_type = graph_type
+        graph = graph_type.value()
+        self.is_directed = graph.is_directed()
+        self.is_multigraph = graph.is_multigraph()
+        self.node_types: Counter[str] | dict[str, int] = Counter()
+        self.edge_types: Counter[str] | dict[str, int] = Counter()
+        self.created: datetime | None = None
+
+        self._types: list[str] = []
+        self._type_codes: dict[str, int] = {}
+        self._type_colors: dict[int, list[float]] = {}
+
+        self._node_ids: list[Hashable] = []
+        self._node_index: dict[Hashable, int] = {}
+        self._node_type_codes = array('l')
+        self._node_labels: list[Any] = []
+        self._node_values: list[Any] = []
+        self._magnitudes = array('q')  # zero for nodes added as edge endpoints only
+        self._lineages: list[Any] = []
+        self._node_created = _Timestamps()
+        self._node_updated: dict[int, Any] = {}
+
+        self._sources = array('q')
+        self._targets = array('q')
+        self._edge_index: dict[tuple[int, int], int] = {}
+        self._edge_type_codes = array('l')
+        self._edge_labels: list[Any] = []
+        self._edge_values: list[Any] = []
+        self._weights = array('d')
+        self._edge_created = _Timestamps()
+        self._edge_updated: dict[int, Any] = {}
+
+        self._adjacency: CompactAdjacency | None = None
+
+    def __len__(self) -> int:
+        return len(self._node_ids)
+
+    def __contains__(self, node_id: Hashable) -> bool:
+        return node_id in self._node_index
+
+    def number_of_nodes(self) -> int:
+        return len(self._node_ids)
+
+    def number_of_edges(self) -> int:
+        return len(self._sources)
+
+    # region - Population
+
+    def _type_code(self, element_type: Any) -> int:
+        if element_type is _MISSING:
+            return -1
+
+        code = self._type_codes.get(element_type)
+        if code is None:
+            code = self._type_codes[element_type] = len(self._types)
+            self._types.append(element_type)
+        return code
+
+    def _add_node(self, node_id: Hashable, attributes: dict[str, Any]) -> int:
+        index = self._node_index[node_id] = len(self._node_ids)
+        self._node_ids.append(node_id)
+        self._node_type_codes.append(self._type_code(attributes.get('type', _MISSING)))
+        self._node_labels.append(attributes.get('label', _MISSING))
+        self._node_values.append(attributes.get('value', _MISSING))
+        self._magnitudes.append(attributes.get('magnitude', 0))
+        lineage = attributes.get('lineage', _MISSING)
+        # lineages equal to the node ID (i.e., of non-unique nodes) share the ID tuple
+        self._lineages.append(node_id if lineage is not _MISSING and tuple(lineage) == node_id else lineage)
+        self._node_created.append(attributes.get('created'))
+        return index
+
+    def _node(self, node_id: Hashable) -> int:
+        index = self._node_index.get(node_id)
+        return self._add_node(node_id, {}) if index is None else index
+
+    def _add_edge(self, edge_id: tuple[Hashable, Hashable], attributes: dict[str, Any]):
+        source, target = self._node(edge_id[0]), self._node(edge_id[1])
+        if not self.is_multigraph:
+            self._edge_index[(source, target)] = len(self._sources)
+
+        self._sources.append(source)
+        self._targets.append(target)
+        self._edge_type_codes.append(self._type_code(attributes.get('type', _MISSING)))
+        self._edge_labels.append(attributes.get('label', _MISSING))
+        self._edge_values.append(attributes.get('value', _MISSING))
+        self._weights.append(attributes.get('weight', 1.0))
+        self._edge_created.append(attributes.get('created'))
+
+    def _update_node(self, node_id: Hashable, attributes: dict[str, Any], multiplicity: Multiplicity):
+        # the value is merged as NetworkxBuilder merges it
+        index = self._node_index[node_id]
+        values = self._node_values[index]
+        match multiplicity:
+            case Multiplicity.ADD:
+                self._node_values[index] = [values[0] + attributes['value']]
+            case Multiplicity.ALL:
+                values.append(attributes['value'])
+            case Multiplicity.FIRST:
+                ...
+            case Multiplicity.LAST:
+                self._node_values[index] = [attributes['value']]
+
+        self._magnitudes[index] = attributes['magnitude']
+        if 'updated' in attributes:
+            self._node_updated[index] = attributes['updated']
+
+    def _update_edge(self, edge_id: tuple[Hashable, Hashable], attributes: dict[str, Any]):
+        index = self._edge_index[(self._node_index[edge_id[0]], self._node_index[edge_id[1]])]
+        self._edge_values[index].append(attributes['value'])
+        self._weights[index] += attributes['weight']
+        if 'updated' in attributes:
+            self._edge_updated[index] = attributes['updated']
+
+    def apply(self, delta: GraphDelta):
+        """Apply a graph delta (see `StreamBuilder`), whose element IDs are indexed by `_CompactIndex`."""
+        match delta.type:
+            case GraphDeltaType.NODE_ADDED:
+                self._add_node(delta.id, delta.attributes)
+                self.node_types[delta.attributes['type']] += 1
+            case GraphDeltaType.NODE_UPDATED:
+                self._update_node(delta.id, delta.attributes, delta.multiplicity)
+            case GraphDeltaType.EDGE_ADDED:
+                self._add_edge(delta.id, delta.attributes)
+                if 'type' in delta.attributes:
+                    self.edge_types[delta.attributes['type']] += 1
+            case GraphDeltaType.EDGE_UPDATED:
+                self._update_edge(delta.id, delta.attributes)
+
+    def _finalize(self):
+        """Apply the default attributes, as NetworkxBuilder applies them to the graph it builds."""
+        node_type_code = self._type_code('node')
+        for index, node_id in enumerate(self._node_ids):
+            if self._node_type_codes[index] == -1:
+                self._node_type_codes[index] = node_type_code
+            if self._node_values[index] is _MISSING:
+                self._node_values[index] = node_id
+            if self._lineages[index] is _MISSING:
+                self._lineages[index] = node_id
+            if self._node_labels[index] in (_MISSING, None):
+                self._node_labels[index] = node_label_converter(node_id)
+
+        # nodes of the default type are counted (again), as NetworkxBuilder counts them
+        node_count = self._node_type_codes.count(node_type_code)
+        if node_count:
+            self.node_types['node'] += node_count
+
+        used_codes = set(self._node_type_codes)
+        type_colors = color.node_type_color_mapping(self.node_types, [self._types[c] for c in used_codes], len(self))
+        self._type_colors = {self._type_codes[t]: c for t, c in type_colors.items()}
+
+        edge_type_code = self._type_code('edge')
+        for index, edge_id in self._edge_ids():
+            if self._edge_type_codes[index] == -1:
+                self._edge_type_codes[index] = edge_type_code
+            if self._edge_values[index] is _MISSING:
+                self._edge_values[index] = edge_id
+            if self._edge_labels[index] not in (_MISSING, None):
+                self._edge_labels[index] = edge_label_converter(edge_id)
+
+        edge_count = self._edge_type_codes.count(edge_type_code)
+        if edge_count:
+            self.edge_types['edge'] += edge_count
+
+        self.node_types = simplify(self.node_types)
+        self.edge_types = simplify(self.edge_types)
+        self.created = utcnow()
+
+    # endregion - Population
+
+    def adjacency(self) -> CompactAdjacency:
+        """Return the adjacency of the nodes in CSR format (computed once)."""
+        if self._adjacency is None:
+            rows, columns, edges = array('q'), array('q'), array('q')
+            for edge, (source, target) in enumerate(zip(self._sources, self._targets, strict=True)):
+                rows.append(source)
+                columns.append(target)
+                edges.append(edge)
+                if not self.is_directed and source != target:
+                    rows.append(target)
+                    columns.append(source)
+                    edges.append(edge)
+
+            # NetworkX orders the neighbors of a node by their first edge, and parallel edges by insertion
+            first: dict[tuple[int, int], int] = {}
+            for entry, pair in enumerate(zip(rows, columns, strict=True)):
+                first.setdefault(pair, entry)
+            order = sorted(range(len(rows)), key=lambda e: (rows[e], first[(rows[e], columns[e])], e))
+
+            indptr = array('q', bytes(8 * (len(self) + 1)))
+            for row in rows:
+                indptr[row + 1] += 1
+            for i in range(len(self)):
+                indptr[i + 1] += indptr[i]
+
+            self._adjacency = CompactAdjacency(indptr,
+                                               array('q', (columns[e] for e in order)),
+                                               array('q', (edges[e] for e in order)))
+        return self._adjacency
+
+    def neighbors(self, node_id: Hashable) -> list[Hashable]:
+        """Return the neighbors (successors in directed graphs) of a node.
+
+        Raises:
+            KeyError: if the node is not in the graph.
+        """
+        index = self._node_index[node_id]
+        indptr, indices, _ = self.adjacency()
+        node_ids = self._node_ids
+        return list(dict.fromkeys(node_ids[i] for i in indices[indptr[index]:indptr[index + 1]]))
+
+    def _edge_order(self) -> Iterator[tuple[int, int, int]]:
+        """Yield the position, source index and target index of the edges, as NetworkX iterates them."""
+        indptr, indices, edges = self.adjacency()
+        for row in range(len(self)):
+            for entry in range(indptr[row], indptr[row + 1]):
+                column = indices[entry]
+                if self.is_directed or column >= row:
+                    yield edges[entry], row, column
+
+    def _edge_ids(self) -> Iterator[tuple[int, tuple]]:
+        """Yield the position and the ID (with its key in multigraphs) of the edges, as NetworkX iterates them."""
+        node_ids = self._node_ids
+        keys: Counter[tuple[int, int]] = Counter()
+        for edge, source, target in self._edge_order():
+            edge_id = node_ids[source], node_ids[target]
+            if self.is_multigraph:
+                edge_id = (*edge_id, keys[(source, target)])
+                keys[(source, target)] += 1
+            yield edge, edge_id
+
+    def _node_attributes(self, index: int) -> dict[str, Any]:
+        type_code = self._node_type_codes[index]
+        if self._magnitudes[index]:
+            attributes = {
+                'label': self._node_labels[index],
+                'type': self._types[type_code],
+                'value': self._node_values[index],
+                'magnitude': self._magnitudes[index],
+                'lineage': list(self._lineages[index]),
+            }
+            created = self._node_created[index]
+            if created is not None:
+                attributes['created'] = created
+            if index in self._node_updated:
+                attributes['updated'] = self._node_updated[index]
+        else:  # a node added as an edge endpoint, with default attributes only
+            attributes = {
+                'type': self._types[type_code],
+                'value': self._node_values[index],
+                'lineage': self._lineages[index],
+                'label': self._node_labels[index],
+            }
+
+        attributes['color'] = self._type_colors[type_code]
+        return attributes
+
+    def _edge_attributes(self, index: int) -> dict[str, Any]:
+        attributes = {}
+        label = self._edge_labels[index]
+        if label is not _MISSING:
+            attributes['label'] = label
+            attributes['type'] = self._types[self._edge_type_codes[index]]
+            attributes['value'] = self._edge_values[index]
+            attributes['weight'] = self._weights[index]
+
+        created = self._edge_created[index]
+        if created is not None:
+            attributes['created'] = created
+        if index in self._edge_updated:
+            attributes['updated'] = self._edge_updated[index]
+
+        if label is _MISSING:  # a parent-child edge, with default attributes
+            attributes['type'] = self._types[self._edge_type_codes[index]]
+            attributes['value'] = self._edge_values[index]
+            attributes['weight'] = self._weights[index]
+        return attributes
+
+    def graph_attributes(self) -> dict[str, Any]:
+        return {'name': self.name, 'node_types': self.node_types, 'edge_types': self.edge_types,
+                'created': self.created}
+
+    def nodes(self) -> Iterator[tuple[Hashable, dict[str, Any]]]:
+        """Yield the nodes and their attributes (materialized per node), in insertion order."""
+        for index, node_id in enumerate(self._node_ids):
+            yield node_id, self._node_attributes(index)
+
+    def edges(self) -> Iterator[tuple[Hashable, ...]]:
+        """Yield the edges (with their keys in multigraphs) and their attributes (materialized per edge), in the
+        order NetworkX iterates them."""
+        for edge, edge_id in self._edge_ids():
+            yield *edge_id, self._edge_attributes(edge)
+
+    def to_networkx(self) -> nx.Graph:
+        """Convert to a NetworkX graph (materializing the attributes of all nodes and edges)."""
+        graph = self.graph_type.value(**self.graph_attributes())
+        graph.add_nodes_from(self.nodes())
+        node_ids = self._node_ids
+        graph.add_edges_from((node_ids[source], node_ids[target], self._edge_attributes(edge))
+                             for edge, (source, target) in enumerate(zip(self._sources, self._targets, strict=True)))
+        return graph
+
+    def node_link_data(self) -> dict:
+        """Return the node-link data of the graph, as `nx.node_link_data(self.to_networkx(), edges='links')` would,
+        without converting it."""
+        if self.is_multigraph:
+            links = [{**data, 'source': source, 'target': target, 'key': key}
+                     for source, target, key, data in self.edges()]
+        else:
+            links = [{**data, 'source': source, 'target': target} for source, target, data in self.edges()]
+
+        return {
+            'directed': self.is_directed,
+            'multigraph': self.is_multigraph,
+            'graph': self.graph_attributes(),
+            'nodes': [{**data, 'id': node_id} for node_id, data in self.nodes()],
+            'links': links,
+        }
+
+
+class _CompactIndex:
+    """An unbounded index of the elements of a CompactGraph, used in place of the LRU index of `StreamBuilder`."""
+
+    def __init__(self, graph: CompactGraph):
+        self.graph = graph
+
+    def _edge(self, edge_id: tuple[Hashable, Hashable]) -> int | None:
+        graph = self.graph
+        source, target = (graph._node_index.get(n) for n in edge_id)
+        return None if source is None or target is None else graph._edge_index.get((source, target))
+
+    def __contains__(self, key: tuple[str, Hashable]) -> bool:
+        kind, element_id = key
+        return element_id in self.graph if kind == 'node' else self._edge(element_id) is not None
+
+    def increment(self, key: tuple[str, Hashable]) -> int:
+        # the graph itself is updated when the delta yielded for the element is applied
+        kind, element_id = key
+        if kind == 'node':
+            index = self.graph._node_index.get(element_id)
+            return 1 if index is None else self.graph._magnitudes[index] + 1
+
+        return 1 if self._edge(element_id) is None else 2
+
+
+class CompactBuilder(StreamBuilder):
+    """Build a CompactGraph.
+
+    Nodes and edges are generated as by `StreamBuilder`, and applied to a CompactGraph instead of a NetworkX graph,
+    so large graphs take a fraction of the memory. Use `CompactGraph.to_networkx` to convert the graph on demand.
+    """
+
+    def __init__(self, model: GraphModel, graph_type: GraphType = GraphType.Graph):
+        super().__init__(model, graph_type)
+        self._graph: CompactGraph | None = None
+
+    def _index(self, index_size: int) -> _CompactIndex:
+        return _CompactIndex(self._graph)
+
+    def build(self, timestamp: Timestamp = Timestamp.ELEMENT, **kwargs: Any) -> CompactGraph:  # type: ignore[override]
+        """Build a CompactGraph.
+
+        Args:
+            timestamp: the policy of the `created`/`updated` attributes of nodes and edges.
+                       Defaults to ELEMENT (i.e., a UTC datetime per element creation or update).
+            **kwargs: additional inputs to the node and edge generator functions
+
+        Returns:
+            CompactGraph
+        """
+        if kwargs.get('default_node_attributes'):
+            raise ValueError("CompactBuilder does not support default_node_attributes")
+
+        graph = self._graph = CompactGraph(self.model.name, self.graph_type)
+        for delta in super().build(timestamp=timestamp, **kwargs):
+            graph.apply(delta)
+
+        graph._finalize()
+        return graph
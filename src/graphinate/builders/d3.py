@@ -1,7 +1,9 @@
+import itertools
 import json
-from collections.abc import Iterable, Mapping
+import math
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from datetime import datetime, timedelta
-from typing import Any, Literal
+from typing import Any, Literal, TextIO
 
 import mappingtools
 import networkx as nx
@@ -9,8 +11,15 @@ import networkx as nx
 from .. import color
 from ..enums import GraphType
 from ..modeling import GraphModel
+from .compact import CompactGraph
 from .networkx import NetworkxBuilder
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def _convert(obj: Any) -> Any:
     """if obj is a not python scalar (e.g. it's some sort of container)
@@ -28,6 +37,45 @@ def _convert(obj: Any) -> Any:
             return json.dumps(obj, default=str)
 
 
+def _float_to_json(value: float) -> str:
+    if math.isfinite(value):
+        return float.__repr__(value)
+    return 'NaN' if math.isnan(value) else ('Infinity' if value > 0 else '-Infinity')
+
+
+def _list_to_strict(obj: Iterable) -> list:
+    return [_to_strict(item) for item in obj]
+
+
+# converters to strict values by exact type, i.e., as `strictify(obj, value_handler=_convert)` converts them
+_STRICT_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    str: str.__str__,
+    int: int.__repr__,
+    float: _float_to_json,
+    bool: lambda obj: 'true' if obj else 'false',
+    type(None): lambda obj: 'null',
+    bytes: bytes.decode,
+    datetime: datetime.isoformat,
+    timedelta: lambda obj: f"{obj.total_seconds()} s",
+    dict: lambda obj: {key: _to_strict(value) for key, value in obj.items()},
+    list: _list_to_strict,
+    tuple: _list_to_strict,
+    set: _list_to_strict,
+    frozenset: _list_to_strict,
+}
+
+
+def _to_strict(obj: Any) -> Any:
+    """Convert the values of a structure of containers to JSON strings, dispatching on their types.
+
+    Other types (including subclasses, e.g., enums or Counters) are converted by `strictify`.
+    """
+    converter = _STRICT_CONVERTERS.get(type(obj))
+    if converter is None:
+        return mappingtools.transformers.strictify(obj, value_handler=_convert)
+    return converter(obj)
+
+
 class D3Builder(NetworkxBuilder):
     """Build a D3 Graph"""
 
@@ -49,13 +97,80 @@ class D3Builder(NetworkxBuilder):
 
         match values_format:
             case 'json':
-                return mappingtools.transformers.strictify(d3graph, value_handler=_convert)
+                return _to_strict(d3graph)
             case 'python':
                 return d3graph
             case _:
                 raise ValueError(f"Invalid values format: {values_format}")
 
+    def build_json(self, **kwargs: Any) -> bytes:
+        """Build a D3 Graph with JSON values (see `build`) and encode it as a JSON document.
+
+        The document is encoded by orjson when it is installed.
+
+        Args:
+            **kwargs: passed to `build`.
+
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        d3graph = self.build(values_format='json', **kwargs)
+        if HAS_ORJSON:
+            return orjson.dumps(d3graph, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(d3graph, ensure_ascii=False, separators=(',', ':')).encode()
+
+    def dump(self, fp: TextIO, chunk_size: int = 1000, **kwargs: Any) -> None:
+        """Build a D3 Graph and write it to a file as JSON, without materializing it.
+
+        The output is the same as `json.dump(self.build(**kwargs), fp, default=str)`, but nodes and links are encoded
+        from the NetworkX graph and written in chunks, so memory does not grow beyond the graph itself.
+
+        Args:
+            fp: a text file (e.g., opened by `open` or `gzip.open`).
+            chunk_size: number of nodes or links per write. Defaults to 1000.
+            **kwargs: passed to `build`.
+        """
+        super().build(**kwargs)
+        color.convert_colors_to_hex(self._graph)
+        fp.writelines(self.iter_json(self._graph, chunk_size))
+
     @staticmethod
     def from_networkx(nx_graph: nx.Graph) -> dict:
         d3_graph: dict = nx.node_link_data(nx_graph, nodes='nodes', edges='links')
         return d3_graph
+
+    @staticmethod
+    def from_compact(compact_graph: CompactGraph) -> dict:
+        """Return the D3 Graph of a CompactGraph, without converting it to a NetworkX graph."""
+        d3_graph: dict = compact_graph.node_link_data()
+        for node in d3_graph['nodes']:
+            node['color'] = color.color_hex(node['color'])
+        return d3_graph
+
+    @staticmethod
+    def iter_json(nx_graph: nx.Graph, chunk_size: int = 1000) -> Iterator[str]:
+        """Encode the D3 Graph of a NetworkX graph (see `from_networkx`) to JSON incrementally.
+
+        Yields:
+            JSON text chunks, each encoding up to `chunk_size` nodes or links.
+        """
+        encode = json.JSONEncoder(default=str).encode
+        is_multigraph = nx_graph.is_multigraph()
+
+        if is_multigraph:
+            links = ({**d, 'source': u, 'target': v, 'key': k} for u, v, k, d in nx_graph.edges(keys=True, data=True))
+        else:
+            links = ({**d, 'source': u, 'target': v} for u, v, d in nx_graph.edges(data=True))
+
+        header = {'directed': nx_graph.is_directed(), 'multigraph': is_multigraph, 'graph': nx_graph.graph}
+        yield encode(header)[:-1]  # without the closing brace
+
+        for name, items in (('nodes', ({**d, 'id': n} for n, d in nx_graph.nodes(data=True))), ('links', links)):
+            yield f", {encode(name)}: ["
+            separator = ''
+            while chunk := list(itertools.islice(items, chunk_size)):
+                yield separator + ', '.join(map(encode, chunk))
+                separator = ', '
+            yield ']'
+
+        yield '}'
@@ -1,34 +1,96 @@
 import functools
 import importlib
 import inspect
+import itertools
 import json
 import math
 import operator
-from collections.abc import Callable
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor
+from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
 from enum import EnumMeta as EnumType  # support Python 3.10
-from typing import Any, Optional
+from typing import Any, Generic, Optional, TypeVar
 
-import inflect
 import networkx as nx
 import strawberry
-from strawberry.extensions import ParserCache, QueryDepthLimiter, ValidationCache
+from loguru import logger
+from strawberry.extensions import ParserCache, QueryDepthLimiter, SchemaExtension, ValidationCache
 from strawberry.types.base import StrawberryType
 
 from .. import color, converters
 from ..converters import (
+    decode_cursor,
     decode_edge_id,
     decode_node_id,
     edge_label_converter,
+    encode_cursor,
     encode_edge_id,
     encode_node_id,
     node_label_converter,
 )
-from ..enums import GraphType
+from ..enums import GraphType, Timestamp
 from ..modeling import GraphModel
+from . import _approximations
+from ._measures import MeasureCache, in_event_loop, then
 from .networkx import NetworkxBuilder
 
+T = TypeVar('T')
+
+_loaded_graph_nodes: ContextVar[dict[Any, 'GraphQLBuilder.GraphNode'] | None] = ContextVar('loaded_graph_nodes',
+                                                                                          default=None)
+
+
+class _GraphNodeLoader(SchemaExtension):
+    """Scopes a cache of materialized GraphNodes to a single GraphQL operation.
+
+    While an operation executes, each graph node is materialized into a GraphNode only once, and the same object is
+    shared by all the fields that return it (e.g., the source and target of many edges).
+    """
+
+    def on_operation(self) -> Iterator[None]:
+        token = _loaded_graph_nodes.set({})
+        try:
+            yield
+        finally:
+            _loaded_graph_nodes.reset(token)
+
+
+class _ElementIndex:
+    """The IDs of graph elements in graph order, and their positions, so Connection pages can be sliced directly."""
+
+    def __init__(self, element_ids: Iterable[Hashable]):
+        self.ids: list[Hashable] = list(element_ids)
+        self.positions: dict[Hashable, int] = {element_id: i for i, element_id in enumerate(self.ids)}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _edge_item_key(item: tuple) -> tuple:
+    """The ID of an edge item, i.e., its nodes and its key in multigraphs, without its data."""
+    return item[:-1]
+
+
+# measures cheap enough to compute in the event loop, rather than by the measure executor
+_INLINE_MEASURES = frozenset({'is_empty', 'is_directed', 'density'})
+
+# sampled approximations of expensive measures (see `_approximations`)
+_APPROXIMATE_MEASURES: dict[str, Callable[..., Any]] = {
+    'diameter': _approximations.diameter,
+    'average_shortest_path_length': _approximations.average_shortest_path_length,
+    'average_clustering': _approximations.average_clustering,
+    'global_efficiency': _approximations.global_efficiency,
+}
+
+
+def _average_degree(graph: nx.Graph) -> float:
+    return graph.number_of_nodes() and (1.0 * sum(d for _, d in graph.degree()) / graph.number_of_nodes())
+
 
 class GraphQLBuilder(NetworkxBuilder):
     """Builds a GraphQL Schema"""
@@ -77,23 +139,72 @@ class GraphQLBuilder(NetworkxBuilder):
         def edges(self) -> list[Optional['GraphQLBuilder.GraphEdge']]:
             ...  # pragma: no cover
 
+        @strawberry.field()
+        def neighbors_connection(self,
+                                 type: 'GraphQLBuilder.GraphNodeType | None' = None,
+                                 children: bool = False,
+                                 first: int | None = None,
+                                 after: str | None = None) -> 'GraphQLBuilder.Connection[GraphQLBuilder.GraphNode]':
+            ...  # pragma: no cover
+
+        @strawberry.field()
+        def edges_connection(self,
+                             first: int | None = None,
+                             after: str | None = None) -> 'GraphQLBuilder.Connection[GraphQLBuilder.GraphEdge]':
+            ...  # pragma: no cover
+
     @strawberry.type(description="Represents a Graph Edge")
     class GraphEdge(GraphElement):
         source: 'GraphQLBuilder.GraphNode'
         target: 'GraphQLBuilder.GraphNode'
         weight: float
 
+    @strawberry.type(description="Information about a page of a Connection")
+    class PageInfo:
+        has_next_page: bool
+        has_previous_page: bool
+        start_cursor: str | None
+        end_cursor: str | None
+
+    @strawberry.type(description="An item of a Connection and its cursor")
+    class ConnectionEdge(Generic[T]):
+        cursor: str
+        node: T
+
+    @strawberry.type(description="A page of items, i.e., a Relay Connection")
+    class Connection(Generic[T]):
+        edges: list['GraphQLBuilder.ConnectionEdge[T]']
+        page_info: 'GraphQLBuilder.PageInfo'
+
     @strawberry.type
     class Graph:
         nx_graph: strawberry.Private[nx.Graph]
+        measures: strawberry.Private[MeasureCache]
+
+        def _measure(self, measure: 'GraphQLBuilder.GraphMeasure') -> Any:
+            return GraphQLBuilder._resolve_measure(self.measures, measure)
+
+        def _measure_if_connected(self, measure: 'GraphQLBuilder.GraphMeasure') -> Any:
+            is_connected = self._measure(GraphQLBuilder.GraphMeasure.is_connected)
+            if not inspect.isawaitable(is_connected):
+                return self._measure(measure) if is_connected else math.inf
+
+            async def awaited():
+                return await self._measure(measure) if await is_connected else math.inf
+
+            return awaited()
 
         @strawberry.field()
         def radius(self) -> 'GraphQLBuilder.InfNumber':
-            return nx.radius(self.nx_graph) if nx.is_connected(self.nx_graph) else math.inf
+            return self._measure_if_connected(GraphQLBuilder.GraphMeasure.radius)
 
         @strawberry.field()
-        def diameter(self) -> 'GraphQLBuilder.InfNumber':
-            return nx.diameter(self.nx_graph) if nx.is_connected(self.nx_graph) else math.inf
+        def diameter(self, sample_size: int | None = None) -> 'GraphQLBuilder.InfNumber':
+            if sample_size is not None:  # the approximation is infinite for graphs that are not connected
+                return GraphQLBuilder._resolve_measure(self.measures, GraphQLBuilder.GraphMeasure.diameter,
+                                                       sample_size)
+
+            return self._measure_if_connected(GraphQLBuilder.GraphMeasure.diameter)
 
         @strawberry.field()
         def name(self) -> str:
@@ -125,12 +236,11 @@ class GraphQLBuilder(NetworkxBuilder):
 
         @strawberry.field()
         def average_degree(self) -> float:
-            return self.nx_graph.number_of_nodes() and (
-                    1.0 * sum(d for _, d in self.nx_graph.degree()) / self.nx_graph.number_of_nodes())
+            return self.measures.resolve('average_degree', _average_degree, inline=True)
 
         @strawberry.field()
         def hash(self) -> str:
-            return nx.weisfeiler_lehman_graph_hash(self.nx_graph)
+            return self.measures.resolve('hash', nx.weisfeiler_lehman_graph_hash)
 
         @strawberry.field()
         def created(self) -> datetime:
@@ -197,6 +307,11 @@ class GraphQLBuilder(NetworkxBuilder):
     def __init__(self, model: GraphModel, graph_type: GraphType = GraphType.Graph):
         super().__init__(model, graph_type)
         self._node_value_graphql_type_supplier: Callable[[str], StrawberryType | None] | None = None
+        self._measures = MeasureCache(None)
+        self._precomputed_measures: tuple[GraphQLBuilder.GraphMeasure, ...] = ()
+        self._node_index: _ElementIndex | None = None
+        self._node_type_index: dict[str, _ElementIndex] | None = None
+        self._edge_index: _ElementIndex | None = None
 
     @staticmethod
     def add_field_resolver(class_dict: dict, field_name: str, resolver: Callable, graphql_type: Any | None = None):
@@ -222,11 +337,25 @@ class GraphQLBuilder(NetworkxBuilder):
 
         return node_class(**kwargs)
 
+    @staticmethod
+    def _load_graph_node(node_class: type['GraphQLBuilder.GraphNode'],
+                         node: tuple,
+                         node_data: dict) -> 'GraphQLBuilder.GraphNode':
+        """Return the GraphNode of a node, materializing it only once per GraphQL operation."""
+        loaded = _loaded_graph_nodes.get()
+        if loaded is None:
+            return GraphQLBuilder._graph_node(node_class, node, node_data)
+
+        graph_node = loaded.get(node)
+        if graph_node is None:
+            graph_node = loaded[node] = GraphQLBuilder._graph_node(node_class, node, node_data)
+        return graph_node
+
     def _graph_edge(self, edge: tuple, edge_data: dict):
         graphql_types = self._graphql_types
         nodes_with_data = ((n, self._graph.nodes[n]) for n in edge)
         nodes_args = ((graphql_types.get(d.get('type'), ), n, d) for n, d in nodes_with_data)
-        source, target = tuple(self._graph_node(*args) for args in nodes_args)
+        source, target = tuple(self._load_graph_node(*args) for args in nodes_args)
 
         return GraphQLBuilder.GraphEdge(
             id=encode_edge_id(edge),
@@ -241,6 +370,229 @@ class GraphQLBuilder(NetworkxBuilder):
             updated=edge_data.get('updated')
         )
 
+    @staticmethod
+    def _node_data(graph: nx.Graph, node_id: Any) -> dict | None:
+        """Return the data of a node, or None if the graph has no such node."""
+        try:
+            return graph.nodes.get(node_id)
+        except TypeError:  # unhashable node_id
+            return None
+
+    @staticmethod
+    def _edge_items(graph: nx.Graph, edge_id: Any) -> list[tuple]:
+        """Return the (source, target, data) items of the edges between the nodes of an edge ID.
+
+        In multigraphs, items of parallel edges are (source, target, key, data) items.
+        """
+        if not isinstance(edge_id, tuple) or len(edge_id) != 2:
+            return []
+
+        try:
+            data = graph.get_edge_data(*edge_id)
+        except TypeError:  # unhashable node ID
+            return []
+
+        if data is None:
+            return []
+
+        if graph.is_multigraph():
+            return [(*edge_id, key, key_data) for key, key_data in data.items()]
+
+        return [(*edge_id, data)]
+
+    @staticmethod
+    def _measure_function(measure: 'GraphQLBuilder.GraphMeasure') -> Callable[[nx.Graph], Any]:
+        """Return the NetworkX function computing a measure (picklable, so it can run in worker processes)."""
+        if isinstance(measure.value, str):
+            method = measure.value
+            module = nx
+        else:
+            method = measure.value[1]
+            module = importlib.import_module(measure.value[0])
+
+        return operator.attrgetter(method)(module)
+
+    @staticmethod
+    def _approximation_function(measure: 'GraphQLBuilder.GraphMeasure',
+                                sample_size: int) -> Callable[[nx.Graph], Any]:
+        """Return the function approximating a measure from a sample of nodes (picklable, like `_measure_function`).
+
+        Raises:
+            ValueError: if the measure has no approximation, or the sample size is not positive.
+        """
+        approximation = _APPROXIMATE_MEASURES.get(measure.name)
+        if approximation is None:
+            raise ValueError(f"Measure {measure.name} has no approximation. "
+                             f"Approximate measures: {', '.join(_APPROXIMATE_MEASURES)}.")
+
+        if sample_size < 1:
+            raise ValueError(f"Invalid sample size: {sample_size}. It must be positive.")
+
+        return functools.partial(approximation, sample_size=sample_size)
+
+    @staticmethod
+    def _resolve_measure(measures: MeasureCache,
+                         measure: 'GraphQLBuilder.GraphMeasure',
+                         sample_size: int | None = None) -> Any:
+        if sample_size is not None:
+            return measures.resolve((measure, sample_size),
+                                    GraphQLBuilder._approximation_function(measure, sample_size))
+
+        return measures.resolve(measure,
+                                GraphQLBuilder._measure_function(measure),
+                                inline=measure.name in _INLINE_MEASURES)
+
+    def _precompute_measures(self):
+        """Compute the measures to precompute in a background thread, so they are cached before they are queried."""
+        if not self._precomputed_measures:
+            return
+
+        measures, precomputed_measures = self._measures, self._precomputed_measures
+
+        def precompute():
+            for measure in precomputed_measures:
+                try:
+                    measures.get(measure, self._measure_function(measure))
+                except Exception as e:
+                    logger.warning('Could not precompute measure {}: {}', measure.name, e)
+
+        threading.Thread(target=precompute, name='graphinate-measures', daemon=True).start()
+
+    def _nodes_index(self) -> _ElementIndex:
+        """Return the index of the graph nodes, built on first use after each build or refresh."""
+        index = self._node_index
+        if index is None:
+            index = self._node_index = _ElementIndex(self._graph)
+        return index
+
+    def _nodes_of_type(self, node_type: str) -> _ElementIndex:
+        """Return the index of the graph nodes of a node type, in graph order.
+
+        The nodes are indexed by type on first use after each build or refresh.
+        """
+        index = self._node_type_index
+        if index is None:
+            node_ids = defaultdict(list)
+            for node, data_type in self._graph.nodes(data='type'):
+                node_ids[data_type].append(node)
+            index = self._node_type_index = {t: _ElementIndex(ids) for t, ids in node_ids.items()}
+
+        return index.get(node_type) or _ElementIndex(())
+
+    def _edges_index(self) -> _ElementIndex:
+        """Return the index of the graph edges (with their keys in multigraphs), built on first use after each
+        build or refresh."""
+        index = self._edge_index
+        if index is None:
+            edges = self._graph.edges(keys=True) if self._graph.is_multigraph() else self._graph.edges()
+            index = self._edge_index = _ElementIndex(edges)
+        return index
+
+    def _clear_indexes(self):
+        self._node_index = None
+        self._node_type_index = None
+        self._edge_index = None
+
+    def refresh(self) -> nx.Graph:
+        """Rebuild and patch the graph (see `NetworkxBuilder.refresh`), invalidating its cached measures.
+
+        Returns:
+            The patched NetworkX Graph
+        """
+        graph = super().refresh()
+        self._invalidate()
+        return graph
+
+    async def arefresh(self) -> nx.Graph:
+        """Asynchronously rebuild and patch the graph (see `NetworkxBuilder.arefresh`), invalidating its cached
+        measures.
+
+        Returns:
+            The patched NetworkX Graph
+        """
+        graph = await super().arefresh()
+        self._invalidate()
+        return graph
+
+    def _invalidate(self):
+        """Invalidate the indexes and cached measures of the graph after it was refreshed."""
+        self._clear_indexes()
+        self._measures.clear()
+        self._precompute_measures()
+
+    @staticmethod
+    def _connection(items: Iterable[Any],
+                    materialize: Callable[[Any], Any],
+                    first: int | None = None,
+                    after: str | None = None,
+                    key: Callable[[Any], Hashable] = operator.itemgetter(0),
+                    positions: Mapping[Hashable, int] | None = None) -> 'GraphQLBuilder.Connection':
+        """Page through items using cursors that encode the keys of the items (e.g., node IDs).
+
+        A cursor stays valid as long as its item exists, also after the graph is refreshed. Only the items of the
+        requested page are materialized into GraphQL objects.
+
+        Args:
+            items: the items to page through, in a stable order.
+            materialize: converts an item of the page into a GraphQL object.
+            first: maximal number of items in the page. Defaults to None (i.e., all remaining items).
+            after: the cursor of the item preceding the page. Defaults to None (i.e., the first item).
+            key: returns the key of an item. Defaults to the first element of the item (e.g., of a node item).
+            positions: the positions of the item keys, if the items are a Sequence, so the page is sliced directly.
+                       Defaults to None (i.e., the items are scanned for the item of the cursor).
+
+        Returns:
+            Connection
+        """
+        if first is not None and first < 0:
+            raise ValueError(f"Invalid first: {first}. Must be a non-negative integer.")
+
+        stop = None if first is None else first + 1
+        if after is None:
+            page = list(itertools.islice(items, stop))
+        else:
+            page = GraphQLBuilder._page_after(items, decode_cursor(after), stop, key, positions)
+            if page is None:
+                raise ValueError(f"Invalid cursor: {after}. Its item no longer exists.")
+
+        has_next_page = first is not None and len(page) > first
+        if has_next_page:
+            page = page[:first]
+
+        edges = [GraphQLBuilder.ConnectionEdge(cursor=encode_cursor(key(item)), node=materialize(item))
+                 for item in page]
+        page_info = GraphQLBuilder.PageInfo(has_next_page=has_next_page,
+                                            has_previous_page=after is not None,
+                                            start_cursor=edges[0].cursor if edges else None,
+                                            end_cursor=edges[-1].cursor if edges else None)
+        return GraphQLBuilder.Connection(edges=edges, page_info=page_info)
+
+    @staticmethod
+    def _page_after(items: Iterable[Any],
+                    after_key: Any,
+                    stop: int | None,
+                    key: Callable[[Any], Hashable],
+                    positions: Mapping[Hashable, int] | None) -> list[Any] | None:
+        """Return up to `stop` items following the item of a key, or None if there is no such item."""
+        if positions is not None:
+            try:
+                position = positions.get(after_key)
+            except TypeError:  # unhashable key
+                return None
+
+            if position is None:
+                return None
+
+            start = position + 1
+            return list(items[start:None if stop is None else start + stop])
+
+        iterator = iter(items)
+        for item in iterator:
+            if key(item) == after_key:
+                return list(itertools.islice(iterator, stop))
+
+        return None
+
     @staticmethod
     def _graphql_type(name: str, type_class: type['GraphQLBuilder.GraphNode']) -> type['GraphQLBuilder.GraphNode']:
         capitalized_name = name.capitalize()
@@ -286,39 +638,66 @@ class GraphQLBuilder(NetworkxBuilder):
 
         self._populate_graph_node_type_enum(node_types)
 
-        def neighbors_resolver():
+        def graph_node(item: tuple) -> GraphQLBuilder.GraphNode:
+            node, data = item
+            return GraphQLBuilder._load_graph_node(graphql_types[data['type']], node, data)
+
+        def neighbors_resolvers():
             graph = self._graph
 
             children_types = set(self._children_types(self.model, node_type))
 
-            def node_neighbors(self,
-                               type: 'GraphQLBuilder.GraphNodeType | None' = None,
-                               children: bool = False) -> list['GraphQLBuilder.GraphNode']:
-                node = decode_node_id(self.id)
-                items = (GraphQLBuilder._graph_node(graphql_types[d['type']], n, d)
-                         for n, d in graph.nodes(data=True)
-                         if n in graph.neighbors(node))
+            def neighbor_items(node_id: strawberry.ID, type: str | None, children: bool) -> Iterable[tuple]:
+                node = decode_node_id(node_id)
+                nodes = graph.nodes
+                neighbors = ((n, nodes[n]) for n in graph.adj[node])
 
                 if type is not None:
-                    items = (item for item in items if item.type == type)
+                    neighbors = ((n, d) for n, d in neighbors if d['type'] == type)
 
                 if children and children_types:
-                    items = (item for item in items if item.type in children_types)
+                    neighbors = ((n, d) for n, d in neighbors if d['type'] in children_types)
 
-                items = list(items)
-                return items
+                return neighbors
 
-            return node_neighbors
+            def node_neighbors(self,
+                               type: 'GraphQLBuilder.GraphNodeType | None' = None,
+                               children: bool = False) -> list['GraphQLBuilder.GraphNode']:
+                return [graph_node(item) for item in neighbor_items(self.id, type, children)]
 
-        def edges_resolver():
+            def node_neighbors_connection(
+                    self,
+                    type: 'GraphQLBuilder.GraphNodeType | None' = None,
+                    children: bool = False,
+                    first: int | None = None,
+                    after: str | None = None) -> GraphQLBuilder.Connection[GraphQLBuilder.GraphNode]:
+                return GraphQLBuilder._connection(neighbor_items(self.id, type, children), graph_node, first, after)
+
+            return node_neighbors, node_neighbors_connection
+
+        def edges_resolvers():
             graph: nx.Graph = self._graph
             graph_edge = self._graph_edge
 
+            def edge_items(node_id: strawberry.ID) -> Iterable[tuple]:
+                node = decode_node_id(node_id)
+                if graph.is_multigraph():
+                    return graph.edges(node, data=True, keys=True)
+                return graph.edges(node, data=True)
+
+            def materialize_edge(item: tuple) -> GraphQLBuilder.GraphEdge:
+                return graph_edge(item[:2], item[-1])
+
             def node_edges(self) -> list[GraphQLBuilder.GraphEdge | None]:
-                node = decode_node_id(self.id)
-                return [graph_edge((source, target), data) for source, target, data in graph.edges(node, data=True)]
+                return [materialize_edge(item) for item in edge_items(self.id)]
+
+            def node_edges_connection(self,
+                                      first: int | None = None,
+                                      after: str | None = None) -> GraphQLBuilder.Connection[GraphQLBuilder.GraphEdge]:
+                return GraphQLBuilder._connection(edge_items(self.id), materialize_edge, first, after,
+                                                  key=_edge_item_key)
 
-            return node_edges
+            return node_edges, node_edges_connection
 
         # Create classes for nodes according to their type
         graphql_types: dict[str, type[GraphQLBuilder.GraphNode]] = {}
@@ -336,8 +715,13 @@ class GraphQLBuilder(NetworkxBuilder):
             ):
                 class_dict['value'] = list[value_graphql_type]
 
-            self.add_field_resolver(class_dict, 'neighbors', neighbors_resolver())
-            self.add_field_resolver(class_dict, 'edges', edges_resolver())
+            node_neighbors, node_neighbors_connection = neighbors_resolvers()
+            self.add_field_resolver(class_dict, 'neighbors', node_neighbors)
+            self.add_field_resolver(class_dict, 'neighbors_connection', node_neighbors_connection)
+
+            node_edges, node_edges_connection = edges_resolvers()
+            self.add_field_resolver(class_dict, 'edges', node_edges)
+            self.add_field_resolver(class_dict, 'edges_connection', node_edges_connection)
 
             # noinspection PyTypeChecker
             graphql_type: type[GraphQLBuilder.GraphNode] = type(class_name, bases, class_dict)
@@ -347,12 +731,21 @@ class GraphQLBuilder(NetworkxBuilder):
 
     def _graphql_query(self):  # noqa: C901
         # inflect engine to generate Plurals when needed
+        # (imported here, as importing it is slow, e.g., for each measure worker process that imports this module)
+        import inflect
         inflection = inflect.engine()
 
         # local reference to instance fields used to "inject" into dynamically generated class methods
         def get_graph():
             return self._graph
 
+        nodes_index = self._nodes_index
+        nodes_of_type = self._nodes_of_type
+        edges_index = self._edges_index
+
+        def get_measures():
+            return self._measures
+
         graphql_types = self._graphql_types
 
         # region - Defining GraphQL Query Class dict
@@ -360,103 +753,126 @@ class GraphQLBuilder(NetworkxBuilder):
 
         # region - Defining GraphQL Query Class dict - graph field
         def graphql_graph(self) -> GraphQLBuilder.Graph:
-            return GraphQLBuilder.Graph(nx_graph=get_graph())
+            return GraphQLBuilder.Graph(nx_graph=get_graph(), measures=get_measures())
 
         self.add_field_resolver(query_class_dict, 'graph', graphql_graph)
 
         # endregion
 
         # region - Defining GraphQL Query Class dict - nodes field
-        def graph_nodes_resolver(
-                graphql_type: type[GraphQLBuilder.GraphNode] | None = None,
-                node_type: str | None = None
-        ) -> Callable[[strawberry.ID | None], list[GraphQLBuilder.GraphNode]]:
+        def node_items(node_id: strawberry.ID | None, node_type: str | None) -> Iterable[tuple]:
+            decoded_node_id = node_id and decode_node_id(node_id)
 
-            def graph_nodes(self,
-                            node_id: strawberry.ID | None = strawberry.UNSET) -> list[GraphQLBuilder.GraphNode]:
+            graph = get_graph()
 
-                decoded_node_id = node_id and decode_node_id(node_id)
+            if decoded_node_id:
+                node_data = GraphQLBuilder._node_data(graph, decoded_node_id)
+                items = [(decoded_node_id, node_data)] if node_data is not None else []
+                if node_type:
+                    items = [(n, d) for n, d in items if d['type'] == node_type]
+                return items
 
-                graph = get_graph()
+            if node_type:
+                nodes = graph.nodes
+                return ((n, nodes[n]) for n in nodes_of_type(node_type).ids)
 
-                if graphql_type:
-                    nodes = (GraphQLBuilder._graph_node(graphql_type, n, d)
-                             for n, d in graph.nodes(data=True))
-                else:
-                    nodes = (GraphQLBuilder._graph_node(graphql_types.get(d['type']), n, d)
-                             for n, d in graph.nodes(data=True))
+            return graph.nodes(data=True)
 
-                def filter_node(node):
-                    output = True
-                    if node_type:
-                        output = node.type.lower() == node_type
+        def graph_nodes_resolvers(
+                graphql_type: type[GraphQLBuilder.GraphNode] | None = None,
+                node_type: str | None = None
+        ) -> tuple[Callable[..., list[GraphQLBuilder.GraphNode]], Callable[..., GraphQLBuilder.Connection]]:
 
-                    if decoded_node_id:
-                        output = output and (decode_node_id(node.id) == decoded_node_id)
+            def graph_node(item: tuple) -> GraphQLBuilder.GraphNode:
+                n, d = item
+                return GraphQLBuilder._load_graph_node(graphql_type or graphql_types.get(d['type']), n, d)
 
-                    return output
+            def graph_nodes(self,
+                            node_id: strawberry.ID | None = strawberry.UNSET) -> list[GraphQLBuilder.GraphNode]:
+                return [graph_node(item) for item in node_items(node_id, node_type)]
 
-                items = [node for node in nodes if filter_node(node)]
+            def graph_nodes_connection(
+                    self,
+                    node_id: strawberry.ID | None = strawberry.UNSET,
+                    first: int | None = None,
+                    after: str | None = None) -> GraphQLBuilder.Connection[GraphQLBuilder.GraphNode]:
+                if node_id:
+                    return GraphQLBuilder._connection(node_items(node_id, node_type), graph_node, first, after)
 
-                return items
+                nodes = get_graph().nodes
+                index = nodes_of_type(node_type) if node_type else nodes_index()
+                return GraphQLBuilder._connection(index.ids, lambda n: graph_node((n, nodes[n])), first, after,
+                                                  key=_identity, positions=index.positions)
 
-            return graph_nodes
+            return graph_nodes, graph_nodes_connection
 
-        self.add_field_resolver(query_class_dict, 'nodes', graph_nodes_resolver())
+        graph_nodes, graph_nodes_connection = graph_nodes_resolvers()
+        self.add_field_resolver(query_class_dict, 'nodes', graph_nodes)
+        self.add_field_resolver(query_class_dict, 'nodes_connection', graph_nodes_connection)
 
         # endregion
 
         # region - Defining GraphQL Query Class dict - edges field
-        def graph_edges_resolver() -> Callable[[strawberry.ID | None], list[GraphQLBuilder.GraphEdge]]:
+        def graph_edges_resolvers() -> tuple[Callable[..., list[GraphQLBuilder.GraphEdge]],
+                                             Callable[..., GraphQLBuilder.Connection]]:
 
             graph_edge = self._graph_edge
 
-            def graph_edges(self,
-                            edge_id: strawberry.ID | None = strawberry.UNSET) -> list[GraphQLBuilder.GraphEdge]:
+            def edge_items(edge_id: strawberry.ID | None) -> Iterable[tuple]:
                 decoded_edge_id = edge_id and decode_edge_id(edge_id)
 
                 graph = get_graph()
 
-                edges = (graph_edge((source, target), data) for source, target, data in graph.edges(data=True))
-
-                def filter_edge(edge):
-                    output = True
-                    if decoded_edge_id:
-                        output = decode_edge_id(edge.id) == decoded_edge_id
-
-                    return output
+                if decoded_edge_id:
+                    return GraphQLBuilder._edge_items(graph, decoded_edge_id)
 
-                return [edge for edge in edges if filter_edge(edge)]
+                return graph.edges(data=True)
 
-            return graph_edges
+            def materialize_edge(item: tuple) -> GraphQLBuilder.GraphEdge:
+                return graph_edge(item[:2], item[-1])
 
-        self.add_field_resolver(query_class_dict, 'edges', graph_edges_resolver())
+            def graph_edges(self,
+                            edge_id: strawberry.ID | None = strawberry.UNSET) -> list[GraphQLBuilder.GraphEdge]:
+                return [materialize_edge(item) for item in edge_items(edge_id)]
+
+            def graph_edges_connection(
+                    self,
+                    edge_id: strawberry.ID | None = strawberry.UNSET,
+                    first: int | None = None,
+                    after: str | None = None) -> GraphQLBuilder.Connection[GraphQLBuilder.GraphEdge]:
+                if edge_id:
+                    return GraphQLBuilder._connection(edge_items(edge_id), materialize_edge, first, after,
+                                                      key=_edge_item_key)
+
+                edges = get_graph().edges
+                index = edges_index()
+                return GraphQLBuilder._connection(index.ids, lambda e: materialize_edge((*e, edges[e])), first, after,
+                                                  key=_identity, positions=index.positions)
+
+            return graph_edges, graph_edges_connection
+
+        graph_edges, graph_edges_connection = graph_edges_resolvers()
+        self.add_field_resolver(query_class_dict, 'edges', graph_edges)
+        self.add_field_resolver(query_class_dict, 'edges_connection', graph_edges_connection)
         # endregion
 
         # region - Defining GraphQL Query Class dict - fields for GraphQL types implementing 'GraphNode' interface
         for node_type, graphql_type in self._graphql_types.items():
             field_name = inflection.plural(node_type)
-            resolver = graph_nodes_resolver(graphql_type, node_type)
-            self.add_field_resolver(query_class_dict, field_name, resolver)
+            typed_graph_nodes, typed_graph_nodes_connection = graph_nodes_resolvers(graphql_type, node_type)
+            self.add_field_resolver(query_class_dict, field_name, typed_graph_nodes)
+            self.add_field_resolver(query_class_dict, f"{field_name}_connection", typed_graph_nodes_connection)
 
         # endregion
 
         # region - Defining GraphQL Query Class dict - field measure for 'GraphMeasure' GraphQL type
 
-        def graph_measure(self, measure: GraphQLBuilder.GraphMeasure) -> GraphQLBuilder.Measure:
-
-            graph = get_graph()
+        def graph_measure(self,
+                          measure: GraphQLBuilder.GraphMeasure,
+                          sample_size: int | None = None) -> GraphQLBuilder.Measure:
 
-            if isinstance(measure.value, str):
-                method = measure.value
-                module = nx
-            else:
-                method = measure.value[1]
-                module = importlib.import_module(measure.value[0])
-
-            value_getter = operator.attrgetter(method)(module)
-            value = float(value_getter(graph))
-            return GraphQLBuilder.Measure(name=measure.name, value=value)
+            value = GraphQLBuilder._resolve_measure(get_measures(), measure, sample_size)
+            return then(value, lambda v: GraphQLBuilder.Measure(name=measure.name, value=float(v)))
 
         # query_class_dict['measure'] = strawberry.field(resolver=graph_measure)
         # query_class_dict['__annotations__']['measure'] = float | int
@@ -474,13 +890,18 @@ class GraphQLBuilder(NetworkxBuilder):
 
     def _graphql_mutation(self):
 
-        refresh_graph = functools.partial(super().build, **self._cached_build_kwargs)
+        refresh_graph = self.refresh
+        arefresh_graph = self.arefresh
 
         @strawberry.type
         class Mutation:
 
             @strawberry.mutation
             def refresh(self) -> bool:
+                # within an event loop (e.g., the GraphQL server), the graph is rebuilt without blocking it
+                if in_event_loop():
+                    return then(arefresh_graph(), lambda _: True)
+
                 refresh_graph()
                 return True
 
@@ -495,24 +916,42 @@ class GraphQLBuilder(NetworkxBuilder):
             extensions=[
                 ParserCache(maxsize=100),
                 QueryDepthLimiter(max_depth=10),
-                ValidationCache(maxsize=100)
+                ValidationCache(maxsize=100),
+                _GraphNodeLoader
             ]
         )
 
     def build(self,
               node_value_graphql_type_supplier: Callable[[str], StrawberryType | None] | None = None,
+              precomputed_measures: Iterable['GraphQLBuilder.GraphMeasure'] = (),
+              measure_executor: Executor | None = None,
+              measure_timeout: float | None = None,
               **kwargs: Any) -> strawberry.Schema:
         """
 
         Args:
             node_value_graphql_type_supplier: Callable[[str], StrawberryType]]
+            precomputed_measures: GraphMeasures to compute in a background thread right after the build (and after
+                                  each refresh), so they are cached before they are queried. Defaults to none.
+            measure_executor: the executor computing measures when the schema is executed asynchronously (e.g., by
+                              the GraphQL server). Defaults to None (i.e., a process per computation, which is
+                              terminated once no query waits for it anymore).
+            measure_timeout: maximal number of seconds an asynchronously executed query waits for a measure.
+                             Defaults to None (i.e., no limit).
             **kwargs:
 
         Returns:
             Strawberry GraphQL Schema
         """
+        if kwargs.get('timestamp') is Timestamp.COUNTER:
+            raise ValueError("Invalid timestamp: Timestamp.COUNTER. GraphQL 'created' and 'updated' are datetimes.")
+
         super().build(**kwargs)
 
+        self._clear_indexes()
         self._node_value_graphql_type_supplier = node_value_graphql_type_supplier
+        self._measures = MeasureCache(self._graph, measure_executor, measure_timeout)
+        self._precomputed_measures = tuple(precomputed_measures)
+        self._precompute_measures()
 
         return self.schema()
@@ -1,5 +1,14 @@
-from collections import Counter
-from collections.abc import Hashable, Mapping
+import asyncio
+import copy
+import inspect
+import itertools
+import sys
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Union
 
 import networkx as nx
@@ -7,12 +16,134 @@ from loguru import logger
 from mappingtools.transformers import simplify
 
 from .. import color
-from ..enums import GraphType, Multiplicity
-from ..modeling import GraphModel
+from ..enums import GraphType, Multiplicity, Timestamp
+from ..modeling import GraphModel, NodeModel
 from ..tools import utcnow
-from ..typing import NodeTypeAbsoluteId, UniverseNode
+from ..typing import Edge, Element, Node, NodeTypeAbsoluteId, UniverseNode
 from .builder import Builder
 
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Starts consuming a generator with the given kwargs and returns a handle (Task or Future) of its elements.
+Spawn = Callable[[Callable, dict[str, Any]], Union[asyncio.Task, Future]]
+
+
+@lru_cache(maxsize=1024)
+def _type_name(name: str) -> str:
+    """The lowercase, interned name of a node or edge type, so all the elements of a type share one string."""
+    return sys.intern(name.lower())
+
+
+def _pooled(pool: dict[str, str], label: Any) -> Any:
+    """Replace a string label with an equal string from the pool, so repeated labels share one string.
+
+    The pool only lives while a graph is populated, and only model labels (i.e., constant or computed from node
+    values) are pooled, as labels defaulting to node keys do not repeat.
+    """
+    return pool.setdefault(label, label) if type(label) is str else label
+
+
+@dataclass
+class _ElementIds:
+    """IDs of graph nodes and edges."""
+
+    nodes: set[Hashable] = field(default_factory=set)
+    edges: set[tuple[Hashable, Hashable]] = field(default_factory=set)
+
+    def update(self, other: '_ElementIds'):
+        self.nodes |= other.nodes
+        self.edges |= other.edges
+
+
+@dataclass
+class _GeneratorRun:
+    """A call of a versioned generator: its version, its elements and the IDs of the graph elements they produced.
+
+    Args:
+        version: the version of the generator for the call arguments.
+        elements: the elements the generator yielded.
+        ids: the IDs of the graph elements the elements produced.
+        rerun: was the generator called in the current build (rather than reusing a previous call).
+    """
+
+    version: Hashable
+    elements: list[Element]
+    ids: _ElementIds = field(default_factory=_ElementIds)
+    rerun: bool = True
+
+
+class _GeneratorRuns:
+    """The calls of the versioned generators of a build, so a refresh can skip generators whose version is unchanged.
+
+    Args:
+        versions: the version functions of the versioned generators.
+        previous: the runs of the previous build, whose calls are reused if their version is unchanged.
+                  Defaults to None (i.e., every generator is called).
+    """
+
+    def __init__(self, versions: Mapping[Callable, Callable[..., Hashable]], previous: '_GeneratorRuns | None' = None):
+        self.versions = versions
+        self.previous = previous
+        self.runs: dict[tuple, _GeneratorRun] = {}
+        self.unversioned_ids = _ElementIds()
+        self._lock = threading.Lock()
+
+    def key(self, generator: Callable, kwargs: dict[str, Any]) -> tuple | None:
+        """Return the key of a call of a versioned generator, or None if it is not versioned or its arguments are
+        unhashable."""
+        if generator not in self.versions:
+            return None
+
+        key = (generator, tuple(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def run(self, key: tuple, version: Hashable) -> _GeneratorRun | None:
+        """Return the run of a call in this build, or reuse the run of the previous build if its version is unchanged.
+
+        Returns:
+            The run, or None if the generator has to be called.
+        """
+        with self._lock:
+            run = self.runs.get(key)
+            if run is None and self.previous is not None:
+                previous_run = self.previous.runs.get(key)
+                if previous_run is not None and previous_run.version == version:
+                    run = self.runs[key] = _GeneratorRun(version, previous_run.elements, previous_run.ids, rerun=False)
+        return run
+
+    def record(self, key: tuple, version: Hashable, elements: list[Element]) -> _GeneratorRun:
+        """Record the elements of a call of a generator in this build."""
+        with self._lock:
+            run = self.runs[key] = _GeneratorRun(version, elements)
+        return run
+
+    def changed_ids(self) -> _ElementIds:
+        """Return the IDs of the graph elements that may differ from the previous build, and release it.
+
+        These are the elements produced (in either build) by unversioned generators, by generators that were called
+        again, and by calls of the previous build that were not reused. Other elements were produced by the same
+        elements of the same calls in both builds.
+        """
+        ids = _ElementIds()
+        ids.update(self.unversioned_ids)
+        for run in self.runs.values():
+            if run.rerun:
+                ids.update(run.ids)
+
+        if self.previous is not None:
+            ids.update(self.previous.unversioned_ids)
+            for key, previous_run in self.previous.runs.items():
+                run = self.runs.get(key)
+                if run is None or run.rerun:
+                    ids.update(previous_run.ids)
+            self.previous = None
+
+        return ids
+
 
 class NetworkxBuilder(Builder):
     """Build a NetworkX Graph"""
@@ -20,10 +151,36 @@ class NetworkxBuilder(Builder):
     def __init__(self, model: GraphModel, graph_type: GraphType = GraphType.Graph):
         super().__init__(model, graph_type)
         self._graph: nx.Graph | None = None
+        self._clock: Callable[[], Any] | None = utcnow
+        self._trace: bool = False
+        self._labels: dict[str, str] = {}
+        self._summary: defaultdict[tuple[str, str], Counter] = defaultdict(Counter)
+        self._runs: _GeneratorRuns | None = None
+        self._reused_runs: _GeneratorRuns | None = None
 
     def _initialize_graph(self):
         """Initialize an empty NetworkX graph with metadata and default attributes."""
         self._graph: nx.Graph = self.graph_type.value(name=self.model.name, node_types=Counter(), edge_types=Counter())
+        self._summary = defaultdict(Counter)
+        self._labels = {}
+        versions = self.model.versions
+        self._runs = _GeneratorRuns(versions, self._reused_runs) if versions else None
+
+    @staticmethod
+    def _timestamp_clock(timestamp: Timestamp) -> Callable[[], Any] | None:
+        """Return a callable that supplies `created`/`updated` values, or None if they are omitted."""
+        match timestamp:
+            case Timestamp.ELEMENT:
+                return utcnow
+            case Timestamp.BUILD:
+                build_timestamp = utcnow()
+                return lambda: build_timestamp
+            case Timestamp.COUNTER:
+                return itertools.count().__next__
+            case Timestamp.NONE:
+                return None
+            case _:
+                raise ValueError(f"Invalid timestamp: {timestamp}")
 
     def _graph_edges(self, data, default=None):
         params = {'data': data, 'default': default}
@@ -54,88 +211,342 @@ class NetworkxBuilder(Builder):
 
     def _populate_nodes(self, node_type_absolute_id: NodeTypeAbsoluteId, **kwargs: Any):
         """Populate graph nodes based on the provided model and ID."""
+        parent_node_id = self._parent_node_id(node_type_absolute_id, **kwargs)
         for node_model in self.model.node_models[node_type_absolute_id]:
-            unique = node_model.uniqueness
-            node_model_label = node_model.label
-            is_label_callable = callable(node_model_label)
-
-            parent_node_id = self._parent_node_id(node_type_absolute_id, **kwargs)
+            nodes, ids = self._generate(node_model.generator, kwargs)
+            for child_kwargs in self._add_nodes(node_model, parent_node_id, nodes, ids, **kwargs):
+                self._populate_node_type(node_model.type, **child_kwargs)
 
-            for node in node_model.generator(**kwargs):
-                node_lineage = (*parent_node_id, node.key) if parent_node_id is not UniverseNode else (node.key,)
-                node_id = (node.key,) if unique else node_lineage
+    def _generate(self, generator: Callable, kwargs: dict[str, Any]) -> tuple[Iterable[Element], _ElementIds | None]:
+        """Call a generator, unless it is versioned and the elements of a call with the same version can be reused.
 
-                label = node.key
-                if node_model_label is not None:
-                    label = node_model_label(node.value) if is_label_callable else node_model_label
-
-                node_type = node.__class__.__name__.lower()
-                if node_type == 'tuple':
-                    node_type = node_model.type.lower()
+        Returns:
+            The elements, and the IDs to collect the IDs of the graph elements they produce into (None if these are
+            already known or not needed).
+        """
+        runs = self._runs
+        if runs is None:
+            return generator(**kwargs), None
+
+        key = runs.key(generator, kwargs)
+        if key is None:
+            return generator(**kwargs), runs.unversioned_ids
+
+        version = runs.versions[generator](**kwargs)
+        run = runs.run(key, version) or runs.record(key, version, list(generator(**kwargs)))
+        return run.elements, run.ids if run.rerun else None
+
+    def _add_nodes(self,
+                   node_model: NodeModel,
+                   parent_node_id: tuple | type[UniverseNode],
+                   nodes: Iterable[Node],
+                   ids: _ElementIds | None,
+                   **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """Add nodes to the graph.
 
-                if node_id in self._graph:
+        Args:
+            node_model: the NodeModel of the nodes.
+            parent_node_id: the ID of the parent node of the nodes.
+            nodes: the nodes to add.
+            ids: collects the IDs of the added and updated nodes and edges, unless None.
+            **kwargs: the generator arguments the nodes were generated with.
+
+        Yields:
+            The generator arguments for the children of each added node.
+        """
+        unique = node_model.uniqueness
+        node_model_label = node_model.label
+        is_label_callable = callable(node_model_label)
+        has_parent = node_model.parent_type is not UniverseNode
+        graph = self._graph
+        graph_nodes = graph.nodes
+        add_node, add_edge = graph.add_node, graph.add_edge
+        node_types = graph.graph['node_types']
+        labels = self._labels
+        clock = self._clock
+        trace = self._trace
+        added = updated = 0
+
+        for node in nodes:
+            node_lineage = (*parent_node_id, node.key) if parent_node_id is not UniverseNode else (node.key,)
+            node_id = (node.key,) if unique else node_lineage
+
+            label = node.key
+            if node_model_label is not None:
+                label = _pooled(labels, node_model_label(node.value) if is_label_callable else node_model_label)
+
+            node_type = self._node_type(node_model, node)
+
+            attributes = graph_nodes.get(node_id)
+            if attributes is not None:
+                if trace:
                     logger.debug('Updating node. ID: {}, Label: {}', node_id, label)
 
-                    match node_model.multiplicity:
-                        case Multiplicity.ADD:
-                            self._graph.nodes[node_id]['value'] = [self._graph.nodes[node_id]['value'] + node.value]
-                        case Multiplicity.ALL:
-                            self._graph.nodes[node_id]['value'].append(node.value)
-                        case Multiplicity.FIRST:
-                            ...
-                        case Multiplicity.LAST:
-                            self._graph.nodes[node_id]['value'] = [node.value]
-
-                    self._graph.nodes[node_id]['magnitude'] += 1
-                    self._graph.nodes[node_id]['updated'] = utcnow()
-                else:
+                match node_model.multiplicity:
+                    case Multiplicity.ADD:
+                        attributes['value'] = [attributes['value'] + node.value]
+                    case Multiplicity.ALL:
+                        attributes['value'].append(node.value)
+                    case Multiplicity.FIRST:
+                        ...
+                    case Multiplicity.LAST:
+                        attributes['value'] = [node.value]
+
+                attributes['magnitude'] += 1
+                if clock:
+                    attributes['updated'] = clock()
+                updated += 1
+            else:
+                if trace:
                     logger.debug('Adding node. ID: {}, Label: {}', node_id, label)
-                    self._graph.add_node(
-                        node_id,
-                        label=label,
-                        type=node_type,
-                        value=[node.value],
-                        magnitude=1,
-                        lineage=list(node_lineage),
-                        created=utcnow(),
-                    )
-
-                    self._graph.graph['node_types'][node_type] += 1
-
-                if node_model.parent_type is not UniverseNode:
+                if clock:
+                    add_node(node_id, label=label, type=node_type, value=[node.value], magnitude=1,
+                             lineage=list(node_lineage), created=clock())
+                else:
+                    add_node(node_id, label=label, type=node_type, value=[node.value], magnitude=1,
+                             lineage=list(node_lineage))
+
+                node_types[node_type] += 1
+                added += 1
+
+            if ids is not None:
+                ids.nodes.add(node_id)
+                if has_parent:
+                    ids.nodes.add(parent_node_id)
+                    ids.edges.add((parent_node_id, node_id))
+
+            if has_parent:
+                if trace:
                     logger.debug('Adding edge. Source: {}, Target: {}', parent_node_id, node_id)
-                    self._graph.add_edge(parent_node_id, node_id, created=utcnow())
+                if clock:
+                    add_edge(parent_node_id, node_id, created=clock())
+                else:
+                    add_edge(parent_node_id, node_id)
+
+            yield self._child_kwargs(node_type, node, kwargs)
 
-                new_kwargs = kwargs.copy()
-                new_kwargs[f'{node_type}_id'] = node.key
-                self._populate_node_type(node_model.type, **new_kwargs)
+        self._summarize('nodes', node_model.type, added, updated)
+
+    @staticmethod
+    def _node_type(node_model: NodeModel, node: Node) -> str:
+        node_type = _type_name(node.__class__.__name__)
+        if node_type == 'tuple':
+            node_type = _type_name(node_model.type)
+        return node_type
+
+    @staticmethod
+    def _child_kwargs(node_type: str, node: Node, kwargs: dict[str, Any]) -> dict[str, Any]:
+        child_kwargs = kwargs.copy()
+        child_kwargs[f'{node_type}_id'] = node.key
+        return child_kwargs
 
     def _populate_edges(self, **kwargs: Any):
         """Populate graph edges based on defined connections."""
         for edge_model, edge_generators in self.model.edge_generators.items():
             logger.debug("Adding from {}", edge_model)
             for edge_generator in edge_generators:
-                for edge in edge_generator(**kwargs):
-                    edge_id = ((edge.source,), (edge.target,))
-                    edge_label = edge.label(edge_id) if callable(edge.label) else edge.label
-                    edge_weight = edge.weight or 1.0
-                    edge_type = edge.type.lower()
-                    logger.debug('Adding edge. Source: {}, Target: {}', *edge_id)
-
-                    if isinstance(self._graph, nx.MultiGraph) or edge_id not in self._graph.edges:
-                        self._graph.add_edge(
-                            *edge_id,
-                            label=edge_label,
-                            type=edge_type,
-                            value=[edge.value],
-                            weight=edge_weight,
-                            created=utcnow(),
-                        )
-                        self._graph.graph['edge_types'][edge_type] += 1
-                    else:
-                        self._graph.edges[edge_id]['value'].append(edge.value)
-                        self._graph.edges[edge_id]['weight'] += edge_weight
-                        self._graph.edges[edge_id]['updated'] = utcnow()
+                self._add_edges(*self._generate(edge_generator, kwargs), edge_model)
+
+    def _add_edges(self, edges: Iterable[Edge], ids: _ElementIds | None = None, edge_model: str = 'edge'):
+        """Add edges to the graph.
+
+        Args:
+            edges: the edges to add.
+            ids: collects the IDs of the added and updated edges and their nodes, unless None.
+            edge_model: the name of the edge model the edges were generated by.
+        """
+        graph = self._graph
+        is_multigraph = graph.is_multigraph()
+        get_edge_data, add_edge = graph.get_edge_data, graph.add_edge
+        edge_types = graph.graph['edge_types']
+        clock = self._clock
+        trace = self._trace
+        added = updated = 0
+
+        for edge in edges:
+            source, target = (edge.source,), (edge.target,)
+            edge_label = edge.label((source, target)) if callable(edge.label) else edge.label
+            edge_weight = edge.weight or 1.0
+            edge_type = _type_name(edge.type)
+            if trace:
+                logger.debug('Adding edge. Source: {}, Target: {}', source, target)
+
+            if ids is not None:
+                ids.nodes.update((source, target))
+                ids.edges.add((source, target))
+
+            # every added edge of a multigraph is a new parallel edge
+            attributes = None if is_multigraph else get_edge_data(source, target)
+            if attributes is None:
+                if clock:
+                    add_edge(source, target, label=edge_label, type=edge_type, value=[edge.value],
+                             weight=edge_weight, created=clock())
+                else:
+                    add_edge(source, target, label=edge_label, type=edge_type, value=[edge.value],
+                             weight=edge_weight)
+                edge_types[edge_type] += 1
+                added += 1
+            else:
+                attributes['value'].append(edge.value)
+                attributes['weight'] += edge_weight
+                if clock:
+                    attributes['updated'] = clock()
+                updated += 1
+
+        self._summarize('edges', edge_model, added, updated)
+
+    def _summarize(self, kind: str, model_type: str, added: int, updated: int):
+        """Accumulate the number of elements added and updated by a generator."""
+        counts = self._summary[(kind, model_type)]
+        counts['added'] += added
+        counts['updated'] += updated
+
+    def _log_summary(self):
+        """Log a single line per generator with the number of elements it added and updated."""
+        for (kind, model_type), counts in self._summary.items():
+            logger.debug('Populated {}. Model: {}, Added: {}, Updated: {}',
+                         kind, model_type, counts['added'], counts['updated'])
+
+    # region - Concurrent Population
+
+    def _fetch(self, generator: Callable, kwargs: dict[str, Any]) -> tuple[list[Element], _ElementIds | None]:
+        """Consume an element generator (see `_generate`)."""
+        elements, ids = self._generate(generator, kwargs)
+        return list(elements), ids
+
+    def _spawn_node_type(self,
+                         spawn: Spawn,
+                         node_type: Union[Hashable, UniverseNode] = UniverseNode,
+                         **kwargs: Any) -> list[tuple]:
+        """Start fetching the nodes of all children types of a node type.
+
+        Returns:
+            A list of (NodeModel, parent node ID, generator kwargs, Task or Future) tuples in population order.
+            The Tasks and Futures return (nodes, IDs) tuples (see `_generate`).
+        """
+        invocations = []
+        for parent_node_type, child_node_types in self.model.node_children_types(node_type).items():
+            for child_node_type in child_node_types:
+                node_type_absolute_id = (parent_node_type, child_node_type)
+                parent_node_id = self._parent_node_id(node_type_absolute_id, **kwargs)
+                for node_model in self.model.node_models[node_type_absolute_id]:
+                    pending = spawn(node_model.generator, kwargs)
+                    invocations.append((node_model, parent_node_id, kwargs, pending))
+
+        return invocations
+
+    def _spawn_children(self, spawn: Spawn, node_model: NodeModel, nodes: list[Node], kwargs: dict[str, Any]):
+        return [
+            self._spawn_node_type(spawn,
+                                  node_model.type,
+                                  **self._child_kwargs(self._node_type(node_model, node), node, kwargs))
+            for node in nodes
+        ]
+
+    def _merge_nodes(self, spawn: Spawn, invocations: list[tuple]):
+        """Add fetched nodes to the graph in the same order as the sequential population.
+
+        The children of all fetched nodes are spawned before descending into them, so generator calls
+        of sibling nodes overlap, while the graph itself is only updated by the calling thread.
+        """
+        for node_model, parent_node_id, kwargs, future in invocations:
+            nodes, ids = future.result()
+            children_invocations = self._spawn_children(spawn, node_model, nodes, kwargs)
+            added_nodes = self._add_nodes(node_model, parent_node_id, nodes, ids, **kwargs)
+            for _, child_invocations in zip(added_nodes, children_invocations):
+                self._merge_nodes(spawn, child_invocations)
+
+    def _populate_concurrently(self, max_workers: int, **kwargs: Any):
+        """Populate graph nodes and edges, consuming their generators in a thread pool."""
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='graphinate') as executor:
+
+            def spawn(generator: Callable, generator_kwargs: dict[str, Any]) -> Future:
+                return executor.submit(self._fetch, generator, generator_kwargs)
+
+            try:
+                edge_futures = [
+                    (edge_model, spawn(edge_generator, kwargs))
+                    for edge_model, edge_generators in self.model.edge_generators.items()
+                    for edge_generator in edge_generators
+                ]
+
+                self._merge_nodes(spawn, self._spawn_node_type(spawn, UniverseNode, **kwargs))
+
+                for edge_model, future in edge_futures:
+                    logger.debug("Adding from {}", edge_model)
+                    self._add_edges(*future.result(), edge_model)
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    # endregion - Concurrent Population
+
+    # region - Asynchronous Population
+
+    async def _afetch(self,
+                      limiter: asyncio.Semaphore,
+                      generator: Callable,
+                      kwargs: dict[str, Any]) -> tuple[list[Element], _ElementIds | None]:
+        """Consume a (sync or async) element generator while holding a concurrency slot (see `_generate`).
+
+        Sync generators are consumed in a worker thread, so they do not block the event loop.
+        """
+        async with limiter:
+            if not inspect.isasyncgenfunction(generator):
+                return await asyncio.to_thread(self._fetch, generator, kwargs)
+
+            runs = self._runs
+            key = runs and runs.key(generator, kwargs)
+            if key is None:
+                return [element async for element in generator(**kwargs)], runs and runs.unversioned_ids
+
+            version = runs.versions[generator](**kwargs)
+            if inspect.isawaitable(version):
+                version = await version
+
+            run = runs.run(key, version) or runs.record(key, version, [e async for e in generator(**kwargs)])
+            return run.elements, run.ids if run.rerun else None
+
+    async def _amerge_nodes(self, spawn: Spawn, invocations: list[tuple]):
+        """Add fetched nodes to the graph in the same order as the sequential population.
+
+        See `_merge_nodes`. Here the graph is only updated by the calling coroutine.
+        """
+        for node_model, parent_node_id, kwargs, task in invocations:
+            nodes, ids = await task
+            children_invocations = self._spawn_children(spawn, node_model, nodes, kwargs)
+            added_nodes = self._add_nodes(node_model, parent_node_id, nodes, ids, **kwargs)
+            for _, child_invocations in zip(added_nodes, children_invocations):
+                await self._amerge_nodes(spawn, child_invocations)
+
+    async def _apopulate(self, max_concurrency: int, **kwargs: Any):
+        """Populate graph nodes and edges, consuming their generators concurrently."""
+        limiter = asyncio.Semaphore(max_concurrency)
+        tasks: set[asyncio.Task] = set()
+
+        def spawn(generator: Callable, generator_kwargs: dict[str, Any]) -> asyncio.Task:
+            task = asyncio.create_task(self._afetch(limiter, generator, generator_kwargs))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            return task
+
+        try:
+            edge_tasks = [
+                (edge_model, spawn(edge_generator, kwargs))
+                for edge_model, edge_generators in self.model.edge_generators.items()
+                for edge_generator in edge_generators
+            ]
+
+            await self._amerge_nodes(spawn, self._spawn_node_type(spawn, UniverseNode, **kwargs))
+
+            for edge_model, task in edge_tasks:
+                logger.debug("Adding from {}", edge_model)
+                self._add_edges(*await task, edge_model)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # endregion - Asynchronous Population
 
     def _apply_defaults(self, elements_iter, defaults: Mapping, is_node: bool):
         """Apply defaults to elements in a single pass."""
@@ -213,32 +624,268 @@ class NetworkxBuilder(Builder):
 
         self._graph.graph['created'] = utcnow()
 
-    def _rectify_model(self, node_attributes: Mapping):
-        default_type = node_attributes.get('type')
-        default_label = node_attributes.get('label')
-        self.model.rectify(_type=default_type, parent_type=default_type, label=default_label)
+    @staticmethod
+    def _patch_attributes(attributes: dict[str, Any], new_attributes: Mapping[str, Any]) -> bool:
+        """Replace element attributes in place, keeping the original `created` attribute.
+
+        Returns:
+            True if any attribute other than `created`/`updated` changed, False otherwise.
+        """
+        def comparable(a: Mapping[str, Any]) -> dict[str, Any]:
+            return {k: v for k, v in a.items() if k not in ('created', 'updated')}
+
+        if comparable(attributes) == comparable(new_attributes):
+            return False
+
+        created = attributes.get('created')
+        attributes.clear()
+        attributes.update(new_attributes)
+        if created is not None:
+            attributes['created'] = created
+        return True
+
+    def _patch_graph(self, graph: nx.Graph, ids: _ElementIds | None = None) -> Counter:
+        """Patch the current graph in place so that it has the same elements and attributes as the given graph.
+
+        Args:
+            graph: the graph to patch the current graph to.
+            ids: the IDs of the only nodes and edges that may differ between the graphs. Defaults to None
+                 (i.e., all the nodes and edges are compared).
+
+        Returns:
+            Counter of added, updated and removed nodes and edges.
+        """
+        if ids is not None:
+            return self._patch_elements(graph, ids)
+
+        current = self._graph
+        changes = Counter()
+
+        stale_nodes = [node for node in current if node not in graph]
+        current.remove_nodes_from(stale_nodes)
+        changes['removed nodes'] = len(stale_nodes)
+
+        stale_edges = [edge for *edge, _ in self._graph_edges(data=True) if not graph.has_edge(*edge)]
+        current.remove_edges_from(stale_edges)
+        changes['removed edges'] = len(stale_edges)
+
+        for node, data in graph.nodes(data=True):
+            attributes = current.nodes.get(node)
+            if attributes is None:
+                current.add_node(node, **data)
+                changes['added nodes'] += 1
+            elif self._patch_attributes(attributes, data):
+                changes['updated nodes'] += 1
+
+        edges = graph.edges(data=True, keys=True) if graph.is_multigraph() else graph.edges(data=True)
+        for *edge, data in edges:
+            attributes = current.get_edge_data(*edge)
+            if attributes is None:
+                current.add_edge(*edge, **data)
+                changes['added edges'] += 1
+            elif self._patch_attributes(attributes, data):
+                changes['updated edges'] += 1
+
+        current.graph.update(graph.graph)
+        return changes
+
+    @staticmethod
+    def _parallel_edges(graph: nx.Graph, source: Hashable, target: Hashable) -> dict[Hashable, dict[str, Any]]:
+        """Return the data of the edges between two nodes by edge key (a None key for graphs without parallel edges)."""
+        data = graph.get_edge_data(source, target)
+        if data is None:
+            return {}
+        return dict(data) if graph.is_multigraph() else {None: data}
+
+    def _patch_elements(self, graph: nx.Graph, ids: _ElementIds) -> Counter:
+        """Patch only the given nodes and edges of the current graph (see `_patch_graph`)."""
+        current = self._graph
+        changes = Counter()
+
+        for node in ids.nodes:
+            data = graph.nodes.get(node)
+            attributes = current.nodes.get(node)
+            if data is None:
+                if attributes is not None:
+                    current.remove_node(node)
+                    changes['removed nodes'] += 1
+            elif attributes is None:
+                current.add_node(node, **data)
+                changes['added nodes'] += 1
+            elif self._patch_attributes(attributes, data):
+                changes['updated nodes'] += 1
+
+        for source, target in ids.edges:
+            current_edges = self._parallel_edges(current, source, target)
+            for key, data in self._parallel_edges(graph, source, target).items():
+                attributes = current_edges.pop(key, None)
+                if attributes is None:
+                    current.add_edge(source, target, *(() if key is None else (key,)), **data)
+                    changes['added edges'] += 1
+                elif self._patch_attributes(attributes, data):
+                    changes['updated edges'] += 1
+
+            for key in current_edges:
+                current.remove_edge(source, target, *(() if key is None else (key,)))
+                changes['removed edges'] += 1
+
+        current.graph.update(graph.graph)
+        return changes
+
+    def _rebuilder(self) -> 'NetworkxBuilder':
+        """Return a copy of the builder that rebuilds the graph, reusing the unchanged generator calls of the last
+        build.
+
+        The copy builds a new graph, so the current graph remains the graph of this builder, complete, until it is
+        patched in place (and also if the rebuild fails).
+        """
+        rebuilder = copy.copy(self)
+        rebuilder._reused_runs = self._runs
+        return rebuilder
+
+    def refresh(self) -> nx.Graph:
+        """Rebuild the graph using the arguments of the last build and patch the current graph in place.
+
+        Unlike a new build, the graph object is kept, so references to it stay valid. Elements that no longer
+        exist are removed, new elements are added and the attributes of changed elements are replaced, while
+        the original `created` attribute of existing elements is kept.
+
+        Versioned generators (see `GraphModel.node`) are not called again for arguments whose version did not
+        change. Their previous elements are reused, and only the graph elements produced by other generator calls
+        are compared and patched.
+
+        Like `build`, this method cannot be called from a running event loop for models with async generators.
+        Use `arefresh` instead.
 
-    def _build_graph(self, node_attributes: Mapping, **kwargs: Any):
+        Returns:
+            The patched NetworkX Graph
+        """
+        rebuilder = self._rebuilder()
+        graph = NetworkxBuilder.build(rebuilder, **self._cached_build_kwargs)
+        return self._patch_refreshed(rebuilder, graph)
+
+    async def arefresh(self) -> nx.Graph:
+        """Asynchronously rebuild the graph using the arguments of the last build and patch the current graph in place.
+
+        Same as `refresh`, but the graph is rebuilt with `abuild`, so models with async generators can be refreshed
+        within a running event loop, and sync generators are consumed in worker threads.
+
+        Returns:
+            The patched NetworkX Graph
+        """
+        rebuilder = self._rebuilder()
+        kwargs = {k: v for k, v in self._cached_build_kwargs.items() if k != 'max_workers'}
+        graph = await NetworkxBuilder.abuild(rebuilder, **kwargs)
+        return self._patch_refreshed(rebuilder, graph)
+
+    def _patch_refreshed(self, rebuilder: 'NetworkxBuilder', graph: nx.Graph) -> nx.Graph:
+        """Patch the current graph (if any) in place to match the graph the rebuilder built."""
+        runs = self._runs = rebuilder._runs
+        ids = runs.changed_ids() if runs is not None and runs.previous is not None else None
+        if self._graph is None:
+            self._graph = graph
+            return graph
+
+        if ids is not None and list(self._graph.graph['node_types']) != list(graph.graph['node_types']):
+            ids = None  # node colors are assigned by the order of the node types, so any node may change
+
+        changes = self._patch_graph(graph, ids)
+        logger.debug('Refreshed graph. Changes: {}', dict(changes))
+        return self._graph
+
+    def _build_graph(self, node_attributes: Mapping, max_workers: int | None = None, **kwargs: Any):
+        if self.model.is_async:
+            asyncio.run(self._abuild_graph(node_attributes, DEFAULT_MAX_CONCURRENCY, **kwargs))
+            return
+
+        self._initialize_graph()
+        try:
+            if max_workers is None:
+                self._populate_node_type(**kwargs)
+                self._populate_edges(**kwargs)
+            else:
+                self._populate_concurrently(max_workers, **kwargs)
+        finally:
+            self._labels = {}  # the graph keeps the pooled labels; the pool itself is only needed while populating
+        self._log_summary()
+        self._finalize_graph(**node_attributes)
+
+    async def _abuild_graph(self, node_attributes: Mapping, max_concurrency: int, **kwargs: Any):
         self._initialize_graph()
-        self._populate_node_type(**kwargs)
-        self._populate_edges(**kwargs)
+        try:
+            await self._apopulate(max_concurrency, **kwargs)
+        finally:
+            self._labels = {}
+        self._log_summary()
         self._finalize_graph(**node_attributes)
 
-    def build(self, **kwargs: Any) -> nx.Graph:
+    def build(self,
+              max_workers: int | None = None,
+              timestamp: Timestamp = Timestamp.ELEMENT,
+              trace: bool = False,
+              **kwargs: Any) -> nx.Graph:
         """Build a NetworkX graph representation.
 
+        Models with async generators are built using `asyncio.run`, hence this method cannot be called
+        from a running event loop for such models. Use `abuild` instead.
+
+        Args:
+            max_workers: opt-in number of worker threads. If given, the generators of sibling nodes
+                         (i.e., children of the same parent node) and edge generators are consumed concurrently
+                         in a thread pool. The graph itself is updated only by the calling thread, in the same
+                         order as the sequential build, so `Multiplicity` semantics are preserved.
+                         Defaults to None (i.e., sequential build). Ignored for async models.
+            timestamp: the policy of the `created`/`updated` attributes of nodes and edges.
+                       Defaults to ELEMENT (i.e., a UTC datetime per element creation or update).
+            trace: log a debug message per added or updated node and edge. Defaults to False, in which case
+                   only a summary per generator is logged.
+            **kwargs:
+
+        Returns:
+            NetworkX Graph
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"Invalid max_workers: {max_workers}. Must be a positive integer.")
+
+        super().build(max_workers=max_workers, timestamp=timestamp, trace=trace, **kwargs)
+
+        self._clock = self._timestamp_clock(timestamp)
+        self._trace = trace
+        default_node_attributes = self._default_node_attributes(kwargs)
+        self._rectify_model(default_node_attributes)
+        self._build_graph(default_node_attributes, max_workers, **kwargs)
+        return self._graph
+
+    async def abuild(self,
+                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                     timestamp: Timestamp = Timestamp.ELEMENT,
+                     trace: bool = False,
+                     **kwargs: Any) -> nx.Graph:
+        """Asynchronously build a NetworkX graph representation.
+
+        Generators of sibling nodes (i.e., children of the same parent node) and edge generators are consumed
+        concurrently. The graph itself is updated in the same order as in `build`, so `Multiplicity` semantics
+        are preserved. Both sync and async generators are supported.
+
         Args:
+            max_concurrency: maximal number of generators that are consumed concurrently.
+            timestamp: the policy of the `created`/`updated` attributes of nodes and edges.
+                       Defaults to ELEMENT (i.e., a UTC datetime per element creation or update).
+            trace: log a debug message per added or updated node and edge. Defaults to False, in which case
+                   only a summary per generator is logged.
             **kwargs:
 
         Returns:
             NetworkX Graph
         """
-        super().build(**kwargs)
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid max_concurrency: {max_concurrency}. Must be a positive integer.")
 
-        default_node_attributes = dict(**self.default_node_attributes)
-        if 'default_node_attributes' in kwargs:
-            default_node_attributes.update(kwargs.pop('default_node_attributes') or {})
+        super().build(timestamp=timestamp, trace=trace, **kwargs)
 
+        self._clock = self._timestamp_clock(timestamp)
+        self._trace = trace
+        default_node_attributes = self._default_node_attributes(kwargs)
         self._rectify_model(default_node_attributes)
-        self._build_graph(default_node_attributes, **kwargs)
+        await self._abuild_graph(default_node_attributes, max_concurrency, **kwargs)
         return self._graph
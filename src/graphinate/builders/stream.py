@@ -0,0 +1,224 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Any, Union
+
+from ..enums import GraphType, Multiplicity, Timestamp
+from ..modeling import GraphModel, NodeModel
+from ..tools import utcnow
+from ..typing import Node, NodeTypeAbsoluteId, UniverseNode
+from .builder import Builder
+from .networkx import NetworkxBuilder, _type_name
+
+DEFAULT_INDEX_SIZE = 1_000_000
+
+
+class GraphDeltaType(Enum):
+    NODE_ADDED = auto()
+    NODE_UPDATED = auto()
+    EDGE_ADDED = auto()
+    EDGE_UPDATED = auto()
+
+
+@dataclass(frozen=True)
+class GraphDelta:
+    """A change to a streamed graph.
+
+    | **Type**     | **Attributes**                                                         |
+    |--------------|------------------------------------------------------------------------|
+    | NODE_ADDED   | label, type, value (a list), magnitude, lineage, created               |
+    | NODE_UPDATED | value (a single value, to merge by `multiplicity`), magnitude, updated |
+    | EDGE_ADDED   | label, type, value (a list), weight, created                           |
+    | EDGE_UPDATED | value (a single value to append), weight (to add), updated             |
+
+    Parent-child edges have only a `created` attribute.
+
+    Args:
+        type: the type of the change.
+        id: the node ID, or the (source node ID, target node ID) edge ID.
+        attributes: the added or changed attributes of the element.
+        multiplicity: the Multiplicity of the updated node (NODE_UPDATED only). Defaults to None.
+    """
+
+    type: GraphDeltaType
+    id: Hashable
+    attributes: Mapping[str, Any]
+    multiplicity: Multiplicity | None = None
+
+
+class _BoundedIndex:
+    """An LRU index of the most recently seen element IDs and their magnitudes."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._items: OrderedDict[Hashable, int] = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def increment(self, key: Hashable) -> int:
+        """Increment the magnitude of an element, marking it as the most recently seen one.
+
+        Returns:
+            The new magnitude. 1 if the element was not in the index (i.e., never seen or evicted).
+        """
+        items = self._items
+        magnitude = items.pop(key, 0) + 1
+        items[key] = magnitude
+        if len(items) > self.size:
+            items.popitem(last=False)
+        return magnitude
+
+
+class StreamBuilder(Builder):
+    """Build a stream of graph deltas.
+
+    Unlike the other builders, it does not materialize a graph. Nodes and edges are yielded as `GraphDelta` events
+    while the generators of the `GraphModel` are consumed, so graphs larger than the available memory can be written
+    to files, sockets or databases.
+
+    Repeated elements are detected using an LRU index of the `index_size` most recently seen node and edge IDs.
+    An element that was evicted from the index is yielded as added again, so sinks should treat NODE_ADDED and
+    EDGE_ADDED as upserts. Default attributes (e.g., colors) are not applied, as they are computed from the whole graph.
+
+    Nodes and edges are generated the same way as by `NetworkxBuilder`, whose element helpers are reused.
+    """
+
+    def __init__(self, model: GraphModel, graph_type: GraphType = GraphType.Graph):
+        super().__init__(model, graph_type)
+        self._clock: Callable[[], Any] | None = utcnow
+        graph = graph_type.value()
+        self._is_directed = graph.is_directed()
+        self._is_multigraph = graph.is_multigraph()
+
+    def _stream_node_type(self,
+                          index: _BoundedIndex,
+                          node_type: Union[Hashable, UniverseNode] = UniverseNode,
+                          **kwargs: Any) -> Iterator[GraphDelta]:
+        for parent_node_type, child_node_types in self.model.node_children_types(node_type).items():
+            for child_node_type in child_node_types:
+                node_type_absolute_id = (parent_node_type, child_node_type)
+                yield from self._stream_nodes(index, node_type_absolute_id, **kwargs)
+
+    def _stream_nodes(self,
+                      index: _BoundedIndex,
+                      node_type_absolute_id: NodeTypeAbsoluteId,
+                      **kwargs: Any) -> Iterator[GraphDelta]:
+        parent_node_id = NetworkxBuilder._parent_node_id(node_type_absolute_id, **kwargs)
+        for node_model in self.model.node_models[node_type_absolute_id]:
+            for node in node_model.generator(**kwargs):
+                node_type = NetworkxBuilder._node_type(node_model, node)
+                yield from self._node_deltas(index, node_model, node_type, parent_node_id, node)
+                yield from self._stream_node_type(index,
+                                                  node_model.type,
+                                                  **NetworkxBuilder._child_kwargs(node_type, node, kwargs))
+
+    def _node_deltas(self,
+                     index: _BoundedIndex,
+                     node_model: NodeModel,
+                     node_type: str,
+                     parent_node_id: tuple | type[UniverseNode],
+                     node: Node) -> Iterator[GraphDelta]:
+        clock = self._clock
+        node_lineage = (*parent_node_id, node.key) if parent_node_id is not UniverseNode else (node.key,)
+        node_id = (node.key,) if node_model.uniqueness else node_lineage
+
+        magnitude = index.increment(('node', node_id))
+        if magnitude > 1:
+            attributes = {'value': node.value, 'magnitude': magnitude}
+            if clock:
+                attributes['updated'] = clock()
+            yield GraphDelta(GraphDeltaType.NODE_UPDATED, node_id, attributes, node_model.multiplicity)
+        else:
+            label = node.key
+            if node_model.label is not None:
+                label = node_model.label(node.value) if callable(node_model.label) else node_model.label
+
+            attributes = {
+                'label': label,
+                'type': node_type,
+                'value': [node.value],
+                'magnitude': 1,
+                'lineage': list(node_lineage),
+            }
+            if clock:
+                attributes['created'] = clock()
+            yield GraphDelta(GraphDeltaType.NODE_ADDED, node_id, attributes)
+
+        if node_model.parent_type is not UniverseNode:
+            edge_id = (parent_node_id, node_id)
+            if self._is_multigraph or self._index_edge(index, edge_id)[1] == 1:
+                yield GraphDelta(GraphDeltaType.EDGE_ADDED, edge_id, {'created': clock()} if clock else {})
+
+    def _index_edge(self, index: _BoundedIndex, edge_id: tuple) -> tuple[tuple, int]:
+        """Increment the magnitude of an edge.
+
+        Returns:
+            The ID of the edge as first seen (undirected edges may be seen reversed) and its new magnitude.
+        """
+        source, target = edge_id
+        if not self._is_directed and ('edge', (target, source)) in index:
+            edge_id = (target, source)
+        return edge_id, index.increment(('edge', edge_id))
+
+    def _stream_edges(self, index: _BoundedIndex, **kwargs: Any) -> Iterator[GraphDelta]:
+        clock = self._clock
+        for edge_generators in self.model.edge_generators.values():
+            for edge_generator in edge_generators:
+                for edge in edge_generator(**kwargs):
+                    edge_id = ((edge.source,), (edge.target,))
+                    edge_weight = edge.weight or 1.0
+                    magnitude = 1
+                    if not self._is_multigraph:
+                        edge_id, magnitude = self._index_edge(index, edge_id)
+
+                    if magnitude == 1:
+                        attributes = {
+                            'label': edge.label(edge_id) if callable(edge.label) else edge.label,
+                            'type': _type_name(edge.type),
+                            'value': [edge.value],
+                            'weight': edge_weight,
+                        }
+                        if clock:
+                            attributes['created'] = clock()
+                        yield GraphDelta(GraphDeltaType.EDGE_ADDED, edge_id, attributes)
+                    else:
+                        attributes = {'value': edge.value, 'weight': edge_weight}
+                        if clock:
+                            attributes['updated'] = clock()
+                        yield GraphDelta(GraphDeltaType.EDGE_UPDATED, edge_id, attributes)
+
+    def _index(self, index_size: int) -> _BoundedIndex:
+        return _BoundedIndex(index_size)
+
+    def _stream(self, index: _BoundedIndex, **kwargs: Any) -> Iterator[GraphDelta]:
+        yield from self._stream_node_type(index, **kwargs)
+        yield from self._stream_edges(index, **kwargs)
+
+    def build(self,
+              index_size: int = DEFAULT_INDEX_SIZE,
+              timestamp: Timestamp = Timestamp.ELEMENT,
+              **kwargs: Any) -> Iterator[GraphDelta]:
+        """Build a stream of graph deltas.
+
+        Args:
+            index_size: maximal number of node and edge IDs kept in the index of seen elements.
+            timestamp: the policy of the `created`/`updated` attributes of nodes and edges.
+                       Defaults to ELEMENT (i.e., a UTC datetime per element creation or update).
+            **kwargs: additional inputs to the node and edge generator functions
+
+        Returns:
+            Iterator of GraphDelta events
+        """
+        if index_size < 1:
+            raise ValueError(f"Invalid index_size: {index_size}. Must be a positive integer.")
+
+        if self.model.is_async:
+            raise ValueError("Models with async generators cannot be streamed. Use NetworkxBuilder.abuild instead.")
+
+        super().build(index_size=index_size, timestamp=timestamp, **kwargs)
+
+        self._clock = NetworkxBuilder._timestamp_clock(timestamp)
+        self._rectify_model(self._default_node_attributes(kwargs))
+        return self._stream(self._index(index_size), **kwargs)
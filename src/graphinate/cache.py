@@ -0,0 +1,290 @@
+"""Persistent cache of generator outputs.
+
+A `Cache` passed to `GraphModel.node` or `GraphModel.edge` records the payloads yielded by each call of the decorated
+generator function, keyed by the model, the generator and the call's arguments (i.e., the `*_id` arguments). Later
+calls with the same arguments, including calls made after a process restart, replay the recorded payloads instead of
+calling the generator function.
+
+Payloads are pickled, so a cache store must only be shared with trusted processes.
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, NamedTuple, Union
+
+from .enums import Eviction
+
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+class CacheEntry(NamedTuple):
+    """Metadata of a stored cache entry.
+
+    Attributes:
+        key: the key of the entry.
+        size: the size of the stored data, in bytes.
+        stored: the time the entry was stored, in seconds since the epoch.
+        accessed: the time the entry was last read or stored, in seconds since the epoch.
+    """
+
+    key: str
+    size: int
+    stored: float
+    accessed: float
+
+
+class CacheStore(ABC):
+    """A local store of cache entries. Implementations must be safe to use from multiple threads."""
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[float, bytes] | None:
+        """Read an entry and mark it as accessed.
+
+        Returns:
+            The time the entry was stored and its data, or None if there is no such entry.
+        """
+
+    @abstractmethod
+    def set(self, key: str, data: bytes, stored: float):
+        """Store an entry, replacing any entry with the same key."""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Delete an entry, if it exists."""
+
+    @abstractmethod
+    def entries(self) -> list[CacheEntry]:
+        """The metadata of all the entries."""
+
+    def clear(self):
+        """Delete all the entries."""
+        for entry in self.entries():
+            self.delete(entry.key)
+
+
+class SQLiteStore(CacheStore):
+    """Store entries in a table of a SQLite database file.
+
+    Args:
+        path: the path of the database file. Created if it does not exist.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._connection.execute('CREATE TABLE IF NOT EXISTS entries ('
+                                     'key TEXT PRIMARY KEY, stored REAL, accessed REAL, size INTEGER, data BLOB)')
+        return self._connection
+
+    def get(self, key: str) -> tuple[float, bytes] | None:
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute('SELECT stored, data FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                connection.execute('UPDATE entries SET accessed = ? WHERE key = ?', (time.time(), key))
+        return row
+
+    def set(self, key: str, data: bytes, stored: float):
+        with self._lock:
+            self._connect().execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)',
+                                    (key, stored, stored, len(data), data))
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connect().execute('DELETE FROM entries WHERE key = ?', (key,))
+
+    def entries(self) -> list[CacheEntry]:
+        with self._lock:
+            rows = self._connect().execute('SELECT key, size, stored, accessed FROM entries').fetchall()
+        return [CacheEntry(*row) for row in rows]
+
+    def close(self):
+        """Close the database connection. It is reopened on the next use of the store."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class DirectoryStore(CacheStore):
+    """Store each entry in a file of a directory.
+
+    The modification time of a file is the time its entry was stored, and its access time is set explicitly when
+    the entry is read (so it does not depend on the `atime` options of the file system).
+
+    Args:
+        path: the path of the directory. Created if it does not exist.
+    """
+
+    suffix = '.cache'
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = Path(path)
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> tuple[float, bytes] | None:
+        file = self._file(key)
+        try:
+            data = file.read_bytes()
+            stored = file.stat().st_mtime
+            os.utime(file, (time.time(), stored))
+        except FileNotFoundError:
+            return None
+        return stored, data
+
+    def set(self, key: str, data: bytes, stored: float):
+        self.path.mkdir(parents=True, exist_ok=True)
+        file = self._file(key)
+        temporary = file.with_name(f"{file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_bytes(data)
+        os.utime(temporary, (stored, stored))
+        os.replace(temporary, file)  # atomic, so concurrent readers never see a partial entry
+
+    def delete(self, key: str):
+        self._file(key).unlink(missing_ok=True)
+
+    def entries(self) -> list[CacheEntry]:
+        entries = []
+        for file in self.path.glob(f"*{self.suffix}"):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append(CacheEntry(file.name.removesuffix(self.suffix), stat.st_size, stat.st_mtime, stat.st_atime))
+        return entries
+
+
+def open_store(location: Union[CacheStore, str, os.PathLike]) -> CacheStore:
+    """Get a CacheStore for a location.
+
+    Args:
+        location: a CacheStore, the path of a SQLite database file (with a .db, .sqlite or .sqlite3 suffix),
+                  or the path of a directory.
+
+    Returns:
+        CacheStore
+    """
+    if isinstance(location, CacheStore):
+        return location
+
+    path = Path(location)
+    return SQLiteStore(path) if path.suffix in SQLITE_SUFFIXES else DirectoryStore(path)
+
+
+@dataclass(frozen=True)
+class Cache:
+    """A persistent cache of generator outputs.
+
+    Args:
+        store: where the entries are stored. See `open_store`.
+        ttl: the time to live of the entries, in seconds. Defaults to None (i.e., the entries never expire).
+        size_limit: the maximal total size of the stored entries, in bytes. Defaults to None (i.e., unlimited).
+        eviction: the entries that are removed when the size limit is exceeded.
+                  Defaults to LEAST_RECENTLY_USED.
+
+    Example:
+        ```python
+        cache = graphinate.cache.Cache('cache.sqlite', ttl=24 * 60 * 60, size_limit=2 ** 30)
+
+        @model.node(cache=cache)
+        def artist():
+            yield from fetch_artists()
+        ```
+    """
+
+    store: Union[CacheStore, str, os.PathLike]
+    ttl: float | None = None
+    size_limit: int | None = None
+    eviction: Eviction = Eviction.LEAST_RECENTLY_USED
+    _store: CacheStore = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError(f"Invalid ttl: {self.ttl}. It must be positive.")
+        if self.size_limit is not None and self.size_limit <= 0:
+            raise ValueError(f"Invalid size limit: {self.size_limit}. It must be positive.")
+        if self.size_limit is not None and self.eviction is Eviction.NONE:
+            raise ValueError('A size limit requires an eviction policy.')
+
+        object.__setattr__(self, '_store', open_store(self.store))
+
+    @staticmethod
+    def key(identity: tuple[Hashable, ...], kwargs: Mapping[str, Any]) -> str:
+        """The key of the outputs of a generator call.
+
+        Args:
+            identity: identifies the generator, e.g., its model, its module and its qualified name.
+            kwargs: the arguments of the call.
+
+        Returns:
+            A hexadecimal digest.
+        """
+        return hashlib.sha256(repr((identity, sorted(kwargs.items()))).encode()).hexdigest()
+
+    def _is_expired(self, stored: float, now: float) -> bool:
+        return self.ttl is not None and now - stored > self.ttl
+
+    def get(self, key: str) -> list | None:
+        """The recorded outputs of a key.
+
+        Returns:
+            The list of the outputs, or None if there is no entry of the key, or it expired.
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        stored, data = entry
+        if self._is_expired(stored, time.time()):
+            self._store.delete(key)
+            return None
+
+        return pickle.loads(data)  # noqa: S301
+
+    def set(self, key: str, outputs: list):
+        """Record the outputs of a key, then evict entries if the size limit is exceeded."""
+        self._store.set(key, pickle.dumps(outputs, protocol=pickle.HIGHEST_PROTOCOL), time.time())
+        self._evict()
+
+    def clear(self):
+        """Delete all the entries."""
+        self._store.clear()
+
+    def _evict(self):
+        if self.size_limit is None:
+            return
+
+        now = time.time()
+        entries = []
+        for entry in self._store.entries():
+            if self._is_expired(entry.stored, now):
+                self._store.delete(entry.key)
+            else:
+                entries.append(entry)
+
+        size = sum(entry.size for entry in entries)
+        if size <= self.size_limit:
+            return
+
+        order = 'accessed' if self.eviction is Eviction.LEAST_RECENTLY_USED else 'stored'
+        entries.sort(key=lambda entry: getattr(entry, order))
+        for entry in entries:
+            self._store.delete(entry.key)
+            size -= entry.size
+            if size <= self.size_limit:
+                break
@@ -1,5 +1,5 @@
+import gzip
 import importlib
-import json
 from pathlib import Path
 from types import ModuleType
 from typing import Any
@@ -86,9 +86,10 @@ def cli(ctx: click.Context) -> None:
 
 @cli.command()
 @model_option
+@click.option('-z', '--compress', is_flag=True, default=False, help='Compress the saved graph with gzip.')
 @click.pass_context
-def save(ctx: click.Context, model: GraphModel) -> None:
-    file_path = Path(f"{model.name}.d3_graph.json")
+def save(ctx: click.Context, model: GraphModel, compress: bool) -> None:
+    file_path = Path(f"{model.name}.d3_graph.json{'.gz' if compress else ''}")
 
     if file_path.is_absolute():
         raise click.ClickException("Please provide a relative file path for saving the graph.")
@@ -100,9 +101,8 @@ def save(ctx: click.Context, model: GraphModel) -> None:
         click.confirm(f"The file '{file_path}' already exists. Do you want to overwrite it?", abort=True)
 
     kwargs = _get_kwargs(ctx)
-    with open(file_path, mode='w') as fp:
-        graph = builders.D3Builder(model, **kwargs).build()
-        json.dump(graph, fp=fp, default=str, **kwargs)
+    with (gzip.open(file_path, mode='wt') if compress else open(file_path, mode='w')) as fp:
+        builders.D3Builder(model, **kwargs).dump(fp)
 
 
 @cli.command()
@@ -1,5 +1,5 @@
 import functools
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Iterable, Mapping, Sequence
 from typing import Union
 
 import matplotlib as mpl
@@ -12,6 +12,25 @@ except ImportError:
     HAS_NUMPY = False
 
 
+def _node_type_lookup(node_types: Iterable[str]) -> dict[str, int]:
+    """Map node types to color indices. The default 'node' type gets no index of its own if there are other types."""
+    node_types = list(node_types)
+
+    if len(node_types) > 1 and 'node' in node_types:
+        # Create a new list of keys, preserving order, but excluding 'node'
+        node_types = [k for k in node_types if k != 'node']
+
+    return {t: i for i, t in enumerate(node_types)}
+
+
+def _colors(color_indices: Sequence[int], low: int, high: int, cmap: Union[str, mpl.colors.Colormap]) -> list:
+    norm = mpl.colors.Normalize(vmin=low, vmax=high, clip=True)
+    mapper = mpl.cm.ScalarMappable(norm=norm, cmap=cmap)
+
+    # mapper.to_rgba handles both numpy arrays and lists
+    return mapper.to_rgba(color_indices).tolist()
+
+
 @functools.lru_cache
 def node_color_mapping(graph: nx.Graph, cmap: Union[str, mpl.colors.Colormap] = "tab20") -> Mapping:
     """Map node types to RGBA colors based on a colormap.
@@ -29,15 +48,7 @@ def node_color_mapping(graph: nx.Graph, cmap: Union[str, mpl.colors.Colormap] =
     if not graph.nodes:
         return {}
 
-    node_type_keys = graph.graph.get('node_types', {}).keys()
-
-    if len(node_type_keys) > 1 and 'node' in node_type_keys:
-        # Create a new list of keys, preserving order, but excluding 'node'
-        final_keys = [k for k in node_type_keys if k != 'node']
-    else:
-        final_keys = list(node_type_keys)
-
-    type_lookup = {t: i for i, t in enumerate(final_keys)}
+    type_lookup = _node_type_lookup(graph.graph.get('node_types', {}).keys())
 
     if HAS_NUMPY:
         color_indices = np.fromiter(
@@ -56,16 +67,41 @@ def node_color_mapping(graph: nx.Graph, cmap: Union[str, mpl.colors.Colormap] =
         else:
             low = high = 0
 
-    norm = mpl.colors.Normalize(vmin=low, vmax=high, clip=True)
-    mapper = mpl.cm.ScalarMappable(norm=norm, cmap=cmap)
-
-    # mapper.to_rgba handles both numpy arrays and lists
-    colors = mapper.to_rgba(color_indices).tolist()
+    colors = _colors(color_indices, low, high, cmap)
 
     color_mapping = dict(zip(graph.nodes, colors))
     return color_mapping
 
 
+def node_type_color_mapping(node_types: Iterable[str],
+                            used_node_types: Collection[str],
+                            node_count: int,
+                            cmap: Union[str, mpl.colors.Colormap] = "tab20") -> Mapping:
+    """Map node types to RGBA colors, as `node_color_mapping` colors the nodes of these types.
+
+    Args:
+        node_types: all the node types of the graph, in the order of its 'node_types' attribute.
+        used_node_types: the node types of the nodes of the graph.
+        node_count: the number of nodes of the graph.
+        cmap: the colormap used to map values to RGBA colors. Default is "tab20".
+    Returns:
+        Mapping - A dictionary mapping each used node type to its RGBA color.
+    """
+    if not node_count:
+        return {}
+
+    type_lookup = _node_type_lookup(node_types)
+    used_node_types = list(used_node_types)
+    color_indices = [type_lookup.get(t, 0) for t in used_node_types]
+
+    if node_count > 1:
+        low, high = min(color_indices), max(color_indices)
+    else:
+        low = high = 0
+
+    return dict(zip(used_node_types, _colors(color_indices, low, high, cmap)))
+
+
 def color_hex(color: Union[str, Sequence[Union[float, int]]]) -> Union[str, Sequence[Union[float, int]]]:
     """Get HEX color code
 
@@ -1,22 +1,30 @@
 import ast
 import base64
 import decimal
+import functools
 import math
+import os
+import threading
 from types import MappingProxyType
 from typing import Any, Union
 
 import strawberry
 
+from . import _codec
 from ._secure import _secret_key, signed, unsigned
 from .constants import DEFAULT_EDGE_DELIMITER, DEFAULT_NODE_DELIMITER
+from .enums import IdCodec
 
 __all__ = [
     'InfNumber',
+    'clear_graph_id_cache',
     'decode',
+    'decode_cursor',
     'decode_edge_id',
     'decode_node_id',
     'edge_label_converter',
     'encode',
+    'encode_cursor',
     'encode_edge_id',
     'encode_node_id',
     'infnum_to_value',
@@ -27,6 +35,10 @@ __all__ = [
 
 InfNumber = Union[float, int, decimal.Decimal]
 
+CURSOR_TAG = 'cursor'
+
+GRAPH_ID_CACHE_SIZE = 2 ** 17
+
 INFINITY_MAPPING: MappingProxyType[str, InfNumber] = MappingProxyType({
     'Infinity': math.inf,
     '+Infinity': math.inf,
@@ -61,11 +73,48 @@ def edge_label_converter(value: Any) -> str | None:
     return label_converter(tuple(node_label_converter(n) for n in value), delimiter=DEFAULT_EDGE_DELIMITER)
 
 
-def encode(value: Any, encoding: str = 'utf-8') -> str:
-    obj_s: str = repr(value)
-    obj_b: bytes = obj_s.encode(encoding)
+@functools.cache
+def _id_codec() -> IdCodec:
+    """Retrieve the ID codec from the environment variable. Defaults to REPR."""
+    return IdCodec(os.getenv("GRAPHINATE_ID_CODEC", IdCodec.REPR.value).lower())
 
-    if key := _secret_key():
+
+def _serialize(value: Any, encoding: str, codec: IdCodec) -> bytes:
+    if codec is IdCodec.BINARY:
+        try:
+            return _codec.pack(value, encoding)
+        except TypeError:  # unsupported component, fall back to repr
+            pass
+
+    return repr(value).encode(encoding)
+
+
+def _deserialize(obj_b: bytes, encoding: str) -> Any:
+    if obj_b.startswith(_codec.MAGIC):
+        return _codec.unpack(obj_b, encoding)
+
+    return ast.literal_eval(obj_b.decode(encoding))
+
+
+def encode(value: Any, encoding: str = 'utf-8', codec: IdCodec | None = None) -> str:
+    """Encode a value (e.g., a node ID) into a URL safe string.
+
+    Args:
+        value: the value to encode.
+        encoding: the encoding of the string. Defaults to 'utf-8'.
+        codec: the IdCodec serializing the value. Defaults to None (i.e., the `GRAPHINATE_ID_CODEC`
+               environment variable, or REPR if it is not set).
+
+    Returns:
+        The encoded value, signed if the `GRAPHINATE_SECRET_KEY` environment variable is set.
+    """
+    return _encode(value, encoding, _secret_key(), codec or _id_codec())
+
+
+def _encode(value: Any, encoding: str, key: str | None, codec: IdCodec) -> str:
+    obj_b: bytes = _serialize(value, encoding, codec)
+
+    if key:
         obj_b = signed(obj_b, key)
 
     enc_b: bytes = base64.urlsafe_b64encode(obj_b)
@@ -80,22 +129,85 @@ def decode(value: str, encoding: str = 'utf-8') -> Any:
     if key := _secret_key():
         obj_b = unsigned(obj_b, key)
 
-    obj_s: str = obj_b.decode(encoding)
-    obj: Any = ast.literal_eval(obj_s)
-    return obj
+    return _deserialize(obj_b, encoding)
+
+
+_decoded_graph_ids: dict[tuple[str, str, str | None], Any] = {}
+_decoded_graph_ids_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=GRAPH_ID_CACHE_SIZE)
+def _encode_graph_id(graph_id: tuple, encoding: str, key: str | None, codec: IdCodec) -> str:
+    """Encode a node or edge ID, and remember it so decoding it again is a dict lookup.
+
+    Graph IDs are cached by equality, as NetworkX does (e.g., (1,) and (True,) are the same node).
+    """
+    encoded = _encode(graph_id, encoding, key, codec)
+    with _decoded_graph_ids_lock:
+        if len(_decoded_graph_ids) >= GRAPH_ID_CACHE_SIZE:
+            del _decoded_graph_ids[next(iter(_decoded_graph_ids))]
+        _decoded_graph_ids[(encoded, encoding, key)] = graph_id
+    return encoded
+
+
+def _decode_graph_id(encoded_graph_id: str, encoding: str) -> Any:
+    key = _secret_key()
+    try:
+        return _decoded_graph_ids[(encoded_graph_id, encoding, key)]
+    except KeyError:
+        return decode(encoded_graph_id, encoding)
+
+
+def clear_graph_id_cache():
+    """Clear the cache of encoded node and edge IDs."""
+    _encode_graph_id.cache_clear()
+    with _decoded_graph_ids_lock:
+        _decoded_graph_ids.clear()
 
 
 def encode_node_id(node_id: tuple, encoding: str = 'utf-8') -> str:
-    return encode(node_id, encoding)
+    try:
+        return _encode_graph_id(node_id, encoding, _secret_key(), _id_codec())
+    except TypeError:  # unhashable node_id
+        return encode(node_id, encoding)
 
 
 def decode_node_id(encoded_node_id: strawberry.ID, encoding: str = 'utf-8') -> tuple[str, ...]:
-    return decode(encoded_node_id, encoding)
+    return _decode_graph_id(encoded_node_id, encoding)
 
 
 def encode_edge_id(edge_id: tuple, encoding: str = 'utf-8') -> str:
-    return encode(edge_id, encoding)
+    try:
+        return _encode_graph_id(edge_id, encoding, _secret_key(), _id_codec())
+    except TypeError:  # unhashable edge_id
+        return encode(edge_id, encoding)
 
 
 def decode_edge_id(encoded_edge_id: strawberry.ID, encoding: str = 'utf-8') -> tuple:
-    return decode(encoded_edge_id, encoding)
+    return _decode_graph_id(encoded_edge_id, encoding)
+
+
+def encode_cursor(key: Any, encoding: str = 'utf-8') -> str:
+    """Encode the key of a Connection item (e.g., a node ID) into an opaque cursor."""
+    cursor = (CURSOR_TAG, key)
+    try:
+        return _encode_graph_id(cursor, encoding, _secret_key(), _id_codec())
+    except TypeError:  # unhashable key
+        return encode(cursor, encoding)
+
+
+def decode_cursor(cursor: str, encoding: str = 'utf-8') -> Any:
+    """Decode a cursor encoded by `encode_cursor` into the key of its Connection item.
+
+    Raises:
+        ValueError: if the cursor is not a valid cursor.
+    """
+    try:
+        value = _decode_graph_id(cursor, encoding)
+    except (ValueError, SyntaxError, TypeError, RecursionError) as e:  # binascii.Error is a ValueError
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if not (isinstance(value, tuple) and len(value) == 2 and value[0] == CURSOR_TAG):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    return value[1]
@@ -49,3 +49,58 @@ class Multiplicity(Enum):
     ALL = auto()
     FIRST = auto()
     LAST = auto()
+
+
+class Timestamp(Enum):
+    """Timestamp Policies
+
+    Determines the values of the `created` and `updated` attributes of the nodes and edges of a built graph.
+
+    | **Policy** | **`created` / `updated` values**                                    |
+    |------------|---------------------------------------------------------------------|
+    | ELEMENT    | The UTC datetime at which each element was created or updated       |
+    | BUILD      | A single UTC datetime shared by all elements of a build             |
+    | COUNTER    | A monotonic integer, incremented on each element creation or update |
+    | NONE       | The attributes are omitted                                          |
+    """
+
+    ELEMENT = auto()
+    BUILD = auto()
+    COUNTER = auto()
+    NONE = auto()
+
+
+class IdCodec(Enum):
+    """Node and Edge ID Codecs
+
+    Determines how node and edge IDs are serialized before they are (optionally) signed and base64 encoded.
+    IDs encoded by either codec can always be decoded.
+
+    | **Codec** | **Serialization**                                         | **Deserialization** |
+    |-----------|-----------------------------------------------------------|---------------------|
+    | REPR      | `repr()`                                                  | `ast.literal_eval`  |
+    | BINARY    | Length prefixed tuples of str, int, float, bool and bytes | Direct unpacking    |
+
+    IDs with components that BINARY cannot serialize fall back to REPR.
+    """
+
+    REPR = 'repr'
+    BINARY = 'binary'
+
+
+class Eviction(Enum):
+    """Cache Eviction Policies
+
+    Determines which entries of a generator cache (see `graphinate.cache.Cache`) are removed when its size limit
+    is exceeded.
+
+    | **Policy**             | **Evicted entries**                          |
+    |------------------------|----------------------------------------------|
+    | LEAST_RECENTLY_USED    | The entries that were read or stored first   |
+    | LEAST_RECENTLY_STORED  | The entries that were stored first           |
+    | NONE                   | None (entries are only removed when expired) |
+    """
+
+    LEAST_RECENTLY_USED = auto()
+    LEAST_RECENTLY_STORED = auto()
+    NONE = auto()
@@ -1,12 +1,23 @@
+import functools
 import inspect
 import itertools
 from collections import defaultdict, namedtuple
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
 from dataclasses import dataclass
 from functools import lru_cache
 from types import MappingProxyType
 from typing import Any, Union
 
+from .cache import Cache
 from .enums import Multiplicity
 from .typing import Edge, Element, Extractor, Items, Node, NodeTypeAbsoluteId, UniverseNode
 
@@ -59,6 +70,98 @@ def extractor(obj: Any, key: Extractor | None = None) -> str | None:
     return key
 
 
+def _getter(key: Extractor | None) -> Callable[[Any], Any]:
+    """Compile an Extractor into a callable with the same result as `extractor(item, key)`.
+
+    Args:
+        key: Extractor element field source.
+
+    Returns:
+        Getter callable.
+    """
+    if key is None:
+        return _identity
+
+    if callable(key):
+        return key
+
+    if isinstance(key, str):
+        def get(item: Any) -> Any:
+            if type(item) is dict or isinstance(item, Mapping):
+                return item.get(key, key)
+            return key
+
+        return get
+
+    def constant(_item: Any) -> Any:
+        return key
+
+    return constant
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+def _element_class(element_classes: dict[str, Callable[..., Element]],
+                   element_type: str,
+                   field_names: tuple[str, ...]) -> Callable[..., Element]:
+    """Get the Element class of a dynamic type, validating and creating it on first use."""
+    create_element = element_classes.get(element_type)
+    if create_element is None:
+        if not element_type.isidentifier():
+            raise ValueError(f"Invalid Type: {element_type}. Must be a valid Python identifier.")
+        create_element = element_classes[element_type] = element(element_type, field_names)
+    return create_element
+
+
+def _element_factory(element_type: Extractor | None, getters: Mapping[str, Extractor]) -> Callable[[Any], Element]:
+    """Create a callable that converts a single payload item into a graph Element.
+
+    The getters are compiled once, and the Element classes of dynamic types are validated and created once per type.
+
+    Args:
+        element_type: source of type of the element.
+        getters: Extractor element field sources.
+
+    Returns:
+        Element factory callable.
+    """
+    field_names = tuple(getters.keys())
+    compiled = tuple(_getter(v) for v in getters.values())
+
+    if callable(element_type):
+        element_classes: dict[str, Callable[..., Element]] = {}
+
+        def create_dynamic_element(item: Any) -> Element:
+            create_element = _element_class(element_classes, element_type(item), field_names)
+            return create_element(*[get(item) for get in compiled])
+
+        return create_dynamic_element
+
+    _type = element_type
+    # Eagerly validate static types.
+    # Note: This will raise AttributeError if _type is None (consistent with previous behavior, but happens earlier)
+    # and ValueError if _type is invalid identifier.
+    if not _type.isidentifier():
+        raise ValueError(f"Invalid Type: {_type}. Must be a valid Python identifier.")
+
+    static_create_element = element(_type, field_names)
+
+    if len(compiled) == 2:
+        get_first, get_second = compiled
+
+        def create_pair_element(item: Any) -> Element:
+            return static_create_element(get_first(item), get_second(item))
+
+        return create_pair_element
+
+    def create_static_element(item: Any) -> Element:
+        return static_create_element(*[get(item) for get in compiled])
+
+    return create_static_element
+
+
 def elements(iterable: Iterable[Any],
              element_type: Extractor | None = None,
              **getters: Extractor) -> Iterable[Element]:
@@ -72,30 +175,277 @@ def elements(iterable: Iterable[Any],
     Returns:
         Iterable of Elements.
     """
-    is_dynamic_type = callable(element_type)
-    static_create_element = None
+    create_element = _element_factory(element_type, getters)
 
-    if not is_dynamic_type:
-        _type = element_type
-        # Eagerly validate static types.
-        # Note: This will raise AttributeError if _type is None (consistent with previous behavior, but happens earlier)
-        # and ValueError if _type is invalid identifier.
-        if not _type.isidentifier():
-            raise ValueError(f"Invalid Type: {_type}. Must be a valid Python identifier.")
+    for item in iterable:
+        yield create_element(item)
 
-        static_create_element = element(_type, getters.keys())
 
-    for item in iterable:
-        if is_dynamic_type:
-            _type = element_type(item)
-            if not _type.isidentifier():
-                raise ValueError(f"Invalid Type: {_type}. Must be a valid Python identifier.")
-            create_element = element(_type, getters.keys())
+async def _aitems(iterable: Iterable[Any] | AsyncIterable[Any] | Awaitable[Iterable[Any] | AsyncIterable[Any]]
+                  ) -> AsyncIterator[Any]:
+    """Iterate an Iterable, an AsyncIterable or an Awaitable of either."""
+    if inspect.isawaitable(iterable):
+        iterable = await iterable
+
+    if isinstance(iterable, AsyncIterable):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+async def aelements(iterable: Iterable[Any] | AsyncIterable[Any] | Awaitable[Iterable[Any] | AsyncIterable[Any]],
+                    element_type: Extractor | None = None,
+                    **getters: Extractor) -> AsyncIterator[Element]:
+    """Abstract Async Generator of Graph elements (nodes or edges)
+
+    Args:
+        iterable: source of payload. Can be an Iterable, an AsyncIterable or an Awaitable of either.
+        element_type: Optional[Extractor] source of type of the element. Defaults to Element Type name.
+        getters: Extractor node field sources
+
+    Returns:
+        AsyncIterator of Elements.
+    """
+    create_element = _element_factory(element_type, getters)
+
+    async for item in _aitems(iterable):
+        yield create_element(item)
+
+
+def _to_list(column: Any) -> list:
+    """Convert a column (a sequence, a NumPy array or a pandas/Polars Series) to a list of Python objects."""
+    if isinstance(column, list):
+        return column
+
+    for method in ('tolist', 'to_list'):
+        convert = getattr(column, method, None)
+        if convert is not None:
+            return convert()
+
+    return list(column)
+
+
+def _is_structured_array(batch: Any) -> bool:
+    dtype = getattr(batch, 'dtype', None)
+    return dtype is not None and dtype.names is not None
+
+
+def _missing_column(name: str, generator: str | None) -> ValueError:
+    batch = 'The batch' if generator is None else f"A batch of {generator}"
+    return ValueError(f"Invalid column: {name}. {batch} has no such column.")
+
+
+def _batch_column(batch: Any, name: str, generator: str | None = None) -> list:
+    """Get a column of a batch of a sequence of mappings, a NumPy structured array or a pandas/Polars DataFrame.
+
+    Raises:
+        ValueError: if the batch has no such column, whatever the type of the batch.
+    """
+    if isinstance(batch, Sequence):
+        try:
+            return [row[name] for row in batch]
+        except KeyError:
+            raise _missing_column(name, generator) from None
+
+    if name not in (batch.dtype.names if _is_structured_array(batch) else batch.columns):
+        raise _missing_column(name, generator)
+
+    return _to_list(batch[name])
+
+
+def _batch_records(batch: Any) -> list:
+    """Get the rows of a batch, i.e., the mappings of a sequence, or the rows of an array or a DataFrame as dicts."""
+    if isinstance(batch, Sequence):
+        return list(batch)
+
+    if _is_structured_array(batch):
+        names = batch.dtype.names
+        return [dict(zip(names, row, strict=True)) for row in batch.tolist()]
+
+    to_dicts = getattr(batch, 'to_dicts', None)  # Polars
+    return to_dicts() if to_dicts is not None else batch.to_dict('records')
+
+
+def _column_getter(key: Extractor | None, generator: str | None = None) -> Callable[[Any, int], list]:
+    """Compile an Extractor into a callable that gets a column of a batch of `size` rows.
+
+    Args:
+        key: None for the rows themselves, a column name, a callable computing a column from the whole batch
+             (e.g., `lambda df: df['first'] + ' ' + df['last']`), or a constant.
+        generator: the name of the generator of the batches, for error messages.
+
+    Returns:
+        Column getter callable.
+    """
+    if key is None:
+        return lambda batch, size: _batch_records(batch)
+
+    if isinstance(key, str):
+        return lambda batch, size: _batch_column(batch, key, generator)
+
+    if callable(key):
+        return lambda batch, size: _to_list(key(batch))
+
+    return lambda batch, size: [key] * size
+
+
+def _batch_element_factory(element_type: Extractor | None,
+                           getters: Mapping[str, Extractor],
+                           generator: str | None = None) -> Callable[[Any], Iterable[Element]]:
+    """Create a callable that converts a batch of payload rows into graph Elements, a column at a time.
+
+    Args:
+        element_type: type of the elements, or a callable computing a column of types from the whole batch.
+        getters: Extractor element field sources. See `_column_getter`.
+        generator: the name of the generator of the batches, for error messages.
+
+    Returns:
+        Elements factory callable.
+    """
+    field_names = tuple(getters.keys())
+    column_getters = tuple(_column_getter(v, generator) for v in getters.values())
+
+    def columns(batch: Any) -> list[list]:
+        size = len(batch)
+        batch_columns = [get(batch, size) for get in column_getters]
+        for name, column in zip(field_names, batch_columns, strict=True):
+            if len(column) != size:
+                raise ValueError(f"Invalid column length: {name} has {len(column)} values, but the batch has {size}.")
+        return batch_columns
+
+    if callable(element_type):
+        element_classes: dict[str, Callable[..., Element]] = {}
+
+        def create_dynamic_elements(batch: Any) -> Iterable[Element]:
+            types = _to_list(element_type(batch))
+            for _type, *values in zip(types, *columns(batch), strict=True):
+                yield _element_class(element_classes, _type, field_names)(*values)
+
+        return create_dynamic_elements
+
+    if not element_type.isidentifier():
+        raise ValueError(f"Invalid Type: {element_type}. Must be a valid Python identifier.")
+
+    static_create_element = element(element_type, field_names)
+
+    def create_static_elements(batch: Any) -> Iterable[Element]:
+        return map(static_create_element, *columns(batch))
+
+    return create_static_elements
+
+
+def batch_elements(batches: Iterable[Any],
+                   element_type: Extractor | None = None,
+                   generator: str | None = None,
+                   **getters: Extractor) -> Iterable[Element]:
+    """Abstract Generator of Graph elements (nodes or edges) from batches of payload rows
+
+    Batches are an input convenience: the fields are extracted a column at a time, but the columns are converted to
+    Python objects, and an Element is still created per row, so the graph is built as from row-by-row payloads.
+
+    Args:
+        batches: source of payload batches. Each batch is a sequence of mappings, a NumPy structured array
+                 or a pandas/Polars DataFrame.
+        element_type: Optional[Extractor] type of the elements, or a callable computing a column of types
+                      from each batch.
+        generator: Optional name of the generator of the batches, for error messages.
+        getters: Extractor element field sources: column names, callables computing a column from each batch,
+                 constants, or None for the rows themselves.
+
+    Returns:
+        Iterable of Elements.
+
+    Raises:
+        ValueError: if a batch has no column of a field name, or a column of another length than the batch.
+    """
+    create_elements = _batch_element_factory(element_type, getters, generator)
+
+    for batch in batches:
+        yield from create_elements(batch)
+
+
+async def abatch_elements(batches: Iterable[Any] | AsyncIterable[Any] | Awaitable[Iterable[Any] | AsyncIterable[Any]],
+                          element_type: Extractor | None = None,
+                          generator: str | None = None,
+                          **getters: Extractor) -> AsyncIterator[Element]:
+    """Abstract Async Generator of Graph elements (nodes or edges) from batches of payload rows
+
+    Args:
+        batches: source of payload batches. Can be an Iterable, an AsyncIterable or an Awaitable of either.
+        element_type: See `batch_elements`.
+        generator: See `batch_elements`.
+        getters: See `batch_elements`.
+
+    Returns:
+        AsyncIterator of Elements.
+    """
+    create_elements = _batch_element_factory(element_type, getters, generator)
+
+    async for batch in _aitems(batches):
+        for item in create_elements(batch):
+            yield item
+
+
+def is_async(f: Callable) -> bool:
+    """Check if a payload supplier function is asynchronous
+
+    Args:
+        f: payload supplier function
+
+    Returns:
+        True for async generator functions and coroutine functions, False otherwise.
+    """
+    return inspect.isasyncgenfunction(f) or inspect.iscoroutinefunction(f)
+
+
+def _cached(f: Items, cache: Cache, *identity: Hashable) -> Items:
+    """Wrap a payload supplier function, so its payloads are replayed from a cache.
+
+    The payloads of a call are recorded once the call's payloads were all consumed, so the payloads of a call that
+    failed or was not consumed to the end are not recorded.
+
+    Args:
+        f: payload supplier function.
+        cache: the cache of the payloads.
+        *identity: identifies the supplier function in the cache keys, along with its module and qualified name.
+
+    Returns:
+        A generator function (or an async generator function, if f is asynchronous) of the payloads.
+    """
+    identity = (*identity, f.__module__, f.__qualname__)
+    if is_async(f):
+        @functools.wraps(f)
+        async def cached_async_payloads(**kwargs: Any) -> AsyncIterator[Any]:
+            key = cache.key(identity, kwargs)
+            payloads = cache.get(key)
+            if payloads is None:
+                payloads = []
+                async for payload in _aitems(f(**kwargs)):
+                    payloads.append(payload)
+                    yield payload
+                cache.set(key, payloads)
+            else:
+                for payload in payloads:
+                    yield payload
+
+        return cached_async_payloads
+
+    @functools.wraps(f)
+    def cached_payloads(**kwargs: Any) -> Iterable[Any]:
+        key = cache.key(identity, kwargs)
+        payloads = cache.get(key)
+        if payloads is None:
+            payloads = []
+            for payload in f(**kwargs):
+                payloads.append(payload)
+                yield payload
+            cache.set(key, payloads)
         else:
-            create_element = static_create_element
+            yield from payloads
 
-        kwargs = {k: extractor(item, v) for k, v in getters.items()}
-        yield create_element(**kwargs)
+    return cached_payloads
 
 
 @dataclass
@@ -143,6 +493,7 @@ class GraphModel:
         self._node_models: dict[NodeTypeAbsoluteId, list[NodeModel]] = defaultdict(list)
         self._node_children: dict[str, list[NodeModel]] = defaultdict(list)
         self._edge_generators: dict[str, list[Callable[[], Iterable[Edge]]]] = defaultdict(list)
+        self._versions: dict[Callable, Callable[..., Hashable]] = {}
         self._networkx_graph = None
 
     def __add__(self, other: 'GraphModel') -> 'GraphModel':
@@ -157,6 +508,8 @@ class GraphModel:
             for k, v in m._edge_generators.items():
                 graph_model._edge_generators[k].extend(v)
 
+            graph_model._versions.update(m._versions)
+
         return graph_model
 
     @property
@@ -175,6 +528,14 @@ class GraphModel:
         """
         return MappingProxyType(self._edge_generators)
 
+    @property
+    def versions(self) -> Mapping[Callable, Callable[..., Hashable]]:
+        """
+        Returns:
+            Version functions of the versioned Node and Edge generators. Keys are the generators.
+        """
+        return MappingProxyType(self._versions)
+
     @property
     def node_types(self) -> set[str]:
         """
@@ -183,6 +544,16 @@ class GraphModel:
         """
         return {v.type for v in itertools.chain.from_iterable(self._node_models.values())}
 
+    @property
+    def is_async(self) -> bool:
+        """
+        Returns:
+            True if any of the registered Node or Edge generators is asynchronous.
+        """
+        node_generators = (v.generator for v in itertools.chain.from_iterable(self._node_models.values()))
+        edge_generators = itertools.chain.from_iterable(self._edge_generators.values())
+        return any(inspect.isasyncgenfunction(g) for g in itertools.chain(node_generators, edge_generators))
+
     def node_children_types(self, _type: str = UniverseNode) -> Mapping[str, list[str]]:
         """Children Node Types for given input Node Type
 
@@ -216,7 +587,10 @@ class GraphModel:
              value: Extractor | None = None,
              label: Extractor | None = None,
              unique: bool = True,
-             multiplicity: Multiplicity = Multiplicity.ALL) -> Callable[[Items], None]:
+             multiplicity: Multiplicity = Multiplicity.ALL,
+             version: Callable[..., Hashable] | None = None,
+             batch: bool = False,
+             cache: Cache | None = None) -> Callable[[Items], None]:
         """Decorator to Register a Generator of node payloads as a source for Graph Nodes.
         It creates a NodeModel object.
 
@@ -233,6 +607,21 @@ class GraphModel:
                    representation of the complete Node payload.
             unique: is the Node universally unique. Defaults to True.
             multiplicity: Multiplicity of the Node. Defaults to ALL.
+            version: Optional fingerprint of the payloads (e.g., a file modification time or an ETag). It is called
+                     with the same arguments as the generator function, and may be a coroutine function for async
+                     generator functions. When a graph is refreshed, the generator is not called again for arguments
+                     whose version did not change, and its previous nodes are reused. Defaults to None
+                     (i.e., the generator is always called).
+            batch: the generator yields batches of payloads (sequences of mappings, NumPy structured arrays or
+                   pandas/Polars DataFrames) instead of single payloads. `key` and `value` are then column names,
+                   callables computing a column from the whole batch, or None for the rows themselves (as dicts),
+                   and a callable `type_` computes a column of types. Batches are an input convenience: nodes are
+                   still created and added to the graph one row at a time. Defaults to False.
+            cache: Optional persistent cache of the payloads (see `graphinate.cache.Cache`). The payloads of each
+                   call of the generator function are recorded, keyed by the model name, the generator function and
+                   the call's arguments, and are replayed by later calls with the same arguments (including calls
+                   by other processes, or after a restart) instead of calling the generator function, until they
+                   expire. Defaults to None (i.e., the generator function is always called).
 
         Generator Function Signature:
             The decorated generator function may accept arguments to receive context from parent nodes.
@@ -249,6 +638,9 @@ class GraphModel:
 
             Note: Arbitrary arguments (e.g., configuration flags) are currently NOT supported.
 
+            The decorated function may also be asynchronous, i.e. an `async def` generator or a coroutine
+            function returning an (async) iterable. Such models can be built with `NetworkxBuilder.abuild`.
+
         Returns:
             None
         """
@@ -259,8 +651,20 @@ class GraphModel:
 
             model_type = f.__name__ if callable(node_type) else node_type
 
-            def node_generator(**kwargs: Any) -> Iterable[Node]:
-                yield from elements(f(**kwargs), node_type, key=key, value=value)
+            if batch:
+                create_elements = functools.partial(batch_elements, generator=f.__qualname__)
+                acreate_elements = functools.partial(abatch_elements, generator=f.__qualname__)
+            else:
+                create_elements, acreate_elements = elements, aelements
+            payloads = f if cache is None else _cached(f, cache, self.name, 'node', model_type)
+
+            if is_async(f):
+                async def node_generator(**kwargs: Any) -> AsyncIterator[Node]:
+                    async for node in acreate_elements(payloads(**kwargs), node_type, key=key, value=value):
+                        yield node
+            else:
+                def node_generator(**kwargs: Any) -> Iterable[Node]:
+                    yield from create_elements(payloads(**kwargs), node_type, key=key, value=value)
 
             parameters = inspect.getfullargspec(f).args
             node_model = NodeModel(type=model_type,
@@ -272,6 +676,8 @@ class GraphModel:
                                    generator=node_generator)
             self._node_models[node_model.absolute_id].append(node_model)
             self._node_children[parent_type].append(model_type)
+            if version is not None:
+                self._versions[node_generator] = version
 
             self._validate_node_parameters(parameters)
 
@@ -284,6 +690,8 @@ class GraphModel:
              label: Extractor | None = str,
              value: Extractor | None = None,
              weight: Union[float, Callable[[Any], float]] = 1.0,
+             version: Callable[..., Hashable] | None = None,
+             cache: Cache | None = None,
              ) -> Callable[[Items], None]:
         """Decorator to Register a generator of edge payloads as a source of Graph Edges.
          It creates an Edge generator function.
@@ -296,6 +704,10 @@ class GraphModel:
             label: Source for edge label.
             value: Source for edge value.
             weight: Source for edge weight.
+            version: Optional fingerprint of the payloads. See `node`. Defaults to None
+                     (i.e., the generator is always called).
+            cache: Optional persistent cache of the payloads. See `node`. Defaults to None
+                   (i.e., the generator function is always called).
 
         Returns:
             None.
@@ -316,10 +728,19 @@ class GraphModel:
                 'weight': weight
             }
 
-            def edge_generator(**kwargs: Any) -> Iterable[Edge]:
-                yield from elements(f(**kwargs), edge_type, **getters)
+            payloads = f if cache is None else _cached(f, cache, self.name, 'edge', model_type)
+
+            if is_async(f):
+                async def edge_generator(**kwargs: Any) -> AsyncIterator[Edge]:
+                    async for edge in aelements(payloads(**kwargs), edge_type, **getters):
+                        yield edge
+            else:
+                def edge_generator(**kwargs: Any) -> Iterable[Edge]:
+                    yield from elements(payloads(**kwargs), edge_type, **getters)
 
             self._edge_generators[model_type].append(edge_generator)
+            if version is not None:
+                self._versions[edge_generator] = version
 
         return register_edge
 
@@ -369,4 +790,4 @@ def model(name: str):
     return GraphModel(name=name)
 
 
-__all__ = ('GraphModel', 'elements', 'model')
+__all__ = ('GraphModel', 'aelements', 'elements', 'model')
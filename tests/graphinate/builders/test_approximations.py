@@ -0,0 +1,90 @@
+import math
+
+import networkx as nx
+import pytest
+
+from graphinate.builders import _approximations
+
+GRAPHS = [
+    nx.path_graph(7),
+    nx.cycle_graph(8),
+    nx.karate_club_graph(),
+    nx.petersen_graph(),
+    nx.balanced_tree(2, 4),
+]
+
+
+@pytest.mark.parametrize('graph', GRAPHS)
+@pytest.mark.parametrize(('name', 'exact'), [
+    ('average_shortest_path_length', nx.average_shortest_path_length),
+    ('average_clustering', nx.average_clustering),
+    ('global_efficiency', nx.global_efficiency),
+])
+def test_approximation__full_sample_is_exact(graph, name, exact):
+    # act
+    actual = getattr(_approximations, name)(graph, sample_size=len(graph))
+
+    # assert
+    assert actual == pytest.approx(exact(graph))
+
+
+@pytest.mark.parametrize('graph', GRAPHS)
+def test_diameter__lower_bound(graph):
+    # act
+    full = _approximations.diameter(graph, sample_size=len(graph))
+    sampled = _approximations.diameter(graph, sample_size=1)
+
+    # assert
+    assert full == nx.diameter(graph)
+    assert sampled <= full
+
+
+def test_diameter__double_sweep():
+    # arrange
+    graph = nx.path_graph(100)
+
+    # act
+    actual = _approximations.diameter(graph, sample_size=1)
+
+    # assert
+    assert actual == 99
+
+
+def test_diameter__not_connected():
+    # arrange
+    graph = nx.Graph([(1, 2), (3, 4)])
+
+    # act
+    actual = _approximations.diameter(graph, sample_size=1)
+
+    # assert
+    assert actual == math.inf
+
+
+def test_average_shortest_path_length__not_connected():
+    # arrange
+    graph = nx.DiGraph([(1, 2), (2, 3)])
+
+    # act & assert
+    with pytest.raises(nx.NetworkXError, match='not strongly connected'):
+        _approximations.average_shortest_path_length(graph, sample_size=3)
+
+
+def test_approximation__reproducible_sample():
+    # arrange
+    graph = nx.gnm_random_graph(200, 800, seed=1)
+
+    # act
+    first = _approximations.average_clustering(graph, sample_size=20)
+    second = _approximations.average_clustering(graph, sample_size=20)
+    other_seed = _approximations.average_clustering(graph, sample_size=20, seed=1)
+
+    # assert
+    assert first == second
+    assert first != other_seed
+
+
+def test_approximation__invalid_sample_size():
+    # act & assert
+    with pytest.raises(ValueError, match='Invalid sample size: 0'):
+        _approximations.average_clustering(nx.path_graph(3), sample_size=0)
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+import graphinate.builders
+from graphinate import GraphType, Timestamp
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+def test_arrow_builder__map_graph_model(map_graph_model):
+    # arrange
+    country_count, city_count, graph_model = map_graph_model
+    person_count = city_count
+
+    # act
+    tables = graphinate.builders.ArrowBuilder(graph_model).build()
+
+    # assert
+    nodes = tables.nodes.to_pydict()
+    assert tables.nodes.num_rows == country_count + city_count + person_count
+    assert nodes['type'].count('country') == country_count
+    assert nodes['type'].count('city') == city_count
+    assert len(set(nodes['id'])) == tables.nodes.num_rows
+    assert set(tables.edges['source'].to_pylist()) <= set(nodes['id'])
+    assert tables.nodes.schema.field('created').type == pa.timestamp('us', tz='UTC')
+
+
+def test_arrow_builder__columns(octagonal_graph_model):
+    # arrange
+    builder = graphinate.builders.ArrowBuilder(octagonal_graph_model)
+
+    # act
+    tables = builder.build(timestamp=Timestamp.COUNTER)
+
+    # assert
+    graph = builder._graph
+    node = tables.nodes.slice(0, 1).to_pylist()[0]
+    node_id, node_data = next(iter(graph.nodes(data=True)))
+    assert node['id'] == str(node_id)
+    assert node['label'] == node_data['label']
+    assert json.loads(node['value']) == list(node_data['value'])
+    assert node['magnitude'] == 1
+    assert node['color'].startswith('#')
+    assert tables.edges.column_names[:2] == ['source', 'target']
+    assert tables.edges['weight'].to_pylist() == [d['weight'] for *_, d in graph.edges(data=True)]
+    assert pa.types.is_integer(tables.edges.schema.field('created').type)
+
+
+def test_arrow_builder__multigraph(octagonal_graph_model):
+    # act
+    tables = graphinate.builders.ArrowBuilder(octagonal_graph_model, GraphType.MultiDiGraph).build()
+
+    # assert
+    assert tables.edges.column_names[:3] == ['source', 'target', 'key']
+
+
+@pytest.mark.parametrize('file_format', ['parquet', 'arrow'])
+def test_graph_tables__write(octagonal_graph_model, tmp_path, file_format):
+    # arrange
+    tables = graphinate.builders.ArrowBuilder(octagonal_graph_model).build()
+
+    # act
+    nodes_path, edges_path = tables.write(tmp_path / 'octagon', file_format=file_format)
+
+    # assert
+    read = pq.read_table if file_format == 'parquet' else (lambda p: pa.ipc.open_file(p).read_all())
+    assert nodes_path.name == f"nodes.{file_format}"
+    assert read(nodes_path).equals(tables.nodes)
+    assert read(edges_path).equals(tables.edges)
+
+
+def test_graph_tables__write__invalid_format(octagonal_graph_model, tmp_path):
+    # arrange
+    tables = graphinate.builders.ArrowBuilder(octagonal_graph_model).build()
+
+    # act & assert
+    with pytest.raises(ValueError, match='Invalid file format: csv'):
+        tables.write(tmp_path, file_format='csv')
+
+
+def test_arrow_builder__without_pyarrow(octagonal_graph_model, monkeypatch):
+    # arrange
+    monkeypatch.setattr(graphinate.builders.arrow, 'HAS_PYARROW', False)
+
+    # act & assert
+    with pytest.raises(ImportError, match='requires pyarrow'):
+        graphinate.builders.ArrowBuilder(octagonal_graph_model)
@@ -0,0 +1,133 @@
+from datetime import datetime
+
+import networkx as nx
+import pytest
+
+import graphinate
+from graphinate import GraphType, Multiplicity, Timestamp
+from graphinate.builders import CompactBuilder, D3Builder, NetworkxBuilder
+
+
+def _graph_model(multiplicity: Multiplicity = Multiplicity.ALL):
+    graph_model = graphinate.model(name='Tree')
+
+    @graph_model.node(multiplicity=multiplicity)
+    def parent():
+        yield from (1, 2, 3, 2)
+
+    @graph_model.node(parent_type='parent', unique=False)
+    def child(parent_id):
+        yield from range(parent_id)
+
+    @graph_model.node(type_='child', key=lambda v: v % 2, multiplicity=multiplicity)
+    def orphan():
+        yield from range(4)
+
+    @graph_model.edge(weight=1.5)
+    def link():
+        yield from ({'source': 1, 'target': 2}, {'source': 2, 'target': 1}, {'source': 2, 'target': 3},
+                    {'source': 3, 'target': 3}, {'source': 1, 'target': 9}, {'source': 1, 'target': 2})
+
+    return graph_model
+
+
+def _edges(graph: nx.Graph) -> list:
+    return list(graph.edges(keys=True, data=True) if graph.is_multigraph() else graph.edges(data=True))
+
+
+def _graph_attributes(graph: nx.Graph) -> dict:
+    attributes = dict(graph.graph)
+    assert isinstance(attributes.pop('created'), datetime)
+    return attributes
+
+
+@pytest.mark.parametrize('multiplicity', [Multiplicity.ALL, Multiplicity.FIRST, Multiplicity.LAST])
+@pytest.mark.parametrize('graph_type', list(GraphType))
+def test_compact_builder__same_as_networkx_builder(multiplicity, graph_type):
+    # arrange
+    graph_model = _graph_model(multiplicity)
+    expected = NetworkxBuilder(graph_model, graph_type).build(timestamp=Timestamp.NONE)
+
+    # act
+    actual = CompactBuilder(graph_model, graph_type).build(timestamp=Timestamp.NONE).to_networkx()
+
+    # assert
+    assert type(actual) is type(expected)
+    assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+    assert _edges(actual) == _edges(expected)
+    assert _graph_attributes(actual) == _graph_attributes(expected)
+
+
+@pytest.mark.parametrize('graph_type', list(GraphType))
+def test_compact_graph__node_link_data(graph_type):
+    # arrange
+    graph_model = _graph_model()
+    graph = CompactBuilder(graph_model, graph_type).build(timestamp=Timestamp.NONE)
+
+    # act
+    actual = graph.node_link_data()
+
+    # assert
+    assert actual == nx.node_link_data(graph.to_networkx(), edges='links')
+
+
+@pytest.mark.parametrize('graph_type', list(GraphType))
+def test_compact_graph__adjacency(graph_type):
+    # arrange
+    graph = CompactBuilder(_graph_model(), graph_type).build()
+    expected = graph.to_networkx()
+
+    # act
+    indptr, indices, edges = graph.adjacency()
+
+    # assert
+    assert len(indptr) == graph.number_of_nodes() + 1
+    assert len(edges) == len(indices) == indptr[-1]
+    assert graph.number_of_edges() == expected.number_of_edges()
+    for node in expected:
+        assert graph.neighbors(node) == list(expected.neighbors(node))
+
+
+def test_compact_graph__interned_attributes():
+    # arrange
+    graph = CompactBuilder(_graph_model(), GraphType.DiGraph).build(timestamp=Timestamp.BUILD)
+
+    # act
+    nodes = dict(graph.nodes())
+
+    # assert
+    assert graph._types == ['parent', 'child', 'link', 'node', 'edge']
+    assert len({data['created'] for data in nodes.values() if 'created' in data}) == 1
+    assert nodes[(1,)]['created'].tzinfo is not None
+    assert nodes[(1, 0)]['lineage'] == [1, 0]
+    index = graph._node_index[(1, 0)]
+    assert graph._lineages[index] is graph._node_ids[index]
+
+
+def test_compact_graph__timestamp_counter():
+    # act
+    graph = CompactBuilder(_graph_model(), GraphType.DiGraph).build(timestamp=Timestamp.COUNTER)
+
+    # assert
+    created = [data['created'] for _, data in graph.nodes() if 'created' in data]
+    assert created == sorted(created)
+    assert all(isinstance(c, int) for c in created)
+
+
+def test_compact_builder__d3_builder():
+    # arrange
+    graph = CompactBuilder(_graph_model(), GraphType.Graph).build()
+
+    # act
+    d3_graph = D3Builder.from_compact(graph)
+
+    # assert
+    assert len(d3_graph['nodes']) == graph.number_of_nodes()
+    assert len(d3_graph['links']) == graph.number_of_edges()
+    assert all(node['color'].startswith('#') for node in d3_graph['nodes'])
+
+
+def test_compact_builder__default_node_attributes():
+    # act & assert
+    with pytest.raises(ValueError, match='does not support default_node_attributes'):
+        CompactBuilder(_graph_model()).build(default_node_attributes={'color': 'red'})
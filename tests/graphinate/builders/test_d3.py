@@ -1,6 +1,17 @@
+import dataclasses
+import enum
+import io
+import json
+import math
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+
+import mappingtools
 import pytest
 
 import graphinate.builders
+from graphinate.builders import d3
+from graphinate.enums import GraphType
 
 
 @pytest.mark.parametrize('execution_number', range(5))
@@ -60,6 +71,74 @@ def test_d3_builder_json_format(map_graph_model):
     #             json.loads(v)  # Check if it's a valid JSON string
 
 
+class _Color(enum.Enum):
+    red = 1
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+    y: str
+
+
+@pytest.mark.parametrize('value', [
+    1, 10 ** 30, 1.5, 1e-07, math.inf, -math.inf, None, True, False, 'text', b'bytes',
+    datetime(2020, 1, 1, tzinfo=timezone.utc), date(2020, 1, 1), timedelta(seconds=3),
+    (1, 'a', (2,)), [1, [2]], {3}, frozenset({4}), {1: {'k': (b'x', None)}}, range(2), Counter(a=2),
+    _Color.red, _Point(1, 'a'), 1j,
+])
+def test_to_strict__same_as_strictify(value):
+    # arrange
+    expected = mappingtools.transformers.strictify({'v': value}, value_handler=d3._convert)
+
+    # act
+    actual = d3._to_strict({'v': value})
+
+    # assert
+    assert actual == expected
+
+
+def test_d3_builder_json_format__shared_values(octagonal_graph_model):
+    # arrange
+    builder = graphinate.builders.D3Builder(octagonal_graph_model)
+
+    # act
+    actual_graph = builder.build(values_format='json')
+
+    # assert
+    node_ids = [node['id'] for node in actual_graph['nodes']]
+    assert all(node_id == node['lineage'] for node_id, node in zip(node_ids, actual_graph['nodes'], strict=True))
+    assert all(link['source'] in node_ids and link['target'] in node_ids for link in actual_graph['links'])
+
+
+def test_d3_builder__build_json(octagonal_graph_model, monkeypatch):
+    # arrange
+    monkeypatch.setattr(d3, 'HAS_ORJSON', False)
+    builder = graphinate.builders.D3Builder(octagonal_graph_model)
+
+    # act
+    actual = json.loads(builder.build_json())
+
+    # assert
+    assert actual['graph']['name'] == 'Octagonal Graph'
+    assert len(actual['nodes']) == 9
+    assert all(isinstance(node['label'], str) and isinstance(node['id'], list) for node in actual['nodes'])
+
+
+def test_d3_builder__build_json__orjson(octagonal_graph_model, monkeypatch):
+    # arrange
+    pytest.importorskip('orjson')
+    builder = graphinate.builders.D3Builder(octagonal_graph_model)
+    expected = builder.build_json()
+    monkeypatch.setattr(d3, 'HAS_ORJSON', False)
+
+    # act
+    actual = builder.build_json()
+
+    # assert
+    assert _without_timestamps(json.loads(actual)) == _without_timestamps(json.loads(expected))
+
+
 def test_d3_builder_invalid_format(map_graph_model):
     # arrange
     _, _, graph_model = map_graph_model
@@ -68,3 +147,38 @@ def test_d3_builder_invalid_format(map_graph_model):
     # act & assert
     with pytest.raises(ValueError, match="Invalid values format: invalid_format"):
         builder.build(values_format='invalid_format')
+
+
+@pytest.mark.parametrize('graph_type', [GraphType.Graph, GraphType.MultiDiGraph])
+@pytest.mark.parametrize('chunk_size', [1, 3, 1000])
+def test_d3_builder__iter_json(octagonal_graph_model, graph_type, chunk_size):
+    # arrange
+    builder = graphinate.builders.D3Builder(octagonal_graph_model, graph_type=graph_type)
+    d3_graph = builder.build()
+    expected = json.dumps(d3_graph, default=str)
+
+    # act
+    actual = ''.join(builder.iter_json(builder._graph, chunk_size=chunk_size))
+
+    # assert
+    assert actual == expected
+
+
+def _without_timestamps(d3_graph: dict) -> dict:
+    for element in (d3_graph['graph'], *d3_graph['nodes'], *d3_graph['links']):
+        element.pop('created', None)
+    return d3_graph
+
+
+def test_d3_builder__dump(octagonal_graph_model):
+    # arrange
+    builder = graphinate.builders.D3Builder(octagonal_graph_model)
+    expected = json.loads(json.dumps(builder.build(), default=str))
+    fp = io.StringIO()
+
+    # act
+    builder.dump(fp, chunk_size=2)
+    actual = json.loads(fp.getvalue())
+
+    # assert
+    assert _without_timestamps(actual) == _without_timestamps(expected)
@@ -1,8 +1,14 @@
+import asyncio
+import concurrent.futures
+import threading
+
 import pytest
 
 import graphinate.builders
 from graphinate import converters
 
+GraphMeasure = graphinate.builders.GraphQLBuilder.GraphMeasure
+
 
 @pytest.mark.parametrize('execution_number', range(5))
 def test_graphql_builder__map_graph_model(execution_number, map_graph_model, graphql_query):
@@ -136,3 +142,551 @@ def test_graphql_builder__ast_model__graph_query(ast_graph_model, graphql_query)
     assert actual_graph['graph']['name'] == 'AST Graph'
     node_types_counts = {c['name']: c['value'] for c in actual_graph['graph']['nodeTypeCounts']}
     assert node_types_counts
+
+
+def test_graphql_builder__timestamp_counter(map_graph_model):
+    # arrange
+    *_, graph_model = map_graph_model
+
+    # act & assert
+    with pytest.raises(ValueError, match='timestamp'):
+        graphinate.builders.GraphQLBuilder(graph_model).build(timestamp=graphinate.Timestamp.COUNTER)
+
+
+def test_graphql_builder__refresh_mutation__patches_graph(octagonal_graph_model):
+    # arrange
+    builder = graphinate.builders.GraphQLBuilder(octagonal_graph_model)
+    schema = builder.build()
+    graph = builder._graph
+
+    # act
+    execution_result = schema.execute_sync('mutation {refresh}')
+
+    # assert
+    assert execution_result.data == {'refresh': True}
+    assert builder._graph is graph
+
+
+def test_graphql_builder__refresh_mutation__async_model():
+    # arrange
+    items = [1, 2]
+    graph_model = graphinate.model(name='Refresh')
+
+    @graph_model.node()
+    async def item():
+        for i in items:
+            yield i
+
+    schema = graphinate.builders.GraphQLBuilder(graph_model).build()
+    items.append(3)
+
+    # act
+    execution_result = asyncio.run(schema.execute('mutation {refresh}'))
+
+    # assert
+    assert execution_result.errors is None
+    assert execution_result.data == {'refresh': True}
+    assert [n['label'] for n in schema.execute_sync('{items {label}}').data['items']] == ['1', '2', '3']
+
+
+def test_graphql_builder__query_during_async_refresh():
+    # arrange
+    graph_model = graphinate.model(name='Slow Refresh')
+    builds = []
+
+    @graph_model.node()
+    async def item():
+        builds.append(asyncio.Event())
+        for i in range(3):
+            yield i
+            if len(builds) > 1:
+                await builds[-1].wait()  # the refresh is suspended after its first node
+
+    schema = graphinate.builders.GraphQLBuilder(graph_model).build()
+
+    async def query_during_refresh():
+        refresh = asyncio.create_task(schema.execute('mutation {refresh}'))
+        while len(builds) < 2:
+            await asyncio.sleep(0.01)
+        result = await schema.execute('{graph {nodeCount} items {label}}')
+        builds[-1].set()
+        return result, await refresh
+
+    # act
+    query_result, refresh_result = asyncio.run(query_during_refresh())
+
+    # assert
+    assert query_result.errors is None
+    assert query_result.data == {'graph': {'nodeCount': 3}, 'items': [{'label': '0'}, {'label': '1'}, {'label': '2'}]}
+    assert refresh_result.data == {'refresh': True}
+
+
+def test_graphql_builder__neighbors(map_graph_model):
+    # arrange
+    *_, graph_model = map_graph_model
+    builder = graphinate.builders.GraphQLBuilder(graph_model)
+    schema = builder.build()
+    query = ('{cities {id neighbors {id type} countries: neighbors(type: country) {id} '
+             'children: neighbors(children: true) {type}}}')
+
+    # act
+    execution_result = schema.execute_sync(query)
+
+    # assert
+    assert execution_result.errors is None
+    graph = builder._graph
+    for city in execution_result.data['cities']:
+        node = converters.decode_node_id(city['id'])
+        expected_ids = {converters.encode_node_id(n) for n in graph.neighbors(node)}
+        assert {n['id'] for n in city['neighbors']} == expected_ids
+        assert len(city['countries']) == 1
+        assert {n['type'] for n in city['children']} <= {'male', 'female'}
+
+
+@pytest.mark.parametrize(('node_id', 'expected_count'), [
+    ((0,), 1),
+    ((42,), 0),
+    ([0], 0),
+])
+def test_graphql_builder__nodes__node_id(octagonal_graph_model, node_id, expected_count):
+    # arrange
+    schema = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build()
+    encoded_node_id = converters.encode_node_id(node_id)
+
+    # act
+    execution_result = schema.execute_sync(f'{{nodes(nodeId: "{encoded_node_id}") {{id}}}}')
+
+    # assert
+    assert execution_result.errors is None
+    assert [n['id'] for n in execution_result.data['nodes']] == [encoded_node_id] * expected_count
+
+
+@pytest.mark.parametrize(('graph_type', 'edge_id', 'expected_count'), [
+    (graphinate.GraphType.Graph, ((0,), (1,)), 1),
+    (graphinate.GraphType.Graph, ((0,), (2,)), 0),
+    (graphinate.GraphType.MultiGraph, ((0,), (1,)), 2),
+    (graphinate.GraphType.Graph, ((0,), (1,), (2,)), 0),
+])
+def test_graphql_builder__edges__edge_id(graph_type, edge_id, expected_count):
+    # arrange
+    graph_model = graphinate.model(name='Parallel Edges')
+
+    @graph_model.edge()
+    def edge():
+        yield from ({'source': 0, 'target': 1}, {'source': 0, 'target': 1}, {'source': 1, 'target': 2})
+
+    schema = graphinate.builders.GraphQLBuilder(graph_model, graph_type).build()
+    encoded_edge_id = converters.encode_edge_id(edge_id)
+
+    # act
+    execution_result = schema.execute_sync(f'{{edges(edgeId: "{encoded_edge_id}") {{id}}}}')
+
+    # assert
+    assert execution_result.errors is None
+    assert [e['id'] for e in execution_result.data['edges']] == [encoded_edge_id] * expected_count
+
+
+def test_graphql_builder__typed_nodes_field(map_graph_model):
+    # arrange
+    country_count, city_count, graph_model = map_graph_model
+    builder = graphinate.builders.GraphQLBuilder(graph_model)
+    schema = builder.build()
+
+    # act
+    execution_result = schema.execute_sync('{countries {id type} cities {id type}}')
+
+    # assert
+    assert execution_result.errors is None
+    assert len(execution_result.data['countries']) == country_count
+    assert len(execution_result.data['cities']) == city_count
+    assert {n['type'] for n in execution_result.data['countries']} == {'country'}
+    assert {n['type'] for n in execution_result.data['cities']} == {'city'}
+
+
+def test_graphql_builder__typed_nodes_field__after_refresh():
+    # arrange
+    items = [1, 2]
+    graph_model = graphinate.model(name='Refresh')
+
+    @graph_model.node()
+    def item():
+        yield from items
+
+    schema = graphinate.builders.GraphQLBuilder(graph_model).build()
+    items.append(3)
+
+    # act
+    schema.execute_sync('mutation {refresh}')
+    execution_result = schema.execute_sync('{items {label}}')
+
+    # assert
+    assert [n['label'] for n in execution_result.data['items']] == ['1', '2', '3']
+
+
+def test_graphql_builder__node_type_index(map_graph_model):
+    # arrange
+    country_count, city_count, graph_model = map_graph_model
+    builder = graphinate.builders.GraphQLBuilder(graph_model)
+    builder.build()
+    graph = builder._graph
+
+    # act
+    countries = builder._nodes_of_type('country')
+
+    # assert
+    assert len(countries.ids) == country_count
+    assert len(builder._nodes_of_type('city').ids) == city_count
+    assert builder._nodes_of_type('unknown').ids == []
+    assert all(graph.nodes[n]['type'] == t for t, index in builder._node_type_index.items() for n in index.ids)
+    assert all(countries.ids[i] == n for n, i in countries.positions.items())
+    builder.refresh()
+    assert builder._node_type_index is None
+
+
+def _paginate(schema, field: str, first: int, selection: str = 'label') -> list[str]:
+    labels, after, has_next_page = [], None, True
+    while has_next_page:
+        after_argument = f', after: "{after}"' if after else ''
+        query = (f'{{{field}(first: {first}{after_argument}) '
+                 f'{{edges {{cursor node {{{selection}}}}} pageInfo {{hasNextPage endCursor}}}}}}')
+        execution_result = schema.execute_sync(query)
+        assert execution_result.errors is None
+        connection = execution_result.data[field]
+        assert len(connection['edges']) <= first
+        labels.extend(edge['node'][selection] for edge in connection['edges'])
+        has_next_page = connection['pageInfo']['hasNextPage']
+        after = connection['pageInfo']['endCursor']
+    return labels
+
+
+@pytest.mark.parametrize('first', [1, 3, 100])
+@pytest.mark.parametrize('field', ['nodes', 'edges', 'countries', 'cities'])
+def test_graphql_builder__connection(map_graph_model, field, first):
+    # arrange
+    *_, graph_model = map_graph_model
+    schema = graphinate.builders.GraphQLBuilder(graph_model).build()
+    expected = [item['label'] for item in schema.execute_sync(f'{{{field} {{label}}}}').data[field]]
+
+    # act
+    actual = _paginate(schema, f'{field}Connection', first)
+
+    # assert
+    assert actual == expected
+
+
+def test_graphql_builder__node_connections(octagonal_graph_model):
+    # arrange
+    schema = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build()
+    query = ('{nodes {id neighbors {label} edges {label} '
+             'neighborsConnection(first: 1) {edges {node {label}} pageInfo {hasNextPage hasPreviousPage}} '
+             'edgesConnection(first: 1) {edges {cursor}}}}')
+    after_query = '{{nodes(nodeId: "{}") {{edgesConnection(after: "{}") {{edges {{node {{label}}}}}}}}}}'
+
+    # act
+    execution_result = schema.execute_sync(query)
+    after_results = [
+        schema.execute_sync(after_query.format(node['id'], node['edgesConnection']['edges'][0]['cursor']))
+        for node in execution_result.data['nodes']
+    ]
+
+    # assert
+    assert execution_result.errors is None
+    for node, after_result in zip(execution_result.data['nodes'], after_results):
+        neighbors_connection = node['neighborsConnection']
+        assert [e['node'] for e in neighbors_connection['edges']] == node['neighbors'][:1]
+        assert neighbors_connection['pageInfo'] == {'hasNextPage': True, 'hasPreviousPage': False}
+        after_edges = after_result.data['nodes'][0]['edgesConnection']['edges']
+        assert [e['node'] for e in after_edges] == node['edges'][1:]
+
+
+def test_graphql_builder__connection__stable_cursor_after_refresh():
+    # arrange
+    items = [2, 4, 6]
+    graph_model = graphinate.model(name='Refresh')
+
+    @graph_model.node()
+    def item():
+        yield from items
+
+    schema = graphinate.builders.GraphQLBuilder(graph_model).build()
+    query = '{{itemsConnection(first: 1{}) {{edges {{cursor node {{label}}}}}}}}'
+    cursor = schema.execute_sync(query.format('')).data['itemsConnection']['edges'][0]['cursor']
+    items[:] = [0, 2, 6, 8]
+
+    # act
+    execution_result = schema.execute_sync('mutation {refresh}')
+    next_page = schema.execute_sync(query.format(f', after: "{cursor}"')).data['itemsConnection']['edges']
+
+    # assert
+    assert execution_result.errors is None
+    assert [e['node']['label'] for e in next_page] == ['6']
+
+
+def test_graphql_builder__connection__cursor_of_removed_item():
+    # arrange
+    items = [1, 2]
+    graph_model = graphinate.model(name='Refresh')
+
+    @graph_model.node()
+    def item():
+        yield from items
+
+    schema = graphinate.builders.GraphQLBuilder(graph_model).build()
+    cursor = schema.execute_sync('{nodesConnection(first: 1) {edges {cursor}}}').data['nodesConnection']['edges'][0]
+    items.remove(1)
+    schema.execute_sync('mutation {refresh}')
+
+    # act
+    execution_result = schema.execute_sync(f'{{nodesConnection(after: "{cursor["cursor"]}") {{edges {{cursor}}}}}}')
+
+    # assert
+    assert 'no longer exists' in execution_result.errors[0].message
+
+
+@pytest.mark.parametrize('graph_type', [graphinate.GraphType.Graph, graphinate.GraphType.MultiGraph])
+def test_graphql_builder__edges_connection__parallel_edges(graph_type):
+    # arrange
+    graph_model = graphinate.model(name='Parallel')
+
+    @graph_model.edge()
+    def edge():
+        yield from ({'source': 1, 'target': 2, 'value': v} for v in range(3))
+
+    schema = graphinate.builders.GraphQLBuilder(graph_model, graph_type=graph_type).build()
+    expected = [e['id'] for e in schema.execute_sync('{edges {id}}').data['edges']]
+
+    # act
+    actual = _paginate(schema, 'edgesConnection', 1, 'id')
+
+    # assert
+    assert actual == expected
+
+
+@pytest.mark.parametrize(('arguments', 'expected_error'), [
+    ('first: -1', 'Invalid first'),
+    ('after: "xx"', 'Invalid cursor'),
+])
+def test_graphql_builder__connection__invalid_arguments(octagonal_graph_model, arguments, expected_error):
+    # arrange
+    schema = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build()
+
+    # act
+    execution_result = schema.execute_sync(f'{{nodesConnection({arguments}) {{edges {{cursor}}}}}}')
+
+    # assert
+    assert expected_error in execution_result.errors[0].message
+
+
+@pytest.fixture
+def graph_node_calls(monkeypatch):
+    calls = []
+    graph_node = graphinate.builders.GraphQLBuilder._graph_node
+
+    def counting_graph_node(node_class, node, node_data):
+        calls.append(node)
+        return graph_node(node_class, node, node_data)
+
+    monkeypatch.setattr(graphinate.builders.GraphQLBuilder, '_graph_node', staticmethod(counting_graph_node))
+    return calls
+
+
+def test_graphql_builder__graph_nodes_loaded_once_per_operation(octagonal_graph_model, graph_node_calls):
+    # arrange
+    schema = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build()
+    query = '{edges {source {id neighbors {id}} target {id}} nodes {id}}'
+
+    # act
+    sync_result = schema.execute_sync(query)
+    sync_calls = list(graph_node_calls)
+    async_result = asyncio.run(schema.execute(query))
+
+    # assert
+    assert sync_result.errors is None
+    assert async_result.data == sync_result.data
+    assert sorted(sync_calls) == sorted({(i,) for i in range(9)})
+    assert len(graph_node_calls) == 2 * len(sync_calls)
+
+
+def test_graphql_builder__load_graph_node__outside_operation(octagonal_graph_model):
+    # arrange
+    builder = graphinate.builders.GraphQLBuilder(octagonal_graph_model)
+    builder.build()
+    node_class = builder._graphql_types['node']
+    node_data = builder._graph.nodes[(0,)]
+
+    # act
+    first = builder._load_graph_node(node_class, (0,), node_data)
+    second = builder._load_graph_node(node_class, (0,), node_data)
+
+    # assert
+    assert first is not second
+    assert first == second
+
+
+@pytest.fixture
+def measure_calls(monkeypatch):
+    calls = []
+    measure_function = graphinate.builders.GraphQLBuilder._measure_function
+
+    def counting_measure_function(measure):
+        function = measure_function(measure)
+
+        def counting_function(graph):
+            calls.append((measure, threading.current_thread().name))
+            return function(graph)
+
+        return counting_function
+
+    monkeypatch.setattr(graphinate.builders.GraphQLBuilder, '_measure_function',
+                        staticmethod(counting_measure_function))
+    return calls
+
+
+def test_graphql_builder__measures_cached(octagonal_graph_model, measure_calls):
+    # arrange
+    builder = graphinate.builders.GraphQLBuilder(octagonal_graph_model)
+    schema = builder.build()
+    query = '{graph {radius diameter hash} measure(measure: diameter) {value}}'
+
+    # act
+    first = schema.execute_sync(query)
+    second = schema.execute_sync(query)
+    schema.execute_sync('mutation {refresh}')
+    refreshed = schema.execute_sync(query)
+
+    # assert
+    assert first.errors is None
+    assert first.data == second.data == refreshed.data
+    assert first.data['graph']['diameter'] == first.data['measure']['value'] == 4
+    expected_calls = [GraphMeasure.is_connected, GraphMeasure.radius, GraphMeasure.diameter]
+    assert [measure for measure, _ in measure_calls] == expected_calls * 2
+
+
+def test_graphql_builder__approximate_measures(octagonal_graph_model, measure_calls):
+    # arrange
+    schema = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build()
+    query = """{
+        graph {diameter(sampleSize: 20)}
+        exact: measure(measure: average_shortest_path_length) {value}
+        sampled: measure(measure: average_shortest_path_length, sampleSize: 20) {value}
+        clustering: measure(measure: average_clustering, sampleSize: 2) {name value}
+    }"""
+
+    # act
+    first = schema.execute_sync(query)
+    second = schema.execute_sync(query)
+
+    # assert
+    assert first.errors is None
+    assert first.data == second.data
+    assert first.data['graph']['diameter'] == 4
+    assert first.data['sampled'] == first.data['exact']
+    assert first.data['clustering']['name'] == 'average_clustering'
+    assert [measure for measure, _ in measure_calls] == [GraphMeasure.average_shortest_path_length]
+
+
+@pytest.mark.parametrize(('arguments', 'expected_error'), [
+    ('measure: radius, sampleSize: 2', 'Measure radius has no approximation'),
+    ('measure: diameter, sampleSize: 0', 'Invalid sample size: 0'),
+])
+def test_graphql_builder__approximate_measures__invalid_arguments(octagonal_graph_model, arguments, expected_error):
+    # arrange
+    schema = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build()
+
+    # act
+    execution_result = schema.execute_sync(f'{{measure({arguments}) {{value}}}}')
+
+    # assert
+    assert expected_error in execution_result.errors[0].message
+
+
+def test_graphql_builder__precomputed_measures(octagonal_graph_model):
+    # arrange
+    builder = graphinate.builders.GraphQLBuilder(octagonal_graph_model)
+
+    # act
+    builder.build(precomputed_measures=[GraphMeasure.diameter, GraphMeasure.is_tree])
+    for thread in threading.enumerate():
+        if thread.name == 'graphinate-measures':
+            thread.join()
+
+    # assert
+    assert GraphMeasure.diameter in builder._measures
+    assert GraphMeasure.is_tree in builder._measures
+    assert GraphMeasure.radius not in builder._measures
+
+
+def test_graphql_builder__measures_async(octagonal_graph_model):
+    # arrange
+    query = '{graph {radius diameter hash averageDegree} measure(measure: is_tree) {name value}}'
+    expected = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build().execute_sync(query).data
+    schema = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build()
+
+    # act
+    actual = asyncio.run(schema.execute(query))
+
+    # assert
+    assert actual.errors is None
+    assert actual.data == expected
+
+
+def test_graphql_builder__measures_async__executor(octagonal_graph_model, measure_calls):
+    # arrange
+    query = '{graph {diameter} measure(measure: is_directed) {value}}'
+    with concurrent.futures.ThreadPoolExecutor(thread_name_prefix='measure-executor') as executor:
+        schema = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build(measure_executor=executor)
+
+        # act
+        actual = asyncio.run(schema.execute(query))
+
+    # assert
+    assert actual.data == {'graph': {'diameter': 4}, 'measure': {'value': 0.0}}
+    threads = dict(measure_calls)
+    assert threads[GraphMeasure.is_directed] == 'MainThread'
+    assert threads[GraphMeasure.is_connected].startswith('measure-executor')
+    assert threads[GraphMeasure.diameter].startswith('measure-executor')
+
+
+def test_graphql_builder__measure_timeout(octagonal_graph_model, monkeypatch):
+    # arrange
+    release = threading.Event()
+    measure_function = graphinate.builders.GraphQLBuilder._measure_function
+
+    def slow_measure_function(measure):
+        def slow_function(graph):
+            release.wait()
+            return measure_function(measure)(graph)
+
+        return slow_function
+
+    monkeypatch.setattr(graphinate.builders.GraphQLBuilder, '_measure_function', staticmethod(slow_measure_function))
+    query = '{measure(measure: diameter) {value}}'
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        schema = graphinate.builders.GraphQLBuilder(octagonal_graph_model).build(measure_executor=executor,
+                                                                                 measure_timeout=0.05)
+
+        # act
+        timed_out = asyncio.run(schema.execute(query))
+        release.set()
+        completed = asyncio.run(schema.execute(query))
+
+    # assert
+    assert 'was not computed within 0.05 seconds' in timed_out.errors[0].message
+    assert completed.errors is None
+    assert completed.data == {'measure': {'value': 4.0}}
+
+
+def test_graph_node_loader__operation_error():
+    from graphinate.builders.graphql import _GraphNodeLoader, _loaded_graph_nodes
+
+    # arrange
+    operation = _GraphNodeLoader().on_operation()
+    next(operation)
+
+    # act
+    with pytest.raises(RuntimeError, match='operation failed'):
+        operation.throw(RuntimeError('operation failed'))
+
+    # assert
+    assert _loaded_graph_nodes.get() is None
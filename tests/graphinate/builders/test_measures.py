@@ -0,0 +1,219 @@
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+
+import networkx as nx
+import pytest
+
+from graphinate.builders._measures import MeasureCache, MeasureProcessExecutor
+
+
+def _sleep(graph: nx.Graph):
+    time.sleep(60)
+
+
+@pytest.fixture(scope='module')
+def process_executor():
+    executor = MeasureProcessExecutor()
+    yield executor
+    executor.shutdown(cancel_futures=True)
+
+
+def test_measure_cache__computes_once():
+    # arrange
+    cache = MeasureCache(nx.Graph())
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute(graph):
+        calls.append(1)
+        started.set()
+        release.wait()
+        return 42
+
+    # act
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(cache.get, 'measure', compute)
+        started.wait()
+        second = executor.submit(cache.get, 'measure', compute)
+        release.set()
+        results = [first.result(), second.result()]
+
+    # assert
+    assert results == [42, 42]
+    assert calls == [1]
+
+
+def test_measure_cache__failure_not_cached():
+    # arrange
+    cache = MeasureCache(nx.Graph())
+
+    def fail(graph):
+        raise ValueError('not connected')
+
+    # act & assert
+    with pytest.raises(ValueError, match='not connected'):
+        cache.get('measure', fail)
+    assert 'measure' not in cache
+    assert cache.get('measure', lambda graph: 1) == 1
+
+
+def test_measure_cache__does_not_block_event_loop():
+    # arrange
+    ticks = []
+
+    def slow_diameter(graph):
+        time.sleep(0.2)
+        return nx.diameter(graph)
+
+    async def tick():
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0.01)
+
+    async def measure(cache):
+        ticker = asyncio.create_task(tick())
+        try:
+            return await cache.resolve('diameter', slow_diameter)
+        finally:
+            ticker.cancel()
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        cache = MeasureCache(nx.path_graph(3), executor=executor)
+
+        # act
+        actual = asyncio.run(measure(cache))
+
+    # assert
+    assert actual == 2
+    assert len(ticks) > 5
+    assert 'diameter' in cache
+
+
+def test_measure_cache__inline():
+    # arrange
+    cache = MeasureCache(nx.path_graph(3), executor=concurrent.futures.ThreadPoolExecutor())
+
+    async def measure():
+        return cache.resolve('threads', lambda graph: threading.current_thread().name, inline=True)
+
+    # act
+    actual = asyncio.run(measure())
+
+    # assert
+    assert actual == 'MainThread'
+
+
+def test_measure_cache__cancels_pending_computation():
+    # arrange
+    release = threading.Event()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        cache = MeasureCache(nx.Graph(), executor=executor, timeout=0.05)
+        busy = executor.submit(release.wait)
+
+        # act
+        with pytest.raises(TimeoutError, match='was not computed'):
+            asyncio.run(cache.aget('measure', lambda graph: 1))
+        release.set()
+        busy.result()
+
+    # assert
+    assert 'measure' not in cache
+    assert cache.get('measure', lambda graph: 2) == 2
+
+
+def test_measure_cache__process_executor(process_executor):
+    # arrange
+    graph = nx.cycle_graph(8)
+    nx.set_node_attributes(graph, {n: (lambda: n) for n in graph}, 'unpicklable')
+    nx.set_edge_attributes(graph, 2.0, 'weight')
+    cache = MeasureCache(graph, executor=process_executor)
+
+    # act
+    diameter = asyncio.run(cache.aget('diameter', nx.diameter))
+    is_weighted = asyncio.run(cache.aget('is_weighted', nx.is_weighted))
+
+    # assert
+    assert diameter == 4
+    assert is_weighted is True
+
+
+def test_measure_cache__process_executor__failure(process_executor):
+    # arrange
+    cache = MeasureCache(nx.Graph([(1, 2), (3, 4)]), executor=process_executor)
+
+    # act & assert
+    with pytest.raises(nx.NetworkXError, match='not connected'):
+        asyncio.run(cache.aget('diameter', nx.diameter))
+    assert 'diameter' not in cache
+
+
+def test_measure_cache__terminates_abandoned_computation(process_executor):
+    # arrange
+    cache = MeasureCache(nx.Graph(), executor=process_executor, timeout=0.5)
+
+    # act
+    with pytest.raises(TimeoutError, match='was not computed'):
+        asyncio.run(cache.aget('sleep', _sleep))
+    deadline = time.monotonic() + 10
+    while process_executor._futures and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    # assert
+    assert not process_executor._futures  # the process was terminated long before it would complete
+    assert 'sleep' not in cache
+
+
+def test_measure_process_executor__terminate(process_executor):
+    # act
+    future = process_executor.submit(time.sleep, 60)
+    time.sleep(0.5)
+    is_terminated = future.terminate()
+
+    # assert
+    assert is_terminated
+    with pytest.raises(concurrent.futures.CancelledError):
+        future.result(timeout=10)
+    assert not future.terminate()
+
+
+def test_measure_process_executor__reuses_worker():
+    # arrange
+    executor = MeasureProcessExecutor()
+
+    try:
+        # act
+        first = executor.submit(os.getpid).result(timeout=30)
+        failed = executor.submit(time.sleep, 'not a number')
+        with pytest.raises(TypeError):
+            failed.result(timeout=30)
+        second = executor.submit(os.getpid).result(timeout=30)
+
+        terminated = executor.submit(time.sleep, 60)
+        time.sleep(0.5)
+        terminated.terminate()
+        with pytest.raises(concurrent.futures.CancelledError):
+            terminated.result(timeout=10)
+        third = executor.submit(os.getpid).result(timeout=30)
+
+        # assert
+        assert first == second != os.getpid()
+        assert third != first  # the worker of the terminated task was replaced
+        assert len(executor._idle) == 1
+    finally:
+        executor.shutdown()
+
+    assert executor._idle == []
+
+
+def test_measure_process_executor__shutdown():
+    # arrange
+    executor = MeasureProcessExecutor()
+    executor.shutdown()
+
+    # act & assert
+    with pytest.raises(RuntimeError, match='shutdown'):
+        executor.submit(time.sleep, 0)
@@ -1,7 +1,12 @@
+import asyncio
+import itertools
+import threading
+import time
 from collections import Counter
 
 import networkx as nx
 import pytest
+from loguru import logger
 
 import graphinate
 import graphinate.builders
@@ -109,6 +114,43 @@ def test_networkx_builder_repeating_edges(weight):
     assert all(m == weight * 2 for *_, m in graph.edges.data('weight'))
 
 
+def test_networkx_builder__shared_type_and_label_strings():
+    # arrange
+    graph_model = graphinate.GraphModel(name='Shared Strings')
+
+    @graph_model.node(label=lambda value: f"{value % 2}")
+    def number():
+        yield from range(10)
+
+    @graph_model.node()
+    def name():
+        yield from ('a', 'b')
+
+    pools = []
+
+    @graph_model.edge()
+    def link():
+        pools.append(dict(builder._labels))
+        for i in range(9):
+            yield {'source': i, 'target': i + 1}
+
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+
+    # act
+    graph = builder.build()
+
+    # assert
+    numbers = [data for _, data in graph.nodes.data() if data['type'] == 'number']
+    node_types = {id(data['type']) for data in numbers}
+    node_labels = {id(data['label']) for data in numbers}
+    edge_types = {id(t) for *_, t in graph.edges.data('type')}
+    assert len(node_types) == 1
+    assert len(node_labels) == 2
+    assert len(edge_types) == 1
+    assert pools == [{'0': '0', '1': '1'}]  # labels defaulting to node keys are not pooled
+    assert builder._labels == {}
+
+
 def test_networkx_builder_simple_tuple():
     # arrange
     name = 'Simple Tuple'
@@ -349,3 +391,624 @@ def test_populate_nodes_universe_node_parent_handling(builder_with_graph):
     # Lineage should be (node.key,) and no edge should be created
     assert builder_with_graph._graph.nodes[node_id]['lineage'] == [node.key]
     assert len(builder_with_graph._graph.edges) == 0
+
+
+def _async_tree_graph_model(delay: float = 0.0):
+    graph_model = GraphModel(name='Async Tree')
+    state = {'running': 0, 'max_running': 0}
+
+    async def tracked(items):
+        state['running'] += 1
+        state['max_running'] = max(state['max_running'], state['running'])
+        await asyncio.sleep(delay)
+        state['running'] -= 1
+        for item in items:
+            yield item
+
+    @graph_model.node()
+    async def parent():
+        async for i in tracked(range(4)):
+            yield i
+
+    @graph_model.node(parent_type='parent', unique=False)
+    async def child(parent_id):
+        async for i in tracked(range(3)):
+            yield f"{parent_id}-{i}"
+
+    @graph_model.edge()
+    async def link():
+        async for i in tracked(range(3)):
+            yield {'source': i, 'target': i + 1}
+
+    return graph_model, state
+
+
+@pytest.mark.asyncio
+async def test_networkx_builder__abuild():
+    # arrange
+    graph_model, state = _async_tree_graph_model(delay=0.01)
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+
+    # act
+    graph = await builder.abuild()
+
+    # assert
+    assert graph.graph['node_types'] == {'parent': 4, 'child': 12}
+    assert graph.graph['edge_types'] == {'link': 3, 'edge': 12}
+    assert graph.order() == 16
+    assert state['max_running'] > 1
+
+
+@pytest.mark.asyncio
+async def test_networkx_builder__abuild__max_concurrency():
+    # arrange
+    graph_model, state = _async_tree_graph_model(delay=0.01)
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+
+    # act
+    graph = await builder.abuild(max_concurrency=1)
+
+    # assert
+    assert graph.order() == 16
+    assert state['max_running'] == 1
+
+
+@pytest.mark.asyncio
+async def test_networkx_builder__abuild__invalid_max_concurrency():
+    # arrange
+    graph_model, _ = _async_tree_graph_model()
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+
+    # act & assert
+    with pytest.raises(ValueError, match='max_concurrency'):
+        await builder.abuild(max_concurrency=0)
+
+
+def test_networkx_builder__build_async_model():
+    # arrange
+    graph_model, _ = _async_tree_graph_model()
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+
+    # act
+    graph = builder.build()
+
+    # assert
+    assert graph.graph['node_types'] == {'parent': 4, 'child': 12}
+    assert graph.nodes[(0, '0-0')]['lineage'] == [0, '0-0']
+    assert graph.has_edge((0,), (0, '0-0'))
+
+
+def test_networkx_builder__abuild__same_as_build():
+    # arrange
+    graph_model = GraphModel(name='Sync Tree')
+
+    @graph_model.node()
+    def parent():
+        yield from range(3)
+
+    @graph_model.node(parent_type='parent', unique=False)
+    def child(parent_id):
+        yield from range(parent_id + 2)
+
+    @graph_model.node(type_='parent', multiplicity=Multiplicity.LAST)
+    def other_parent():
+        yield from range(1, 5)
+
+    # act
+    expected = graphinate.builders.NetworkxBuilder(graph_model).build()
+    actual = asyncio.run(graphinate.builders.NetworkxBuilder(graph_model).abuild())
+
+    # assert
+    assert list(actual.nodes(data='value')) == list(expected.nodes(data='value'))
+    assert list(actual.edges) == list(expected.edges)
+    assert actual.graph['node_types'] == expected.graph['node_types']
+
+
+@pytest.mark.parametrize('multiplicity', [Multiplicity.ALL, Multiplicity.FIRST, Multiplicity.LAST])
+def test_networkx_builder__abuild__multiplicity(multiplicity):
+    # arrange
+    graph_model = GraphModel(name='Async Multiplicity')
+
+    @graph_model.node(multiplicity=multiplicity)
+    async def node():
+        for i in (1, 2, 3):
+            yield i
+            await asyncio.sleep(0)
+
+    @graph_model.node(type_='node', key=lambda v: 1, multiplicity=multiplicity)
+    def other_node():
+        yield 4
+
+    # act
+    expected = graphinate.builders.NetworkxBuilder(graph_model).build()
+    actual = asyncio.run(graphinate.builders.NetworkxBuilder(graph_model).abuild())
+
+    # assert
+    assert actual.nodes[(1,)]['value'] == expected.nodes[(1,)]['value']
+    assert actual.nodes[(1,)]['magnitude'] == expected.nodes[(1,)]['magnitude']
+
+
+def _blocking_tree_graph_model(delay: float = 0.0):
+    graph_model = GraphModel(name='Blocking Tree')
+    lock = threading.Lock()
+    state = {'running': 0, 'max_running': 0, 'threads': set()}
+
+    def tracked(items):
+        with lock:
+            state['running'] += 1
+            state['max_running'] = max(state['max_running'], state['running'])
+            state['threads'].add(threading.current_thread().name)
+        time.sleep(delay)
+        with lock:
+            state['running'] -= 1
+        return items
+
+    @graph_model.node()
+    def parent():
+        yield from tracked(range(4))
+
+    @graph_model.node(parent_type='parent', unique=False)
+    def child(parent_id):
+        yield from tracked(range(parent_id + 1))
+
+    @graph_model.node(parent_type='child', unique=False, multiplicity=Multiplicity.LAST)
+    def leaf(parent_id, child_id):
+        yield from tracked([parent_id, child_id, parent_id])
+
+    @graph_model.edge()
+    def link():
+        yield from tracked({'source': i, 'target': i + 1} for i in range(3))
+
+    return graph_model, state
+
+
+def test_networkx_builder__build__max_workers():
+    # arrange
+    graph_model, state = _blocking_tree_graph_model(delay=0.01)
+    expected = graphinate.builders.NetworkxBuilder(graph_model).build()
+    state['max_running'] = 0
+
+    # act
+    actual = graphinate.builders.NetworkxBuilder(graph_model).build(max_workers=4)
+
+    # assert
+    assert state['max_running'] > 1
+    assert list(actual.nodes(data='value')) == list(expected.nodes(data='value'))
+    assert list(actual.nodes(data='magnitude')) == list(expected.nodes(data='magnitude'))
+    assert list(actual.edges) == list(expected.edges)
+    assert actual.graph['node_types'] == expected.graph['node_types']
+    assert actual.graph['edge_types'] == expected.graph['edge_types']
+
+
+def test_networkx_builder__build__max_workers__single_worker():
+    # arrange
+    graph_model, state = _blocking_tree_graph_model()
+
+    # act
+    graph = graphinate.builders.NetworkxBuilder(graph_model).build(max_workers=1)
+
+    # assert
+    assert state['max_running'] == 1
+    assert state['threads'] != {threading.current_thread().name}
+    assert graph.graph['node_types'] == {'parent': 4, 'child': 10, 'leaf': 16}
+
+
+def test_networkx_builder__build__invalid_max_workers():
+    # arrange
+    graph_model, _ = _blocking_tree_graph_model()
+
+    # act & assert
+    with pytest.raises(ValueError, match='max_workers'):
+        graphinate.builders.NetworkxBuilder(graph_model).build(max_workers=0)
+
+
+def test_networkx_builder__build__max_workers__generator_error():
+    # arrange
+    graph_model = GraphModel(name='Failing')
+
+    @graph_model.node()
+    def node():
+        yield 1
+        raise RuntimeError('generator failed')
+
+    # act & assert
+    with pytest.raises(RuntimeError, match='generator failed'):
+        graphinate.builders.NetworkxBuilder(graph_model).build(max_workers=2)
+
+
+@pytest.mark.parametrize('max_workers', [None, 2])
+def test_networkx_builder__build__implicit_lineage_nodes_order(max_workers):
+    # arrange
+    graph_model = GraphModel(name='Lineage')
+
+    @graph_model.node()
+    def a():
+        yield from ('x', 'w')
+
+    @graph_model.node(parent_type='a')
+    def b(a_id):
+        yield 'y'
+
+    # the parent edges of 'c' nodes start at the (implicit) lineage nodes of the unique 'b' node
+    @graph_model.node(parent_type='b', unique=False)
+    def c(a_id, b_id):
+        yield from ('z', 'v')
+
+    # act
+    graph = graphinate.builders.NetworkxBuilder(graph_model).build(max_workers=max_workers)
+
+    # assert
+    assert list(graph.nodes) == [('x',), ('y',), ('x', 'y', 'z'), ('x', 'y'), ('x', 'y', 'v'),
+                                 ('w',), ('w', 'y', 'z'), ('w', 'y'), ('w', 'y', 'v')]
+    assert list(graph.edges) == [(('x',), ('y',)), (('y',), ('w',)),
+                                 (('x', 'y', 'z'), ('x', 'y')), (('x', 'y'), ('x', 'y', 'v')),
+                                 (('w', 'y', 'z'), ('w', 'y')), (('w', 'y'), ('w', 'y', 'v'))]
+
+
+def test_networkx_builder__refresh__keeps_graph_during_rebuild():
+    # arrange
+    graph_model = GraphModel(name='Refresh')
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+    graphs = []
+
+    @graph_model.node()
+    def item():
+        graphs.append(builder._graph)
+        yield from (1, 2)
+
+    graph = builder.build()
+
+    # act
+    builder.refresh()
+
+    # assert
+    assert graphs == [graph, graph]
+    assert builder._graph is graph
+    assert list(graph) == [(1,), (2,)]
+
+
+def _repeating_elements_graph_model():
+    graph_model = GraphModel(name='Repeating Elements')
+
+    @graph_model.node()
+    def node():
+        yield from (1, 2, 1)
+
+    @graph_model.edge()
+    def edge():
+        yield from ({'source': 1, 'target': 2}, {'source': 1, 'target': 2})
+
+    return graph_model
+
+
+def test_networkx_builder__build__timestamp_build():
+    # act
+    graph = graphinate.builders.NetworkxBuilder(_repeating_elements_graph_model()).build(
+        timestamp=graphinate.Timestamp.BUILD)
+
+    # assert
+    node_timestamps = [d[k] for _, d in graph.nodes(data=True) for k in ('created', 'updated') if k in d]
+    edge_timestamps = [d[k] for *_, d in graph.edges(data=True) for k in ('created', 'updated') if k in d]
+    assert len(node_timestamps) == 3
+    assert len(edge_timestamps) == 2
+    assert len(set(node_timestamps + edge_timestamps)) == 1
+
+
+def test_networkx_builder__build__timestamp_counter():
+    # act
+    graph = graphinate.builders.NetworkxBuilder(_repeating_elements_graph_model()).build(
+        timestamp=graphinate.Timestamp.COUNTER)
+
+    # assert
+    assert graph.nodes[(1,)]['created'] == 0
+    assert graph.nodes[(2,)]['created'] == 1
+    assert graph.nodes[(1,)]['updated'] == 2
+    assert graph.edges[(1,), (2,)]['created'] == 3
+    assert graph.edges[(1,), (2,)]['updated'] == 4
+
+
+def test_networkx_builder__build__timestamp_none():
+    # act
+    graph = graphinate.builders.NetworkxBuilder(_repeating_elements_graph_model()).build(
+        timestamp=graphinate.Timestamp.NONE)
+
+    # assert
+    assert all('created' not in d and 'updated' not in d for _, d in graph.nodes(data=True))
+    assert all('created' not in d and 'updated' not in d for *_, d in graph.edges(data=True))
+    assert 'created' in graph.graph
+
+
+@pytest.mark.asyncio
+async def test_networkx_builder__abuild__timestamp_none():
+    # act
+    graph = await graphinate.builders.NetworkxBuilder(_repeating_elements_graph_model()).abuild(
+        timestamp=graphinate.Timestamp.NONE)
+
+    # assert
+    assert all('created' not in d for _, d in graph.nodes(data=True))
+
+
+def test_networkx_builder__build__invalid_timestamp():
+    # act & assert
+    with pytest.raises(ValueError, match='timestamp'):
+        graphinate.builders.NetworkxBuilder(_repeating_elements_graph_model()).build(timestamp='now')
+
+
+@pytest.fixture
+def debug_messages():
+    messages = []
+    handler_id = logger.add(lambda m: messages.append(m.record['message']), level='DEBUG')
+    yield messages
+    logger.remove(handler_id)
+
+
+@pytest.mark.parametrize('trace', [False, True])
+def test_networkx_builder__build__trace(trace, debug_messages):
+    # act
+    graphinate.builders.NetworkxBuilder(_repeating_elements_graph_model()).build(trace=trace)
+
+    # assert
+    per_element = [m for m in debug_messages if m.startswith(('Adding node', 'Updating node', 'Adding edge'))]
+    assert len(per_element) == (5 if trace else 0)
+    assert 'Populated nodes. Model: node, Added: 2, Updated: 1' in debug_messages
+    assert 'Populated edges. Model: edge, Added: 1, Updated: 1' in debug_messages
+
+
+@pytest.mark.parametrize('graph_type', list(graphinate.enums.GraphType))
+def test_networkx_builder__refresh(graph_type):
+    # arrange
+    items = [1, 2, 3]
+    graph_model = GraphModel(name='Refresh')
+
+    @graph_model.node()
+    def node():
+        yield from items
+
+    @graph_model.edge()
+    def edge():
+        yield from ({'source': s, 'target': t} for s, t in itertools.pairwise(items))
+
+    builder = graphinate.builders.NetworkxBuilder(graph_model, graph_type)
+    graph = builder.build()
+    created = graph.nodes[(2,)]['created']
+    items[:] = [2, 3, 4]
+
+    # act
+    refreshed = builder.refresh()
+
+    # assert
+    expected = graphinate.builders.NetworkxBuilder(graph_model, graph_type).build()
+    assert refreshed is graph
+    assert set(refreshed.nodes) == set(expected.nodes)
+    assert set(refreshed.edges) == set(expected.edges)
+    assert refreshed.nodes[(2,)]['created'] == created
+    assert refreshed.graph['node_types'] == expected.graph['node_types']
+
+
+def test_networkx_builder__refresh__updated_value():
+    # arrange
+    values = {'a': 1}
+    graph_model = GraphModel(name='Refresh')
+
+    @graph_model.node(key=lambda k: k, value=lambda k: values[k])
+    def node():
+        yield from values
+
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+    graph = builder.build(timestamp=graphinate.Timestamp.COUNTER)
+    values['a'] = 2
+
+    # act
+    builder.refresh()
+
+    # assert
+    assert graph.nodes[('a',)]['value'] == [2]
+    assert graph.nodes[('a',)]['created'] == 0
+
+
+def test_networkx_builder__refresh__before_build():
+    # arrange
+    graph_model, _ = _blocking_tree_graph_model()
+
+    # act
+    graph = graphinate.builders.NetworkxBuilder(graph_model).refresh()
+
+    # assert
+    assert graph.graph['node_types'] == {'parent': 4, 'child': 10, 'leaf': 16}
+
+
+@pytest.mark.asyncio
+async def test_networkx_builder__arefresh():
+    # arrange
+    items = [1, 2, 3]
+    graph_model = GraphModel(name='Refresh')
+
+    @graph_model.node()
+    async def node():
+        for item in items:
+            yield item
+
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+    graph = await builder.abuild(timestamp=graphinate.Timestamp.COUNTER)
+    items[:] = [2, 3, 4]
+
+    # act
+    refreshed = await builder.arefresh()
+
+    # assert
+    assert refreshed is graph
+    assert list(refreshed.nodes) == [(2,), (3,), (4,)]
+    assert refreshed.nodes[(2,)]['created'] == 1
+
+
+@pytest.mark.asyncio
+async def test_networkx_builder__abuild__sync_generators_in_worker_threads():
+    # arrange
+    threads = set()
+    graph_model = GraphModel(name='Threads')
+
+    @graph_model.node()
+    def node():
+        threads.add(threading.current_thread())
+        yield from range(3)
+
+    # act
+    graph = await graphinate.builders.NetworkxBuilder(graph_model).abuild()
+
+    # assert
+    assert graph.order() == 3
+    assert threading.main_thread() not in threads
+
+
+def _versioned_graph_model():
+    data = {'a': ['a1', 'a2'], 'b': ['b1']}
+    versions = {'parents': 0, 'a': 0, 'b': 0}
+    calls = Counter()
+    graph_model = GraphModel(name='Versioned')
+
+    @graph_model.node(version=lambda: versions['parents'])
+    def parent():
+        calls['parent'] += 1
+        yield from list(data)
+
+    @graph_model.node(parent_type='parent', unique=False, version=lambda parent_id: versions[parent_id])
+    def child(parent_id):
+        calls[parent_id] += 1
+        yield from data[parent_id]
+
+    @graph_model.edge()
+    def link():
+        calls['link'] += 1
+        yield {'source': 'a', 'target': 'b'}
+
+    return graph_model, data, versions, calls
+
+
+@pytest.mark.parametrize('max_workers', [None, 2])
+@pytest.mark.parametrize('graph_type', [GraphType.Graph, GraphType.MultiGraph])
+def test_networkx_builder__refresh__versioned_generators(graph_type, max_workers):
+    # arrange
+    graph_model, data, versions, calls = _versioned_graph_model()
+    builder = graphinate.builders.NetworkxBuilder(graph_model, graph_type)
+    graph = builder.build(max_workers=max_workers)
+    data['a'] = ['a1', 'a3']
+    data['b'] = ['b2']  # unchanged version, so not seen
+    versions['a'] += 1
+    calls.clear()
+
+    # act
+    refreshed = builder.refresh()
+
+    # assert
+    assert refreshed is graph
+    assert calls == {'a': 1, 'link': 1}
+    assert set(refreshed.nodes) == {('a',), ('b',), ('a', 'a1'), ('a', 'a3'), ('b', 'b1')}
+    assert {frozenset(e[:2]) for e in refreshed.edges} == {frozenset(e) for e in [
+        (('a',), ('b',)), (('a',), ('a', 'a1')), (('a',), ('a', 'a3')), (('b',), ('b', 'b1'))]}
+    assert refreshed.nodes[('a', 'a3')]['value'] == ['a3']
+
+
+def test_networkx_builder__refresh__versioned_parent_removed():
+    # arrange
+    graph_model, data, versions, calls = _versioned_graph_model()
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+    graph = builder.build()
+    del data['a']
+    versions['parents'] += 1
+    calls.clear()
+
+    # act
+    builder.refresh()
+
+    # assert
+    assert calls == {'parent': 1, 'link': 1}
+    expected = graphinate.builders.NetworkxBuilder(graph_model).build()
+    assert set(graph.nodes) == {('a',), ('b',), ('b', 'b1')}  # ('a',) is an endpoint of the link edge
+    assert graph.nodes[('a',)].keys() - {'created'} == expected.nodes[('a',)].keys()
+    assert graph.nodes[('a',)]['value'] == expected.nodes[('a',)]['value']
+
+
+def test_networkx_builder__refresh__versioned_patches_changed_elements(monkeypatch):
+    # arrange
+    graph_model, _, versions, _ = _versioned_graph_model()
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+    builder.build()
+    versions['b'] += 1
+    patched = []
+    patch_attributes = graphinate.builders.NetworkxBuilder._patch_attributes
+    monkeypatch.setattr(graphinate.builders.NetworkxBuilder, '_patch_attributes',
+                        staticmethod(lambda a, n: patched.append(a) or patch_attributes(a, n)))
+
+    # act
+    builder.refresh()
+
+    # assert
+    # the 'b' child node, its parent node and their edge, and the unversioned link edge and its other node
+    assert len(patched) == 5
+
+
+def test_networkx_builder__build__versioned_generators_called():
+    # arrange
+    graph_model, _, _, calls = _versioned_graph_model()
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+    builder.build()
+    calls.clear()
+
+    # act
+    builder.build()
+
+    # assert
+    assert calls == {'parent': 1, 'a': 1, 'b': 1, 'link': 1}
+
+
+def test_networkx_builder__refresh__failed():
+    # arrange
+    graph_model, data, versions, calls = _versioned_graph_model()
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+    graph = builder.build()
+    versions['a'] = None
+    data['a'] = None  # not iterable
+    calls.clear()
+
+    # act
+    with pytest.raises(TypeError):
+        builder.refresh()
+    data['a'] = ['a1', 'a2']
+    builder.refresh()
+
+    # assert
+    assert builder._graph is graph
+    assert calls == {'a': 2, 'link': 1}
+
+
+@pytest.mark.asyncio
+async def test_networkx_builder__arefresh__versioned_generators():
+    # arrange
+    items = [1, 2]
+    version = {'value': 0}
+    calls = Counter()
+    graph_model = GraphModel(name='Versioned')
+
+    async def item_version():
+        return version['value']
+
+    @graph_model.node(version=item_version)
+    async def item():
+        calls['item'] += 1
+        for i in items:
+            yield i
+
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+    graph = await builder.abuild()
+    items.append(3)
+
+    # act
+    await builder.arefresh()
+    unchanged = list(graph.nodes)
+    version['value'] += 1
+    await builder.arefresh()
+
+    # assert
+    assert unchanged == [(1,), (2,)]
+    assert list(graph.nodes) == [(1,), (2,), (3,)]
+    assert calls == {'item': 2}
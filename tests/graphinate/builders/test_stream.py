@@ -0,0 +1,135 @@
+import networkx as nx
+import pytest
+
+import graphinate
+from graphinate import GraphType, Multiplicity, Timestamp
+from graphinate.builders import NetworkxBuilder, StreamBuilder
+from graphinate.builders.stream import GraphDeltaType
+
+
+def _replay(deltas, graph: nx.Graph) -> nx.Graph:
+    """A minimal sink that applies graph deltas to a NetworkX graph."""
+    for delta in deltas:
+        match delta.type:
+            case GraphDeltaType.NODE_ADDED:
+                graph.add_node(delta.id, **delta.attributes)
+            case GraphDeltaType.NODE_UPDATED:
+                data = graph.nodes[delta.id]
+                match delta.multiplicity:
+                    case Multiplicity.ALL:
+                        data['value'].append(delta.attributes['value'])
+                    case Multiplicity.LAST:
+                        data['value'] = [delta.attributes['value']]
+                data['magnitude'] = delta.attributes['magnitude']
+            case GraphDeltaType.EDGE_ADDED:
+                graph.add_edge(*delta.id, **delta.attributes)
+            case GraphDeltaType.EDGE_UPDATED:
+                data = graph.edges[delta.id]
+                data['value'].append(delta.attributes['value'])
+                data['weight'] += delta.attributes['weight']
+    return graph
+
+
+def _tree_graph_model(multiplicity: Multiplicity = Multiplicity.ALL):
+    graph_model = graphinate.model(name='Tree')
+
+    @graph_model.node(multiplicity=multiplicity)
+    def parent():
+        yield from (1, 2, 3, 2)
+
+    @graph_model.node(parent_type='parent', unique=False)
+    def child(parent_id):
+        yield from range(parent_id)
+
+    @graph_model.node(type_='child', key=lambda v: v % 2, multiplicity=multiplicity)
+    def orphan():
+        yield from range(4)
+
+    @graph_model.edge(weight=1.5)
+    def link():
+        yield from ({'source': 1, 'target': 2}, {'source': 2, 'target': 1}, {'source': 2, 'target': 3})
+
+    return graph_model
+
+
+@pytest.mark.parametrize('multiplicity', [Multiplicity.ALL, Multiplicity.FIRST, Multiplicity.LAST])
+@pytest.mark.parametrize('graph_type', list(GraphType))
+def test_stream_builder__same_as_networkx_builder(multiplicity, graph_type):
+    # arrange
+    graph_model = _tree_graph_model(multiplicity)
+    expected = NetworkxBuilder(graph_model, graph_type).build()
+
+    # act
+    deltas = StreamBuilder(graph_model, graph_type).build()
+    actual = _replay(deltas, graph_type.value())
+
+    # assert
+    assert list(actual.nodes(data='value')) == list(expected.nodes(data='value'))
+    assert list(actual.nodes(data='magnitude')) == list(expected.nodes(data='magnitude'))
+    assert list(actual.edges(data='weight', default=1.0)) == list(expected.edges(data='weight'))
+
+
+def test_stream_builder__is_lazy():
+    # arrange
+    consumed = []
+    graph_model = graphinate.model(name='Lazy')
+
+    @graph_model.node()
+    def node():
+        for i in range(3):
+            consumed.append(i)
+            yield i
+
+    # act
+    deltas = StreamBuilder(graph_model).build()
+    first = next(deltas)
+
+    # assert
+    assert first.type is GraphDeltaType.NODE_ADDED
+    assert consumed == [0]
+
+
+def test_stream_builder__index_size():
+    # arrange
+    graph_model = graphinate.model(name='Evicted')
+
+    @graph_model.node()
+    def node():
+        yield from (1, 2, 1)
+
+    # act
+    deltas = list(StreamBuilder(graph_model).build(index_size=1, timestamp=Timestamp.NONE))
+
+    # assert
+    assert [d.type for d in deltas] == [GraphDeltaType.NODE_ADDED] * 3
+    assert all('created' not in d.attributes for d in deltas)
+
+
+@pytest.mark.parametrize('index_size', [0, -1])
+def test_stream_builder__invalid_index_size(index_size):
+    # act & assert
+    with pytest.raises(ValueError, match='index_size'):
+        StreamBuilder(_tree_graph_model()).build(index_size=index_size)
+
+
+def test_stream_builder__async_model():
+    # arrange
+    graph_model = graphinate.model(name='Async')
+
+    @graph_model.node()
+    async def node():
+        yield 1
+
+    # act & assert
+    with pytest.raises(ValueError, match='async'):
+        StreamBuilder(graph_model).build()
+
+
+@pytest.mark.parametrize('method', ['abuild', 'refresh', 'arefresh'])
+def test_stream_builder__no_graph_methods(method):
+    # act
+    builder = StreamBuilder(_tree_graph_model())
+
+    # assert
+    assert not isinstance(builder, NetworkxBuilder)
+    assert not hasattr(builder, method)
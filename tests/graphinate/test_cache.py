@@ -0,0 +1,233 @@
+import pickle
+
+import pytest
+
+import graphinate
+from graphinate import Eviction
+from graphinate.cache import Cache, DirectoryStore, SQLiteStore, open_store
+
+
+@pytest.fixture(params=['sqlite', 'directory'])
+def store_path(request, tmp_path):
+    return tmp_path / 'cache.sqlite' if request.param == 'sqlite' else tmp_path / 'cache'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr('graphinate.cache.time.time', clock)
+    return clock
+
+
+def test_open_store(tmp_path):
+    # arrange
+    store = DirectoryStore(tmp_path)
+
+    # act & assert
+    assert isinstance(open_store(tmp_path / 'cache.db'), SQLiteStore)
+    assert isinstance(open_store(tmp_path / 'cache.sqlite3'), SQLiteStore)
+    assert isinstance(open_store(str(tmp_path / 'cache')), DirectoryStore)
+    assert open_store(store) is store
+
+
+def test_store(store_path):
+    # arrange
+    store = open_store(store_path)
+
+    # act
+    store.set('a', b'123', 10.0)
+    store.set('b', b'4', 20.0)
+    store.set('b', b'45', 30.0)
+    store.delete('c')
+
+    # assert
+    assert store.get('a') == (10.0, b'123')
+    assert store.get('b') == (30.0, b'45')
+    assert store.get('c') is None
+    assert sorted((e.key, e.size, e.stored) for e in store.entries()) == [('a', 3, 10.0), ('b', 2, 30.0)]
+
+    store.clear()
+    assert store.entries() == []
+
+
+def test_cache(store_path):
+    # arrange
+    cache = Cache(store_path)
+    key = Cache.key(('model', 'node'), {'parent_id': 1})
+
+    # act
+    cache.set(key, [{'id': 1}, (2, 'b')])
+
+    # assert
+    assert Cache(store_path).get(key) == [{'id': 1}, (2, 'b')]
+    assert Cache(store_path).get(Cache.key(('model', 'node'), {'parent_id': 2})) is None
+
+
+def test_cache__key():
+    # act & assert
+    assert Cache.key(('m',), {'a_id': 1, 'b_id': 2}) == Cache.key(('m',), {'b_id': 2, 'a_id': 1})
+    assert Cache.key(('m',), {'a_id': 1}) != Cache.key(('m',), {'a_id': '1'})
+    assert Cache.key(('m',), {}) != Cache.key(('n',), {})
+
+
+def test_cache__ttl(store_path, clock):
+    # arrange
+    cache = Cache(store_path, ttl=60)
+    cache.set('key', [1])
+
+    # act
+    clock.now += 60
+    fresh = cache.get('key')
+    clock.now += 1
+    expired = cache.get('key')
+
+    # assert
+    assert fresh == [1]
+    assert expired is None
+    assert cache._store.entries() == []
+
+
+@pytest.mark.parametrize(('eviction', 'expected_keys'), [
+    (Eviction.LEAST_RECENTLY_USED, ['a', 'c']),
+    (Eviction.LEAST_RECENTLY_STORED, ['b', 'c']),
+])
+def test_cache__eviction(store_path, clock, eviction, expected_keys):
+    # arrange
+    entry_size = len(pickle.dumps([1], protocol=pickle.HIGHEST_PROTOCOL))
+    cache = Cache(store_path, size_limit=2 * entry_size, eviction=eviction)
+
+    # act
+    cache.set('a', [1])
+    clock.now += 1
+    cache.set('b', [2])
+    clock.now += 1
+    cache.get('a')
+    clock.now += 1
+    cache.set('c', [3])
+
+    # assert
+    assert sorted(e.key for e in cache._store.entries()) == expected_keys
+
+
+@pytest.mark.parametrize(('kwargs', 'message'), [
+    ({'ttl': 0}, 'Invalid ttl: 0'),
+    ({'size_limit': -1}, 'Invalid size limit: -1'),
+    ({'size_limit': 10, 'eviction': Eviction.NONE}, 'A size limit requires an eviction policy'),
+])
+def test_cache__invalid(tmp_path, kwargs, message):
+    # act & assert
+    with pytest.raises(ValueError, match=message):
+        Cache(tmp_path, **kwargs)
+
+
+def _counted_model(cache, calls):
+    graph_model = graphinate.model(name='Cached')
+
+    @graph_model.node(cache=cache)
+    def parent():
+        calls.append(('parent',))
+        yield from (1, 2)
+
+    @graph_model.node(parent_type='parent', cache=cache)
+    def child(parent_id):
+        calls.append(('child', parent_id))
+        yield from (parent_id * 10, parent_id * 10 + 1)
+
+    @graph_model.edge(cache=cache)
+    def link():
+        calls.append(('link',))
+        yield {'source': 1, 'target': 2}
+
+    return graph_model
+
+
+def test_graph_model__cache(store_path):
+    # arrange
+    calls = []
+    graph_model = _counted_model(Cache(store_path), calls)
+    expected = graphinate.builders.NetworkxBuilder(graph_model).build()
+
+    # act
+    restarted_model = _counted_model(Cache(store_path), calls)  # e.g., after a restart
+    actual = graphinate.builders.NetworkxBuilder(restarted_model).build()
+
+    # assert
+    assert calls == [('parent',), ('child', 1), ('child', 2), ('link',)]
+    assert list(actual.nodes(data='value')) == list(expected.nodes(data='value'))
+    assert list(actual.edges) == list(expected.edges)
+
+
+def test_graph_model__cache_not_recorded_on_failure(tmp_path):
+    # arrange
+    cache = Cache(tmp_path)
+    calls = []
+    graph_model = graphinate.model(name='Failing')
+
+    @graph_model.node(cache=cache)
+    def node():
+        calls.append(1)
+        yield 1
+        if len(calls) == 1:
+            raise ConnectionError
+
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+    with pytest.raises(ConnectionError):
+        builder.build()
+
+    # act
+    graph = builder.build()
+
+    # assert
+    assert len(calls) == 2
+    assert list(graph) == [(1,)]
+
+
+def test_graph_model__cache_keeps_parameters(tmp_path):
+    # arrange
+    graph_model = graphinate.model(name='Parameters')
+
+    @graph_model.node()
+    def parent():
+        yield 1
+
+    # act
+    @graph_model.node(parent_type='parent', cache=Cache(tmp_path))
+    def child(parent_id):
+        yield parent_id
+
+    # assert
+    assert graph_model.node_models[('parent', 'child')][0].parameters == {'parent_id'}
+
+
+@pytest.mark.asyncio
+async def test_graph_model__async_cache(tmp_path):
+    # arrange
+    calls = []
+
+    def async_model():
+        graph_model = graphinate.model(name='Async')
+
+        @graph_model.node(cache=Cache(tmp_path / 'cache.db'))
+        async def node():
+            calls.append(1)
+            for i in range(3):
+                yield i
+
+        return graph_model
+
+    expected = await graphinate.builders.NetworkxBuilder(async_model()).abuild()
+
+    # act
+    actual = await graphinate.builders.NetworkxBuilder(async_model()).abuild()
+
+    # assert
+    assert calls == [1]
+    assert list(actual) == list(expected) == [(0,), (1,), (2,)]
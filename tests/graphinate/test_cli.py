@@ -1,3 +1,5 @@
+import gzip
+import json
 import sys
 from pathlib import Path
 
@@ -24,6 +26,19 @@ def test_save_model(octagonal_graph_model, runner):
         assert result.exit_code == 0
 
 
+def test_save_model__compress(octagonal_graph_model, runner):
+    with runner.isolated_filesystem():
+        # Act
+        result = runner.invoke(cli, ['save', '-m', octagonal_graph_model, '--compress'])
+
+        # Assert
+        assert result.exit_code == 0
+        with gzip.open(f"{octagonal_graph_model.name}.d3_graph.json.gz", mode='rt') as fp:
+            actual = json.load(fp)
+        assert len(actual['nodes']) == 9
+        assert len(actual['links']) == 9
+
+
 def test_save_model_reference(runner):
     # Arrange
     sys.path.append(str(Path(EXAMPLES_MATH).resolve()))
@@ -1,8 +1,9 @@
+import base64
 import math
 
 import pytest
 
-from graphinate import constants, converters
+from graphinate import IdCodec, constants, converters
 
 base_cases = [
     ('1', '1'),
@@ -124,3 +125,193 @@ def test_secure_encoding_decoding(monkeypatch):
     monkeypatch.delenv('GRAPHINATE_SECRET_KEY', raising=False)
     _secret_key.cache_clear()
 
+
+
+@pytest.mark.parametrize('key', [('a',), (1, 'b'), (('a',), ('b',), 0), [1]])
+def test_cursor_encoding(key):
+    # Act
+    actual = converters.decode_cursor(converters.encode_cursor(key))
+
+    # Assert
+    assert actual == key
+
+
+@pytest.mark.parametrize('cursor', ['xx', '', converters.encode('offset:1'), converters.encode(('cursor',)),
+                                    'b2Zmc2V0Oi0x'])
+def test_decode_cursor__invalid(cursor):
+    # Act & Assert
+    with pytest.raises(ValueError, match='Invalid cursor'):
+        converters.decode_cursor(cursor)
+
+
+@pytest.fixture
+def graph_id_cache():
+    converters.clear_graph_id_cache()
+    yield
+    converters.clear_graph_id_cache()
+
+
+def test_graph_id_cache(monkeypatch, graph_id_cache):
+    # Arrange
+    node_id = ('parent', 'child')
+    edge_id = (('a',), ('b',))
+    encoded_node_id = converters.encode_node_id(node_id)
+    encoded_edge_id = converters.encode_edge_id(edge_id)
+
+    def decode(value, encoding='utf-8'):
+        raise AssertionError(f"{value} was decoded")
+
+    monkeypatch.setattr(converters, 'decode', decode)
+
+    # Act
+    actual_node_id = converters.decode_node_id(encoded_node_id)
+    actual_edge_id = converters.decode_edge_id(encoded_edge_id)
+
+    # Assert
+    assert converters.encode_node_id(node_id) == encoded_node_id == converters.encode(node_id)
+    assert actual_node_id == node_id
+    assert actual_edge_id == edge_id
+
+
+def test_graph_id_cache__secret_key(monkeypatch, graph_id_cache):
+    from graphinate._secure import _secret_key
+
+    # Arrange
+    node_id = ('node',)
+    unsigned_id = converters.encode_node_id(node_id)
+
+    # Act
+    monkeypatch.setenv('GRAPHINATE_SECRET_KEY', 'test-secret-key-12345')
+    _secret_key.cache_clear()
+    signed_id = converters.encode_node_id(node_id)
+
+    # Assert
+    try:
+        assert signed_id != unsigned_id
+        assert converters.decode_node_id(signed_id) == node_id
+        with pytest.raises(ValueError, match='Token too short'):
+            converters.decode_node_id(unsigned_id)
+    finally:
+        monkeypatch.delenv('GRAPHINATE_SECRET_KEY', raising=False)
+        _secret_key.cache_clear()
+
+
+def test_graph_id_cache__bounded(monkeypatch, graph_id_cache):
+    # Arrange
+    monkeypatch.setattr(converters, 'GRAPH_ID_CACHE_SIZE', 2)
+
+    # Act
+    encoded_ids = [converters.encode_node_id((i,)) for i in range(3)]
+
+    # Assert
+    assert len(converters._decoded_graph_ids) == 2
+    assert [converters.decode_node_id(encoded_id) for encoded_id in encoded_ids] == [(0,), (1,), (2,)]
+
+
+def test_graph_id_cache__unhashable(graph_id_cache):
+    # Arrange
+    node_id = (['a', 'b'],)
+
+    # Act
+    encoded_node_id = converters.encode_node_id(node_id)
+
+    # Assert
+    assert converters.decode_node_id(encoded_node_id) == node_id
+
+
+id_codec_cases = [
+    ('node',),
+    ('parent', 'child', 'grandchild'),
+    (0, -1, 127, 128, 255, -256, 2 ** 1024, 1.5, -0.0),
+    (True, False, None, b'\x00bytes', ''),
+    ((('a', 1),), (('b', 2),)),
+    ('ünïcødé', '∋'),
+    ((),),
+    ('x' * 300, tuple(range(200))),
+]
+
+
+@pytest.mark.parametrize('codec', list(IdCodec))
+@pytest.mark.parametrize('value', id_codec_cases)
+def test_id_codec(value, codec):
+    # Act
+    encoded = converters.encode(value, codec=codec)
+    actual = converters.decode(encoded)
+
+    # Assert
+    assert actual == value
+    assert [type(v) for v in actual] == [type(v) for v in value]
+
+
+def test_id_codec__binary_is_compact():
+    # Arrange
+    value = ('country_1', 'city_12', 'person_123')
+
+    # Act
+    binary = converters.encode(value, codec=IdCodec.BINARY)
+    text = converters.encode(value, codec=IdCodec.REPR)
+
+    # Assert
+    assert binary != text
+    assert len(binary) <= len(text)
+
+
+@pytest.mark.parametrize('value', [(1j,), (1, ('a', 2 + 3j))])
+def test_id_codec__binary_fallback(value):
+    # Act
+    encoded = converters.encode(value, codec=IdCodec.BINARY)
+
+    # Assert
+    assert encoded == converters.encode(value, codec=IdCodec.REPR)
+    assert converters.decode(encoded) == value
+
+
+def test_id_codec__binary_signed(monkeypatch):
+    from graphinate._secure import _secret_key
+
+    # Arrange
+    value = ('node1', 1)
+    monkeypatch.setenv('GRAPHINATE_SECRET_KEY', 'test-secret-key-12345')
+    _secret_key.cache_clear()
+
+    try:
+        # Act
+        encoded = converters.encode(value, codec=IdCodec.BINARY)
+        raw_bytes = base64.urlsafe_b64decode(encoded.encode('utf-8'))
+        tampered = base64.urlsafe_b64encode(raw_bytes[:-1] + b'\x02').decode('utf-8')
+
+        # Assert
+        assert converters.decode(encoded) == value
+        with pytest.raises(ValueError, match='Invalid Signature'):
+            converters.decode(tampered)
+    finally:
+        monkeypatch.delenv('GRAPHINATE_SECRET_KEY', raising=False)
+        _secret_key.cache_clear()
+
+
+@pytest.mark.parametrize('payload', [b'\x00', b'\x00(\x02N', b'\x00NN', b'\x00s\x05ab', b'\x00s\x80', b'\x00?'])
+def test_id_codec__binary_invalid(payload):
+    # Arrange
+    encoded = base64.urlsafe_b64encode(payload).decode('utf-8')
+
+    # Act & Assert
+    with pytest.raises(ValueError, match='Invalid ID'):
+        converters.decode(encoded)
+
+
+def test_id_codec__environment_variable(monkeypatch, graph_id_cache):
+    # Arrange
+    node_id = ('node',)
+    monkeypatch.setenv('GRAPHINATE_ID_CODEC', 'binary')
+    converters._id_codec.cache_clear()
+
+    try:
+        # Act
+        encoded = converters.encode_node_id(node_id)
+
+        # Assert
+        assert encoded == converters.encode(node_id, codec=IdCodec.BINARY)
+        assert converters.decode_node_id(encoded) == node_id
+    finally:
+        monkeypatch.delenv('GRAPHINATE_ID_CODEC', raising=False)
+        converters._id_codec.cache_clear()
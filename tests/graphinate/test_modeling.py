@@ -1,8 +1,18 @@
+from types import MappingProxyType
+
 import pytest
 
 import graphinate
 import graphinate.typing
-from graphinate.modeling import GraphModel, elements
+from graphinate.modeling import (
+    GraphModel,
+    _getter,
+    abatch_elements,
+    aelements,
+    batch_elements,
+    elements,
+    extractor,
+)
 
 
 def test_graph_model(map_graph_model):
@@ -259,3 +269,252 @@ def test_elements_invalid_identifier_type():
     # Act & Assert
     with pytest.raises(ValueError, match="Invalid Type:"):
         list(elements(data, element_type=bad_type, id="id"))
+
+
+@pytest.mark.parametrize('item', [
+    {'id': 1, 'name': 'a'},
+    MappingProxyType({'id': 1}),
+    (1, 'a'),
+    'id',
+    None,
+])
+@pytest.mark.parametrize('key', [None, 'id', 'missing', len, 1.5, ('id',)], ids=repr)
+def test_getter__same_as_extractor(item, key):
+    # arrange
+    if key is len and item is None:
+        pytest.skip('len(None) raises')
+
+    # act
+    actual = _getter(key)(item)
+
+    # assert
+    assert actual == extractor(item, key)
+
+
+def test_elements_callable_element_type__class_per_type():
+    # Arrange
+    calls = []
+
+    def type_extractor(item):
+        calls.append(item)
+        return 'Alpha' if item % 2 else 'Beta'
+
+    # Act
+    result = list(elements(range(6), element_type=type_extractor, key=None, value=str))
+
+    # Assert
+    assert len(calls) == 6
+    assert len({r.__class__ for r in result}) == 2
+    assert [r.value for r in result] == ['0', '1', '2', '3', '4', '5']
+    assert result[1].__class__ is result[3].__class__
+
+
+async def _async_items(items):
+    for item in items:
+        yield item
+
+
+async def _awaitable_items(items):
+    return _async_items(items)
+
+
+@pytest.mark.parametrize('source', [
+    pytest.param(lambda data: data, id='iterable'),
+    pytest.param(_async_items, id='async_iterable'),
+    pytest.param(_awaitable_items, id='awaitable'),
+])
+@pytest.mark.asyncio
+async def test_aelements(source):
+    # Arrange
+    data = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+    # Act
+    result = [e async for e in aelements(source(data), element_type="Item", id="id", name="name")]
+
+    # Assert
+    assert [(e.id, e.name) for e in result] == [(1, "a"), (2, "b")]
+    assert all(e.__class__.__name__ == "Item" for e in result)
+
+
+BATCH_ROWS = [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}]
+
+
+def _numpy_batch(rows):
+    np = pytest.importorskip('numpy')
+    return np.array([(r['id'], r['name']) for r in rows], dtype=[('id', 'i8'), ('name', 'U8')])
+
+
+def _pandas_batch(rows):
+    return pytest.importorskip('pandas').DataFrame(rows)
+
+
+def _polars_batch(rows):
+    return pytest.importorskip('polars').DataFrame(rows)
+
+
+BATCH_TYPES = [
+    pytest.param(list, id='list'),
+    pytest.param(_numpy_batch, id='numpy'),
+    pytest.param(_pandas_batch, id='pandas'),
+    pytest.param(_polars_batch, id='polars'),
+]
+
+
+@pytest.mark.parametrize('batch_type', BATCH_TYPES)
+def test_batch_elements(batch_type):
+    # Arrange
+    batches = [batch_type(BATCH_ROWS), batch_type(BATCH_ROWS[:1])]
+
+    # Act
+    result = list(batch_elements(batches, element_type='Item', id='id', name='name', row=None, weight=1.5))
+
+    # Assert
+    assert [tuple(e) for e in result] == [
+        (1, 'a', {'id': 1, 'name': 'a'}, 1.5),
+        (2, 'b', {'id': 2, 'name': 'b'}, 1.5),
+        (1, 'a', {'id': 1, 'name': 'a'}, 1.5),
+    ]
+    assert all(e.__class__.__name__ == 'Item' for e in result)
+    assert all(type(e.id) is int for e in result)
+
+
+@pytest.mark.parametrize('batch_type', BATCH_TYPES[1:])
+def test_batch_elements__callable_columns(batch_type):
+    # Arrange
+    batch = batch_type(BATCH_ROWS)
+
+    def type_column(b):
+        return ['Odd' if i % 2 else 'Even' for i in b['id']]
+
+    # Act
+    result = list(batch_elements([batch], element_type=type_column, id='id', double=lambda b: b['id'] * 2))
+
+    # Assert
+    assert [(e.__class__.__name__, e.id, e.double) for e in result] == [('Odd', 1, 2), ('Even', 2, 4)]
+
+
+def test_batch_elements__invalid_column_length():
+    # Act & Assert
+    with pytest.raises(ValueError, match='Invalid column length: name has 1 values, but the batch has 2'):
+        list(batch_elements([BATCH_ROWS], element_type='Item', id='id', name=lambda b: ['a']))
+
+
+@pytest.mark.parametrize('batch_type', BATCH_TYPES)
+def test_batch_elements__missing_column(batch_type):
+    # Arrange
+    batches = [batch_type(BATCH_ROWS)]
+
+    # Act & Assert
+    with pytest.raises(ValueError, match=r'Invalid column: missing\. A batch of items has no such column\.'):
+        list(batch_elements(batches, element_type='Item', generator='items', id='id', name='missing'))
+
+
+def test_batch_elements__invalid_type():
+    # Act & Assert
+    with pytest.raises(ValueError, match='Invalid Type:'):
+        list(batch_elements([BATCH_ROWS], element_type=lambda b: ['Item', 'not valid!'], id='id'))
+
+
+@pytest.mark.parametrize('source', [
+    pytest.param(lambda data: data, id='iterable'),
+    pytest.param(_async_items, id='async_iterable'),
+    pytest.param(_awaitable_items, id='awaitable'),
+])
+@pytest.mark.asyncio
+async def test_abatch_elements(source):
+    # Act
+    result = [e async for e in abatch_elements(source([BATCH_ROWS, BATCH_ROWS]), element_type='Item', id='id')]
+
+    # Assert
+    assert [e.id for e in result] == [1, 2, 1, 2]
+
+
+@pytest.mark.parametrize('batch_type', BATCH_TYPES)
+def test_graph_model_batch_node(batch_type):
+    # Arrange
+    graph_model = graphinate.model(name='Batches')
+
+    @graph_model.node(key='id', value='name', batch=True)
+    def item():
+        yield batch_type(BATCH_ROWS)
+
+    @graph_model.node(parent_type='item', batch=True, key='id', value='name')
+    def child(item_id):
+        yield [{'id': item_id * 10, 'name': f"child of {item_id}"}]
+
+    # Act
+    graph = graphinate.builders.NetworkxBuilder(graph_model).build()
+
+    # Assert
+    assert dict(graph.nodes(data='value')) == {
+        (1,): ['a'],
+        (2,): ['b'],
+        (10,): ['child of 1'],
+        (20,): ['child of 2'],
+    }
+    assert set(graph.edges) == {((1,), (10,)), ((2,), (20,))}
+
+
+@pytest.mark.parametrize('batch_type', BATCH_TYPES)
+def test_graph_model_batch_node__missing_column(batch_type):
+    # Arrange
+    graph_model = graphinate.model(name='Batches')
+
+    @graph_model.node(key='identifier', batch=True)
+    def item():
+        yield batch_type(BATCH_ROWS)
+
+    builder = graphinate.builders.NetworkxBuilder(graph_model)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match=r'Invalid column: identifier\. A batch of .*\.item has no such column\.'):
+        builder.build()
+
+
+def test_graph_model_is_async():
+    # Arrange
+    sync_model = graphinate.model(name='Sync')
+    async_model = graphinate.model(name='Async')
+
+    @sync_model.node()
+    def sync_node():
+        yield 1
+
+    @async_model.edge()
+    async def async_edge():
+        yield {'source': 1, 'target': 2}
+
+    # Act & Assert
+    assert not sync_model.is_async
+    assert async_model.is_async
+    assert (sync_model + async_model).is_async
+
+
+def test_graph_model_versions():
+    # Arrange
+    node_model = graphinate.model(name='Nodes')
+    edge_model = graphinate.model(name='Edges')
+
+    def version():
+        return 1
+
+    @node_model.node(version=version)
+    def versioned_node():
+        yield 1
+
+    @node_model.node()
+    def unversioned_node():
+        yield 1
+
+    @edge_model.edge(version=version)
+    def versioned_edge():
+        yield {'source': 1, 'target': 2}
+
+    # Act
+    actual_model = node_model + edge_model
+
+    # Assert
+    versioned_node_generator = node_model.node_models[(graphinate.typing.UniverseNode, 'versioned_node')][0].generator
+    versioned_edge_generator = edge_model.edge_generators['versioned_edge'][0]
+    assert dict(node_model.versions) == {versioned_node_generator: version}
+    assert dict(actual_model.versions) == {versioned_node_generator: version, versioned_edge_generator: version}